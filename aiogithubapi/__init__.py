@@ -13,12 +13,14 @@ from .const import (
     GitHubClientKwarg,
     GitHubIssueLockReason,
     GitHubRequestKwarg,
+    GitHubRequestPriority,
     HttpStatusCode,
     Repository,
 )
 from .device import GitHubDeviceAPI
 from .exceptions import (
     GitHubAuthenticationException,
+    GitHubCircuitOpenException,
     GitHubConnectionException,
     GitHubException,
     GitHubGraphQLException,
@@ -0,0 +1,274 @@
+"""
+Conditional response cache for the GitHub API client.
+
+Responses with an ETag are stored in a cache backend, and the next identical
+request is sent with the If-None-Match header. When GitHub answers with
+304 Not Modified (which does not count against the rate limit), the cached
+data is returned instead of raising `GitHubNotModifiedException`.
+
+https://docs.github.com/en/rest/overview/resources-in-the-rest-api#conditional-requests
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+from .models.base import GitHubBase
+
+_T = TypeVar("_T")
+
+
+def cache_key(
+    method: str,
+    url: str,
+    params: Dict[str, Any] | None = None,
+    accept: str | None = None,
+) -> str:
+    """Return the cache key for a request."""
+    query = "&".join(f"{key}={value}" for key, value in sorted((params or {}).items()))
+    return f"{method.upper()} {url}?{query} {accept or ''}"
+
+
+@dataclass
+class GitHubCacheEntry:
+    """A cached response."""
+
+    etag: str
+    data: Any
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class GitHubCacheBackend(GitHubBase, ABC):
+    """
+    Base class for cache backends.
+
+    Subclass this to store cached responses somewhere else than in memory,
+    all methods need to be implemented.
+    """
+
+    @abstractmethod
+    async def async_get(self, key: str) -> GitHubCacheEntry | None:
+        """Return the cached entry for a key, or None if there is no entry."""
+
+    @abstractmethod
+    async def async_set(self, key: str, entry: GitHubCacheEntry) -> None:
+        """Store an entry for a key."""
+
+    @abstractmethod
+    async def async_delete(self, key: str) -> None:
+        """Remove the entry for a key."""
+
+    @abstractmethod
+    async def async_clear(self) -> None:
+        """Remove all entries."""
+
+
+class GitHubMemoryCache(GitHubCacheBackend):
+    """
+    In-memory cache backend.
+
+    **Arguments**:
+
+    `max_entries` (Optional)
+
+    The number of entries to keep, the least recently used entry is evicted
+    when the limit is reached. Defaults to 1024.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialise the in-memory cache."""
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, GitHubCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def async_get(self, key: str) -> GitHubCacheEntry | None:
+        """Return the cached entry for a key, or None if there is no entry."""
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def async_set(self, key: str, entry: GitHubCacheEntry) -> None:
+        """Store an entry for a key."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def async_delete(self, key: str) -> None:
+        """Remove the entry for a key."""
+        self._entries.pop(key, None)
+
+    async def async_clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+class GitHubSQLiteCache(GitHubCacheBackend):
+    """
+    Persistent cache backend stored in a SQLite database.
+
+    Cached entries survive restarts of the process. All database access runs
+    in a dedicated worker thread so the event loop is never blocked.
+
+    **Arguments**:
+
+    `path`
+
+    The path to the database file, it is created if it does not exist.
+
+    `max_bytes` (Optional)
+
+    The maximum size of the stored entries, the least recently used entries
+    are evicted when the limit is exceeded. Defaults to 100 MB.
+    """
+
+    # Number of cache hits whose access time is kept in memory before it is written
+    ACCESS_BATCH_SIZE = 100
+    # Number of entries that are looked up at a time when evicting
+    EVICT_BATCH_SIZE = 32
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int = 100 * 1024 * 1024) -> None:
+        """Initialise the SQLite cache."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aiogithubapi_cache")
+        self._connection: sqlite3.Connection | None = None
+        self._total = 0
+        self._accessed: Dict[str, int] = {}
+
+    async def _async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a function in the worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the database connection, this is only called in the worker thread."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, etag TEXT, data TEXT, headers TEXT, "
+                "size INTEGER, accessed INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+            self._connection.commit()
+            self._total = (
+                self._connection.execute("SELECT SUM(size) FROM entries").fetchone()[0] or 0
+            )
+        return self._connection
+
+    def _size(self, connection: sqlite3.Connection, key: str) -> int:
+        """Return the size of the stored entry for a key, 0 if there is no entry."""
+        row = connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        return 0 if row is None else row[0]
+
+    def _flush_accessed(self, connection: sqlite3.Connection) -> None:
+        """Write the access times of the cache hits since the last flush."""
+        if self._accessed:
+            connection.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _get(self, key: str) -> GitHubCacheEntry | None:
+        connection = self._get_connection()
+        row = connection.execute(
+            "SELECT etag, data, headers FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._accessed[key] = time.time_ns()
+        if len(self._accessed) >= self.ACCESS_BATCH_SIZE:
+            self._flush_accessed(connection)
+            connection.commit()
+        return GitHubCacheEntry(etag=row[0], data=json.loads(row[1]), headers=json.loads(row[2]))
+
+    def _set(self, key: str, entry: GitHubCacheEntry) -> None:
+        data = json.dumps(entry.data)
+        headers = json.dumps(entry.headers)
+        size = len(key) + len(entry.etag) + len(data) + len(headers)
+        if size > self.max_bytes:
+            self.logger.debug("Not caching %s, the entry is larger than the cache", key)
+            return
+        connection = self._get_connection()
+        self._accessed.pop(key, None)
+        self._total += size - self._size(connection, key)
+        connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+            (key, entry.etag, data, headers, size, time.time_ns()),
+        )
+        if self._total > self.max_bytes:
+            self._evict(connection)
+        connection.commit()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Remove the least recently used entries until the cache is within its budget."""
+        self._flush_accessed(connection)
+        while self._total > self.max_bytes:
+            rows = connection.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT ?",
+                (self.EVICT_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                self._total = 0
+                break
+            for evict_key, evict_size in rows:
+                if self._total <= self.max_bytes:
+                    break
+                connection.execute("DELETE FROM entries WHERE key = ?", (evict_key,))
+                self._total -= evict_size
+
+    def _delete(self, key: str) -> None:
+        connection = self._get_connection()
+        self._accessed.pop(key, None)
+        self._total -= self._size(connection, key)
+        connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+        connection.commit()
+
+    def _clear(self) -> None:
+        connection = self._get_connection()
+        self._accessed.clear()
+        self._total = 0
+        connection.execute("DELETE FROM entries")
+        connection.commit()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._flush_accessed(self._connection)
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    async def async_get(self, key: str) -> GitHubCacheEntry | None:
+        """Return the cached entry for a key, or None if there is no entry."""
+        return await self._async_run(self._get, key)
+
+    async def async_set(self, key: str, entry: GitHubCacheEntry) -> None:
+        """Store an entry for a key."""
+        await self._async_run(self._set, key, entry)
+
+    async def async_delete(self, key: str) -> None:
+        """Remove the entry for a key."""
+        await self._async_run(self._delete, key)
+
+    async def async_clear(self) -> None:
+        """Remove all entries."""
+        await self._async_run(self._clear)
+
+    async def async_close(self) -> None:
+        """Close the database and stop the worker thread."""
+        await self._async_run(self._close)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,144 @@
+"""Circuit breaker for groups of endpoints used by the GitHub API client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+from fnmatch import fnmatchcase
+import time
+from typing import Dict, Iterable
+
+from .const import HttpStatusCode
+from .exceptions import GitHubCircuitOpenException
+from .models.base import GitHubBase
+from .routes import route_template
+
+
+class GitHubCircuitState(StrEnum):
+    """States of a circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class GitHubCircuit:
+    """Failure tracking for a group of endpoints."""
+
+    failures: int = 0
+    opened: float | None = None
+    probing: bool = False
+
+
+class GitHubCircuitBreaker(GitHubBase):
+    """
+    Fails requests fast for groups of endpoints that keep failing.
+
+    A circuit opens after `failure_threshold` consecutive failures and
+    requests for the group raise `GitHubCircuitOpenException` without
+    being sent. After `cooldown` seconds a single probe request is let
+    through, the circuit closes if it succeeds and opens again if it fails.
+
+    **Arguments**:
+
+    `failure_threshold` (Optional)
+
+    The number of consecutive failures that opens a circuit, defaults to 5.
+
+    `cooldown` (Optional)
+
+    The number of seconds a circuit stays open before it is probed, defaults to 30.
+
+    `groups` (Optional)
+
+    Shell-style patterns that are matched against the endpoint, example
+    ["/repos/*/git/*"]. Endpoints that match a pattern share a circuit,
+    other endpoints get a circuit for their route template.
+
+    `failure_statuses` (Optional)
+
+    Response statuses that count as failures, defaults to 500, 502, 503 and 504.
+    Connection errors and timeouts always count as failures.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30,
+        *,
+        groups: Iterable[str] | None = None,
+        failure_statuses: Iterable[int] = (
+            HttpStatusCode.INTERNAL_SERVER_ERROR,
+            HttpStatusCode.BAD_GATEWAY,
+            HttpStatusCode.SERVICE_UNAVAILABLE,
+            HttpStatusCode.GATEWAY_TIMEOUT,
+        ),
+    ) -> None:
+        """Initialise the circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.groups = list(groups or [])
+        self.failure_statuses = frozenset(failure_statuses)
+        self._circuits: Dict[str, GitHubCircuit] = {}
+
+    def group(self, endpoint: str) -> str:
+        """Return the group of an endpoint."""
+        for pattern in self.groups:
+            if fnmatchcase(endpoint, pattern):
+                return pattern
+        return route_template(endpoint)
+
+    def circuit(self, group: str) -> GitHubCircuit:
+        """Return the circuit of a group."""
+        if (circuit := self._circuits.get(group)) is None:
+            circuit = self._circuits[group] = GitHubCircuit()
+        return circuit
+
+    def state(self, group: str) -> GitHubCircuitState:
+        """Return the state of the circuit of a group."""
+        if (circuit := self._circuits.get(group)) is None or circuit.opened is None:
+            return GitHubCircuitState.CLOSED
+        if time.monotonic() - circuit.opened < self.cooldown:
+            return GitHubCircuitState.OPEN
+        return GitHubCircuitState.HALF_OPEN
+
+    def before_request(self, endpoint: str) -> str:
+        """Return the group of the endpoint, raises if the circuit does not allow the request."""
+        group = self.group(endpoint)
+        circuit = self.circuit(group)
+        state = self.state(group)
+        if state == GitHubCircuitState.OPEN or (
+            state == GitHubCircuitState.HALF_OPEN and circuit.probing
+        ):
+            raise GitHubCircuitOpenException(
+                f"Circuit for '{group}' is open after {circuit.failures} consecutive failures"
+            )
+        if state == GitHubCircuitState.HALF_OPEN:
+            circuit.probing = True
+        return group
+
+    def record(self, group: str, *, failed: bool) -> None:
+        """Record the outcome of a request."""
+        circuit = self.circuit(group)
+        circuit.probing = False
+        if not failed:
+            if circuit.opened is not None:
+                self.logger.info("Circuit for '%s' is closed", group)
+            circuit.failures = 0
+            circuit.opened = None
+            return
+
+        circuit.failures += 1
+        if circuit.opened is not None or circuit.failures >= self.failure_threshold:
+            if circuit.opened is None:
+                self.logger.warning(
+                    "Circuit for '%s' is open after %s consecutive failures",
+                    group,
+                    circuit.failures,
+                )
+            circuit.opened = time.monotonic()
+
+    def release(self, group: str) -> None:
+        """Release a request that ended without an outcome, like when it was cancelled."""
+        self.circuit(group).probing = False
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+from contextlib import asynccontextmanager, nullcontext
+import copy
+import json
+import os
+import time
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Tuple
 
 import aiohttp
 
+from .cache import GitHubCacheBackend, GitHubCacheEntry, cache_key
+from .circuit import GitHubCircuitBreaker
 from .const import (
+    DEFAULT_CHUNK_SIZE,
     GitHubClientKwarg,
     GitHubRequestKwarg,
+    GitHubRequestPriority,
     HttpContentType,
     HttpMethod,
     HttpStatusCode,
@@ -25,10 +34,19 @@ from .exceptions import (
     GitHubPermissionException,
     GitHubRatelimitException,
 )
+from .hedging import GitHubHedgingPolicy
 from .legacy.client import AIOGitHubAPIClient as LegacyAIOGitHubAPIClient
+from .limiter import GitHubConcurrencyLimiter
 from .models.base import GitHubBase
 from .models.request_data import GitHubBaseRequestDataModel
-from .models.response import GitHubResponseModel
+from .models.response import GitHubResponseHeadersModel, GitHubResponseModel
+from .priority import GitHubPriorityScheduler
+from .ratelimit import GitHubRateLimitScheduler, GitHubTokenPool, GitHubWriteLane
+from .retry import GitHubRetryPolicy
+from .routes import route_template
+from .stats import GitHubClientStats
+from .tracing import GitHubRequestTracer
+from .transport import GitHubCassetteTransport
 
 STATUS_EXCEPTIONS: Dict[HttpStatusCode, GitHubException] = {
     HttpStatusCode.FORBIDDEN: GitHubAuthenticationException,
@@ -45,6 +63,21 @@ MESSAGE_EXCEPTIONS: Dict[str, GitHubException] = {
     "Must have push access to repository": GitHubPermissionException,
 }
 
+WRITE_LANE_METHODS = (HttpMethod.POST, HttpMethod.PATCH, HttpMethod.PUT, HttpMethod.DELETE)
+
+
+def _current_task_cancelling() -> bool:
+    """Return True if the current task is being cancelled."""
+    return (task := asyncio.current_task()) is not None and task.cancelling() > 0
+
+
+def _discard_hedge_loser(task: asyncio.Task) -> None:
+    """Release the response of the request that lost a hedge race."""
+    if task.cancelled():
+        return
+    if task.exception() is None:
+        task.result()[0].release()
+
 
 class AIOGitHubAPIClient(LegacyAIOGitHubAPIClient):
     """Dummy class to not break existing code."""
@@ -81,6 +114,69 @@ class GitHubClient(GitHubBase):
         )
         self._session = session
         self._loop = asyncio.get_running_loop()
+        self._cache: GitHubCacheBackend | None = kwargs.get(GitHubClientKwarg.CACHE)
+        self._coalesce: bool = bool(kwargs.get(GitHubClientKwarg.COALESCE))
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Task[GitHubResponseModel]] = {}
+        self._rate_limit_scheduler: GitHubRateLimitScheduler | None = kwargs.get(
+            GitHubClientKwarg.RATE_LIMIT_SCHEDULER
+        )
+        self._retry_policy: GitHubRetryPolicy | None = kwargs.get(GitHubClientKwarg.RETRY_POLICY)
+        self._write_lane: GitHubWriteLane | None = kwargs.get(GitHubClientKwarg.WRITE_LANE)
+        self._concurrency_limiter: GitHubConcurrencyLimiter | None = kwargs.get(
+            GitHubClientKwarg.CONCURRENCY_LIMITER
+        )
+        self._token_pool: GitHubTokenPool | None = kwargs.get(GitHubClientKwarg.TOKEN_POOL)
+        self._json_decoder: Callable[[bytes], Any] | None = kwargs.get(
+            GitHubClientKwarg.JSON_DECODER
+        )
+        self._request_tracer: GitHubRequestTracer | None = kwargs.get(
+            GitHubClientKwarg.REQUEST_TRACER
+        )
+        self._circuit_breaker: GitHubCircuitBreaker | None = kwargs.get(
+            GitHubClientKwarg.CIRCUIT_BREAKER
+        )
+        self._hedging_policy: GitHubHedgingPolicy | None = kwargs.get(
+            GitHubClientKwarg.HEDGING_POLICY
+        )
+        self._priority_scheduler: GitHubPriorityScheduler | None = kwargs.get(
+            GitHubClientKwarg.PRIORITY_SCHEDULER
+        )
+        self._transport: GitHubCassetteTransport | None = kwargs.get(GitHubClientKwarg.TRANSPORT)
+        self._stats = GitHubClientStats()
+
+    def stats(self) -> GitHubClientStats:
+        """Return a snapshot of the statistics of the requests made by this client."""
+        return self._stats.snapshot()
+
+    def reset_stats(self) -> None:
+        """Reset the statistics of the requests made by this client."""
+        self._stats.reset()
+
+    async def async_warmup(self, connections: int = 1) -> int:
+        """
+        Open connections to the API host ahead of time.
+
+        Every connection is opened with a HEAD request to the base URL that is
+        made at the same time as the others, so each of them needs its own
+        connection which is kept in the pool of the session afterwards.
+        Returns the number of connections that were opened.
+        """
+        url = self._base_request_data.request_url("/")
+
+        async def _connect() -> bool:
+            try:
+                async with self._session.head(
+                    url,
+                    headers=self._base_request_data.headers,
+                    timeout=aiohttp.ClientTimeout(total=self._base_request_data.timeout),
+                ) as result:
+                    await result.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+                self.logger.debug("Could not open a connection to %s - %s", url, exception)
+                return False
+            return True
+
+        return sum(await asyncio.gather(*(_connect() for _ in range(connections))))
 
     async def async_call_api(
         self,
@@ -113,6 +209,228 @@ class GitHubClient(GitHubBase):
         Returns:
         A GitHubResponseModel object representing the API response.
         """
+        request_arguments = self._request_arguments(
+            endpoint,
+            data=data,
+            headers=headers,
+            method=method,
+            params=params,
+            timeout=timeout,
+            **kwargs,
+        )
+        retry_policy = kwargs.get(GitHubRequestKwarg.RETRY_POLICY, self._retry_policy)
+        lazy = bool(kwargs.get(GitHubRequestKwarg.LAZY_DATA))
+        hedge = bool(kwargs.get(GitHubRequestKwarg.HEDGE)) and self._hedging_policy is not None
+        priority = kwargs.get(GitHubRequestKwarg.PRIORITY, GitHubRequestPriority.NORMAL)
+
+        if (
+            self._write_lane is not None
+            and request_arguments["method"].upper() in WRITE_LANE_METHODS
+            and endpoint != "/graphql"
+        ):
+            if self._token_pool is None:
+                token = self._base_request_data.token
+                return await self._async_write(
+                    endpoint, request_arguments, retry_policy, token, lazy=lazy, priority=priority
+                )
+            # The lane is kept per token, so the token is picked before entering it
+            resource = GitHubRateLimitScheduler.resource_for_endpoint(endpoint)
+            token = await self._token_pool.async_acquire(resource)
+            try:
+                return await self._async_write(
+                    endpoint,
+                    request_arguments,
+                    retry_policy,
+                    token,
+                    lazy=lazy,
+                    priority=priority,
+                    pooled=True,
+                )
+            finally:
+                self._token_pool.release(token, resource)
+
+        if not self._coalesce or request_arguments["method"] != "get":
+            return await self._async_request(
+                endpoint,
+                request_arguments,
+                retry_policy,
+                lazy=lazy,
+                hedge=hedge,
+                priority=priority,
+            )
+
+        inflight_key = (
+            request_arguments["url"],
+            tuple(
+                sorted((str(key), str(value)) for key, value in request_arguments["params"].items())
+            ),
+            tuple(sorted(request_arguments["headers"].items())),
+            lazy,
+        )
+        if (task := self._inflight.get(inflight_key)) is None:
+            task = self._loop.create_task(
+                self._async_request(
+                    endpoint,
+                    request_arguments,
+                    retry_policy,
+                    lazy=lazy,
+                    hedge=hedge,
+                    priority=priority,
+                )
+            )
+            task.add_done_callback(lambda done: self._inflight_done(inflight_key, done))
+            self._inflight[inflight_key] = task
+
+        # Each waiter gets its own response object, namespaces replace the data with models.
+        return copy.copy(await asyncio.shield(task))
+
+    async def async_stream_api(
+        self,
+        endpoint: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        headers: Dict[str, Any] | None = None,
+        params: Dict[str, Any] | None = None,
+        timeout: int | None = None,
+        **kwargs: Dict[GitHubRequestKwarg, Any],
+    ) -> AsyncIterator[bytes]:
+        """
+        Makes a GET request to the specified endpoint and yields the response body in chunks.
+
+        Only one chunk is held in memory at a time, use this for large binary
+        responses like repository archives. The timeout applies to connecting
+        and to each read instead of the whole download. Streamed requests are not retried,
+        cached or coalesced.
+
+        **Arguments**:
+
+        -  `endpoint` (Required): The API endpoint to call.
+
+        **Optional arguments**:
+        - `chunk_size`: The maximum size of each chunk in bytes.
+        - `headers`: The headers to include in the request. Can be a dictionary or None.
+        - `params`: The query parameters to include in the request. Can be a dictionary or None.
+        - `timeout`: The maximum amount of time to wait for the connection and for each read, in seconds. Can be an integer or None.
+        """
+        request_arguments = self._request_arguments(
+            endpoint, headers=headers, params=params, **kwargs
+        )
+        # Only the total time of the transfer is unbounded
+        timeout = timeout or self._base_request_data.timeout
+        request_arguments["timeout"] = aiohttp.ClientTimeout(
+            sock_connect=timeout, sock_read=timeout
+        )
+
+        priority = kwargs.get(GitHubRequestKwarg.PRIORITY, GitHubRequestPriority.NORMAL)
+        async with self._async_slot(endpoint, priority):
+            try:
+                result, response = await self._async_send(
+                    endpoint, request_arguments, priority=priority, read_body=False
+                )
+            except BaseException as exception:
+                if isinstance(exception, Exception):
+                    self._stats.record_exception(exception)
+                self._finish_timing(request_arguments)
+                raise
+            received = 0
+            try:
+                if response.status != HttpStatusCode.OK:
+                    await self._async_read_data(endpoint, result, response)
+                    self._raise_for_response(endpoint, response)
+                    raise GitHubException(
+                        f"Unexpected status {response.status} from "
+                        f"'{self._base_request_data.request_url(endpoint)}'"
+                    )
+                try:
+                    async for chunk in result.content.iter_chunked(chunk_size):
+                        received += len(chunk)
+                        yield chunk
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+                    raise GitHubConnectionException(
+                        "Stream exception for "
+                        f"'{self._base_request_data.request_url(endpoint)}' with - {exception}"
+                    ) from exception
+            except Exception as exception:
+                self._stats.record_exception(exception)
+                raise
+            finally:
+                result.release()
+                self._stats.bytes_received += received
+                if (timing := request_arguments.get("trace_request_ctx")) is not None:
+                    timing.body_received(received)
+                self._finish_timing(request_arguments)
+
+    async def async_download_api(
+        self,
+        endpoint: str,
+        destination: str | os.PathLike | BinaryIO,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Stream the response body of the endpoint to a path or a binary file object.
+
+        The file is written in an executor so the event loop is not blocked,
+        a partially written path is removed if the download fails.
+        Takes the same arguments as `async_stream_api`.
+
+        Returns:
+        The number of bytes written.
+        """
+        written = 0
+        if not isinstance(destination, (str, os.PathLike)):
+            async for chunk in self.async_stream_api(endpoint, **kwargs):
+                await self._loop.run_in_executor(None, destination.write, chunk)
+                written += len(chunk)
+            return written
+
+        file = await self._loop.run_in_executor(None, open, destination, "wb")
+        try:
+            async for chunk in self.async_stream_api(endpoint, **kwargs):
+                await self._loop.run_in_executor(None, file.write, chunk)
+                written += len(chunk)
+        except BaseException:
+            await self._loop.run_in_executor(None, file.close)
+            await self._loop.run_in_executor(None, os.remove, destination)
+            raise
+        await self._loop.run_in_executor(None, file.close)
+        return written
+
+    async def _async_write(
+        self,
+        endpoint: str,
+        request_arguments: Dict[str, Any],
+        retry_policy: GitHubRetryPolicy | None,
+        token: str | None,
+        *,
+        lazy: bool = False,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+        pooled: bool = False,
+    ) -> GitHubResponseModel:
+        """Make a mutating request through the write lane of the token."""
+        async with self._write_lane.async_slot(token):
+            response = await self._async_request(
+                endpoint,
+                request_arguments,
+                retry_policy,
+                lazy=lazy,
+                priority=priority,
+                token=token if pooled else None,
+            )
+            self._write_lane.succeeded(token)
+            return response
+
+    def _request_arguments(
+        self,
+        endpoint: str,
+        *,
+        data: Dict[str, Any] | str | None = None,
+        headers: Dict[str, Any] | None = None,
+        method: HttpMethod = HttpMethod.GET,
+        params: Dict[str, Any] | None = None,
+        timeout: int | None = None,
+        **kwargs: Dict[GitHubRequestKwarg, Any],
+    ) -> Dict[str, Any]:
+        """Return the arguments for the session request."""
         request_arguments: Dict[str, Any] = {
             "url": self._base_request_data.request_url(endpoint),
             "method": kwargs.get(GitHubRequestKwarg.METHOD, method).lower(),
@@ -120,7 +438,6 @@ class GitHubClient(GitHubBase):
             or kwargs.get(GitHubRequestKwarg.PARAMS, kwargs.get(GitHubRequestKwarg.QUERY, {})),
             "timeout": timeout or self._base_request_data.timeout,
             "headers": {
-                **(headers or {}),
                 **self._base_request_data.headers,
                 **(headers or {}),
                 **kwargs.get("headers", {}),
@@ -135,49 +452,298 @@ class GitHubClient(GitHubBase):
         else:
             request_arguments["data"] = data
 
+        return request_arguments
+
+    def _inflight_done(self, inflight_key: Tuple[Any, ...], task: asyncio.Task) -> None:
+        """Forget a finished in-flight request."""
+        self._inflight.pop(inflight_key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved in case all waiters were cancelled
+            task.exception()
+
+    async def _async_request(
+        self,
+        endpoint: str,
+        request_arguments: Dict[str, Any],
+        retry_policy: GitHubRetryPolicy | None = None,
+        *,
+        lazy: bool = False,
+        hedge: bool = False,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+        token: str | None = None,
+    ) -> GitHubResponseModel:
+        """
+        Execute the request within the concurrency limits.
+
+        When `token` is set the request is made with that token of the token pool.
+        """
         try:
-            result = await self._session.request(**request_arguments)
-        except (aiohttp.ClientError, asyncio.CancelledError) as exception:
+            if self._priority_scheduler is None and self._concurrency_limiter is None:
+                return await self._async_execute(
+                    endpoint,
+                    request_arguments,
+                    retry_policy,
+                    lazy=lazy,
+                    hedge=hedge,
+                    priority=priority,
+                    token=token,
+                )
+            async with self._async_slot(endpoint, priority):
+                return await self._async_execute(
+                    endpoint,
+                    request_arguments,
+                    retry_policy,
+                    lazy=lazy,
+                    hedge=hedge,
+                    priority=priority,
+                    token=token,
+                )
+        except Exception as exception:
+            self._stats.record_exception(exception)
+            raise
+        finally:
+            self._finish_timing(request_arguments)
+
+    @asynccontextmanager
+    async def _async_slot(
+        self,
+        endpoint: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+    ) -> AsyncIterator[None]:
+        """Hold a slot of the priority scheduler and the concurrency limiter, if set."""
+        async with (
+            self._priority_scheduler.async_slot(priority)
+            if self._priority_scheduler is not None
+            else nullcontext()
+        ):
+            async with (
+                self._concurrency_limiter.async_slot(endpoint)
+                if self._concurrency_limiter is not None
+                else nullcontext()
+            ):
+                yield
+
+    def _finish_timing(self, request_arguments: Dict[str, Any]) -> None:
+        """Pass the timing of the last attempt of the request to the tracer."""
+        if (timing := request_arguments.pop("trace_request_ctx", None)) is not None:
+            self._request_tracer.finish(timing)
+
+    async def _async_execute(
+        self,
+        endpoint: str,
+        request_arguments: Dict[str, Any],
+        retry_policy: GitHubRetryPolicy | None = None,
+        *,
+        lazy: bool = False,
+        hedge: bool = False,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+        token: str | None = None,
+    ) -> GitHubResponseModel:
+        """Execute the request and handle the response."""
+        request_cache_key: str | None = None
+        cache_entry: GitHubCacheEntry | None = None
+        if (
+            self._cache is not None
+            and request_arguments["method"] == "get"
+            and aiohttp.hdrs.IF_NONE_MATCH not in request_arguments["headers"]
+        ):
+            request_cache_key = cache_key(
+                method=request_arguments["method"],
+                url=request_arguments["url"],
+                params=request_arguments["params"],
+                accept=request_arguments["headers"].get(aiohttp.hdrs.ACCEPT),
+            )
+            if (cache_entry := await self._cache.async_get(request_cache_key)) is not None:
+                request_arguments["headers"][aiohttp.hdrs.IF_NONE_MATCH] = cache_entry.etag
+
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                if hedge and request_arguments["method"] == "get":
+                    result, response = await self._async_send_hedged(
+                        endpoint, request_arguments, priority
+                    )
+                else:
+                    result, response = await self._async_send(
+                        endpoint, request_arguments, token, priority
+                    )
+            except GitHubConnectionException as exception:
+                if retry_policy is None or _current_task_cancelling():
+                    raise
+                if (
+                    delay := retry_policy.retry_delay(
+                        method=request_arguments["method"], attempt=attempt, started=started
+                    )
+                ) is None:
+                    raise
+                self.logger.debug("%s, retrying in %.2f seconds", exception, delay)
+            else:
+                if (
+                    retry_policy is None
+                    or (
+                        delay := retry_policy.retry_delay(
+                            method=request_arguments["method"],
+                            attempt=attempt,
+                            started=started,
+                            status=response.status,
+                            headers=response.headers,
+                        )
+                    )
+                    is None
+                ):
+                    break
+                result.release()
+                self.logger.debug(
+                    "Got status %s from '%s', retrying in %.2f seconds",
+                    response.status,
+                    request_arguments["url"],
+                    delay,
+                )
+            self._stats.retries += 1
+            await asyncio.sleep(delay)
+
+        if response.status == HttpStatusCode.NO_CONTENT:
+            return response
+
+        if response.status == HttpStatusCode.NOT_MODIFIED:
+            self._stats.not_modified += 1
+
+        if cache_entry is not None and response.status == HttpStatusCode.NOT_MODIFIED:
+            response.headers = GitHubResponseHeadersModel({**cache_entry.headers, **result.headers})
+            response.data = cache_entry.data
+            return response
+
+        await self._async_read_data(
+            endpoint,
+            result,
+            response,
+            lazy=lazy and request_cache_key is None and endpoint != "/graphql",
+        )
+        if response.data_deferred:
+            return response
+        self._raise_for_response(endpoint, response, token)
+
+        if (
+            request_cache_key is not None
+            and response.status == HttpStatusCode.OK
+            and response.etag
+            and not isinstance(response.data, bytes)
+        ):
+            await self._cache.async_set(
+                request_cache_key,
+                GitHubCacheEntry(
+                    etag=response.etag, data=response.data, headers=dict(result.headers)
+                ),
+            )
+
+        return response
+
+    async def _async_read_body(
+        self,
+        endpoint: str,
+        result: aiohttp.ClientResponse,
+        sent: float,
+    ) -> None:
+        """Read the response body, the body is kept by the response for decoding."""
+        try:
+            body = await result.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
             raise GitHubConnectionException(
-                "Request exception for "
+                "Read exception for "
                 f"'{self._base_request_data.request_url(endpoint)}' with - {exception}"
             ) from exception
+        except Exception as exception:  # pylint: disable=broad-except
+            raise GitHubException(
+                f"Could not handle response data from '{self._base_request_data.request_url(endpoint)}' with - {exception}"
+            )
+        self._stats.bytes_received += len(body)
+        self._stats.network_time.observe(time.monotonic() - sent)
 
-        except asyncio.TimeoutError:
-            raise GitHubConnectionException(
-                f"Timeout of {self._base_request_data.timeout} reached while "
-                f"waiting for {self._base_request_data.request_url(endpoint)}"
-            ) from None
+    async def _async_read_data(
+        self,
+        endpoint: str,
+        result: aiohttp.ClientResponse,
+        response: GitHubResponseModel,
+        *,
+        lazy: bool = False,
+    ) -> None:
+        """Read the response body into the response data."""
+        content_type = response.headers.content_type or ""
+        if content_type in (HttpContentType.BASE_ZIP, HttpContentType.BASE_GZIP):
+            response.data = await result.read()
+            return
 
-        except BaseException as exception:
-            raise GitHubException(
-                "Unexpected exception for "
-                f"'{self._base_request_data.request_url(endpoint)}' with - {exception}"
-            ) from exception
+        if lazy and response.status == HttpStatusCode.OK:
+            body = await result.read()
 
-        response = GitHubResponseModel(result)
-        if response.status == HttpStatusCode.NO_CONTENT:
-            return response
+            def _load() -> Any:
+                with self._stats.decode_time.measure():
+                    return self._decode_body(endpoint, content_type, body)
+
+            response.defer_data(_load)
+            return
 
         try:
-            if HttpContentType.BASE_JSON in (response.headers.content_type or ""):
-                response.data = await result.json(encoding="utf-8")
-            elif (response.headers.content_type or "") in (
-                HttpContentType.BASE_ZIP,
-                HttpContentType.BASE_GZIP,
-            ):
-                response.data = await result.read()
-            else:
-                response.data = await result.text(encoding="utf-8")
+            with self._stats.decode_time.measure():
+                if HttpContentType.BASE_JSON not in content_type:
+                    response.data = await result.text(encoding="utf-8")
+                elif self._json_decoder is not None:
+                    response.data = self._decode_body(endpoint, content_type, await result.read())
+                else:
+                    response.data = await result.json(encoding="utf-8")
+        except GitHubException:
+            raise
         except BaseException as exception:
             raise GitHubException(
                 f"Could not handle response data from '{self._base_request_data.request_url(endpoint)}' with - {exception}"
             )
+
+    def _decode_body(self, endpoint: str, content_type: str, body: bytes) -> Any:
+        """Decode a response body that was read as bytes."""
+        try:
+            if HttpContentType.BASE_JSON not in content_type:
+                return body.decode("utf-8")
+            # Matches aiohttp, an empty body decodes to None
+            if not body.strip():
+                return None
+            return (self._json_decoder or json.loads)(body)
+        except Exception as exception:  # pylint: disable=broad-except
+            raise GitHubException(
+                f"Could not handle response data from '{self._base_request_data.request_url(endpoint)}' with - {exception}"
+            ) from exception
+
+    def _raise_for_response(
+        self,
+        endpoint: str,
+        response: GitHubResponseModel,
+        token: str | None = None,
+    ) -> None:
+        """Raise the matching exception if the response is an error."""
         message = response.data.get("message") if isinstance(response.data, dict) else None
 
+        if (
+            self._write_lane is not None
+            and message is not None
+            and "secondary rate limit" in message
+        ):
+            self._write_lane.secondary_rate_limited(
+                token if token is not None else self._base_request_data.token,
+                (
+                    float(response.headers.retry_after)
+                    if (response.headers.retry_after or "").isdigit()
+                    else None
+                ),
+            )
+
         if message is not None and "rate limit" in message:
             raise GitHubRatelimitException(message)
 
+        if response.status == HttpStatusCode.NOT_MODIFIED:
+            # The headers are current, pagination and rate limit headers can have changed
+            raise GitHubNotModifiedException(message or response.data, headers=response.headers)
+
         if exception := STATUS_EXCEPTIONS.get(response.status):
             raise exception(message or response.data)
 
@@ -194,4 +760,166 @@ class GitHubClient(GitHubBase):
                 ", ".join(entry.get("message") for entry in response.data["errors"])
             )
 
-        return response
+    async def _async_send_hedged(
+        self,
+        endpoint: str,
+        request_arguments: Dict[str, Any],
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+    ) -> Tuple[aiohttp.ClientResponse, GitHubResponseModel]:
+        """Send the request, and a duplicate if it is slower than usual, the first answer wins."""
+        policy = self._hedging_policy
+        started = time.monotonic()
+        primary = self._loop.create_task(
+            self._async_send(endpoint, request_arguments, priority=priority)
+        )
+        hedge: asyncio.Task | None = None
+        winner: asyncio.Task | None = None
+        try:
+            # Without enough latencies there is no delay to hedge after
+            if (delay := policy.delay()) is not None:
+                await asyncio.wait([primary], timeout=delay)
+            if delay is not None and not primary.done() and policy.allow_hedge():
+                hedge_arguments = {
+                    **{
+                        key: value
+                        for key, value in request_arguments.items()
+                        if key != "trace_request_ctx"
+                    },
+                    "headers": {**request_arguments["headers"]},
+                }
+                hedge = self._loop.create_task(
+                    self._async_send(endpoint, hedge_arguments, priority=priority)
+                )
+                self._stats.hedged += 1
+
+            pending = {primary, hedge} - {None}
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next(
+                    (task for task in (primary, hedge) if task in done and not task.exception()),
+                    None,
+                )
+            if winner is None:
+                # Both failed, raise the exception of the original request
+                return primary.result()
+
+            if winner is hedge:
+                # The timing of the request that won is finished with the request
+                self._finish_timing(request_arguments)
+                if (timing := hedge_arguments.pop("trace_request_ctx", None)) is not None:
+                    request_arguments["trace_request_ctx"] = timing
+            elif hedge is not None:
+                self._finish_timing(hedge_arguments)
+            policy.record(time.monotonic() - started, hedged=hedge is not None)
+            return winner.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and task is not winner:
+                    task.add_done_callback(_discard_hedge_loser)
+                    task.cancel()
+
+    async def _async_send(
+        self,
+        endpoint: str,
+        request_arguments: Dict[str, Any],
+        token: str | None = None,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+        *,
+        read_body: bool = True,
+    ) -> Tuple[aiohttp.ClientResponse, GitHubResponseModel]:
+        """Send the request through the circuit breaker."""
+        if self._circuit_breaker is None:
+            return await self._async_send_request(
+                endpoint, request_arguments, token, priority, read_body=read_body
+            )
+
+        group = self._circuit_breaker.before_request(endpoint)
+        try:
+            result, response = await self._async_send_request(
+                endpoint, request_arguments, token, priority, read_body=read_body
+            )
+        except GitHubConnectionException:
+            if _current_task_cancelling():
+                self._circuit_breaker.release(group)
+            else:
+                self._circuit_breaker.record(group, failed=True)
+            raise
+        except BaseException:
+            self._circuit_breaker.release(group)
+            raise
+        self._circuit_breaker.record(
+            group, failed=response.status in self._circuit_breaker.failure_statuses
+        )
+        return result, response
+
+    async def _async_send_request(
+        self,
+        endpoint: str,
+        request_arguments: Dict[str, Any],
+        token: str | None = None,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+        *,
+        read_body: bool = True,
+    ) -> Tuple[aiohttp.ClientResponse, GitHubResponseModel]:
+        """
+        Send the request, with `token` of the token pool if set, else with the one it picks.
+
+        The body is read unless `read_body` is False, so a connection that drops
+        while it is read fails the request like one that drops before the response.
+        """
+        resource = GitHubRateLimitScheduler.resource_for_endpoint(endpoint)
+        if self._rate_limit_scheduler is not None:
+            await self._rate_limit_scheduler.async_acquire(resource, priority)
+
+        acquired: str | None = None
+        try:
+            if self._token_pool is not None:
+                if token is None:
+                    token = acquired = await self._token_pool.async_acquire(resource)
+                request_arguments["headers"][aiohttp.hdrs.AUTHORIZATION] = f"token {token}"
+            if self._request_tracer is not None:
+                # A new timing for every attempt, the previous one is finished.
+                self._finish_timing(request_arguments)
+                request_arguments["trace_request_ctx"] = self._request_tracer.start(
+                    request_arguments["method"], request_arguments["url"], route_template(endpoint)
+                )
+            # Started after the waits for budget, so only the network time is measured
+            sent = time.monotonic()
+            if self._transport is None:
+                result = await self._session.request(**request_arguments)
+            else:
+                result = await self._transport.async_request(self._session, request_arguments)
+        except (aiohttp.ClientError, asyncio.CancelledError) as exception:
+            raise GitHubConnectionException(
+                "Request exception for "
+                f"'{self._base_request_data.request_url(endpoint)}' with - {exception}"
+            ) from exception
+
+        except asyncio.TimeoutError:
+            raise GitHubConnectionException(
+                f"Timeout of {self._base_request_data.timeout} reached while "
+                f"waiting for {self._base_request_data.request_url(endpoint)}"
+            ) from None
+
+        except BaseException as exception:
+            raise GitHubException(
+                "Unexpected exception for "
+                f"'{self._base_request_data.request_url(endpoint)}' with - {exception}"
+            ) from exception
+
+        finally:
+            if self._rate_limit_scheduler is not None:
+                self._rate_limit_scheduler.release(resource)
+            if acquired is not None:
+                self._token_pool.release(acquired, resource)
+
+        response = GitHubResponseModel(result)
+        response._stats = self._stats  # pylint: disable=protected-access
+        self._stats.record_response(route_template(endpoint), response.status)
+        if self._rate_limit_scheduler is not None:
+            self._rate_limit_scheduler.update(resource, response.headers)
+        if self._token_pool is not None and token is not None:
+            self._token_pool.update(token, resource, response.headers)
+        if read_body:
+            await self._async_read_body(endpoint, result, sent)
+        return result, response
@@ -29,6 +29,8 @@ DEFAULT_USER_AGENT = f"aiogithubapi/{PROJECT_VERSION}"
 HEADER_GITHUB_API_VERSION = "X-GitHub-Api-Version"
 DEFAULT_API_VERSION = "2022-11-28"
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 BASE_API_URL = "https://api.github.com"
 BASE_GITHUB_URL = "https://github.com"
 OAUTH_DEVICE_LOGIN_PATH = "/login/device/code"
@@ -84,12 +86,89 @@ class GitHubClientKwarg(StrEnum):
         Used to set the timeout for all requests. Defaults to 20
     CLIENT_NAME:
         This name will be used as the user agent header.
+    CACHE:
+        A `aiogithubapi.cache.GitHubCacheBackend` instance, when set GET responses
+        with an ETag are cached and revalidated, and cached data is returned
+        when the content is not modified.
+    COALESCE:
+        When set to True, identical GET requests made at the same time share
+        a single request, the result (or exception) is passed to all callers.
+    RATE_LIMIT_SCHEDULER:
+        A `aiogithubapi.ratelimit.GitHubRateLimitScheduler` instance, when set
+        requests are held or paced when the rate limit budget runs low, waiting
+        requests go in order of the PRIORITY request kwarg.
+    RETRY_POLICY:
+        A `aiogithubapi.retry.GitHubRetryPolicy` instance, when set failed
+        requests are retried according to the policy.
+    WRITE_LANE:
+        A `aiogithubapi.ratelimit.GitHubWriteLane` instance, when set mutating
+        requests are made one at a time with a gap between them, and are
+        paused after hitting a secondary rate limit.
+    CONCURRENCY_LIMITER:
+        A `aiogithubapi.limiter.GitHubConcurrencyLimiter` instance, when set
+        the number of requests in flight at the same time is limited.
+    TOKEN_POOL:
+        A `aiogithubapi.ratelimit.GitHubTokenPool` instance, when set every request
+        uses the token from the pool with the most remaining rate limit budget.
+    JSON_DECODER:
+        A callable that takes the raw response body as bytes and returns the
+        decoded JSON, `aiogithubapi.helpers.fast_json_decoder` returns the
+        fastest one that is installed. Defaults to the aiohttp JSON decoding.
+    REQUEST_TRACER:
+        A `aiogithubapi.tracing.GitHubRequestTracer` instance, when set the timing
+        of the phases of each request is passed to the hooks of the tracer.
+        If you pass your own session, add the `trace_config` of the tracer to it.
+    CIRCUIT_BREAKER:
+        A `aiogithubapi.circuit.GitHubCircuitBreaker` instance, when set requests
+        for groups of endpoints that keep failing raise `GitHubCircuitOpenException`
+        without being sent, until a probe request succeeds.
+    HEDGING_POLICY:
+        A `aiogithubapi.hedging.GitHubHedgingPolicy` instance, GET requests made
+        with the HEDGE request kwarg get a duplicate request when they are slow.
+    CONNECTION_LIMIT:
+        The maximum number of open connections, only used when the session is
+        created by `aiogithubapi`. Defaults to 100, 0 means no limit.
+    CONNECTION_LIMIT_PER_HOST:
+        The maximum number of open connections to the same host, only used when
+        the session is created by `aiogithubapi`. Defaults to 0, no limit.
+    KEEPALIVE_TIMEOUT:
+        The number of seconds an idle connection is kept open for reuse, only used
+        when the session is created by `aiogithubapi`. Defaults to 15.
+    DNS_CACHE_TTL:
+        The number of seconds resolved hosts are cached, None caches them forever.
+        Only used when the session is created by `aiogithubapi`. Defaults to 10.
+    PRIORITY_SCHEDULER:
+        A `aiogithubapi.priority.GitHubPriorityScheduler` instance, when set the
+        number of requests in flight is limited and waiting requests are served
+        by the PRIORITY request kwarg, while every priority keeps a minimum share
+        of the requests let through.
+    TRANSPORT:
+        A `aiogithubapi.transport.GitHubCassetteTransport` instance, when set
+        requests and responses are recorded to a cassette, or replayed from
+        it without sending anything.
     """
 
     HEADERS = "headers"
     BASE_URL = "base_url"
     TIMEOUT = "timeout"
     CLIENT_NAME = "client_name"
+    CACHE = "cache"
+    COALESCE = "coalesce"
+    RATE_LIMIT_SCHEDULER = "rate_limit_scheduler"
+    RETRY_POLICY = "retry_policy"
+    WRITE_LANE = "write_lane"
+    CONCURRENCY_LIMITER = "concurrency_limiter"
+    TOKEN_POOL = "token_pool"
+    JSON_DECODER = "json_decoder"
+    REQUEST_TRACER = "request_tracer"
+    CIRCUIT_BREAKER = "circuit_breaker"
+    HEDGING_POLICY = "hedging_policy"
+    CONNECTION_LIMIT = "connection_limit"
+    CONNECTION_LIMIT_PER_HOST = "connection_limit_per_host"
+    KEEPALIVE_TIMEOUT = "keepalive_timeout"
+    DNS_CACHE_TTL = "dns_cache_ttl"
+    PRIORITY_SCHEDULER = "priority_scheduler"
+    TRANSPORT = "transport"
 
 
 class GitHubRequestKwarg(StrEnum):
@@ -99,26 +178,54 @@ class GitHubRequestKwarg(StrEnum):
     ETAG:
         Used to set the IF_NONE_MATCH header, if this is set and the content
         is not modified GitHubNotModifiedException will be raised.
+        Setting this bypasses the client cache for the request.
     HEADERS:
         Used to set the headers of the request.
+    HEDGE:
+        When set to True and the client has a HEDGING_POLICY, a duplicate of this
+        GET request is sent if it is slow, the first answer is used.
+    LAZY_DATA:
+        When set to True, the body of a successful response is only decoded
+        and turned into models the first time `.data` is accessed.
+        Messages in the body of successful responses are then not checked for errors.
+        Ignored for GraphQL requests and requests served by the client cache.
     METHOD:
         Used to set the method of the request. Defaults to GET.
     PARAMS:
         Used to set the params of the request.
+    PRIORITY:
+        A `GitHubRequestPriority` used by the PRIORITY_SCHEDULER and the
+        RATE_LIMIT_SCHEDULER of the client.
+        Defaults to GitHubRequestPriority.NORMAL.
     QUERY:
         Alias for PARAMS.
+    RETRY_POLICY:
+        A `aiogithubapi.retry.GitHubRetryPolicy` instance to use for this request
+        instead of the one of the client, set to None to disable retries.
     SCOPE:
         Only used for github device login to request scopes for the token
     """
 
     ETAG = "etag"
     HEADERS = "headers"
+    HEDGE = "hedge"
+    LAZY_DATA = "lazy_data"
     METHOD = "method"
     PARAMS = "params"
+    PRIORITY = "priority"
     QUERY = "query"
+    RETRY_POLICY = "retry_policy"
     SCOPE = "scope"
 
 
+class GitHubRequestPriority(IntEnum):
+    """Priority of a request, higher priorities are served first."""
+
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+
+
 class HttpStatusCode(IntEnum):
     """HTTP Status codes."""
 
@@ -139,6 +246,7 @@ class HttpStatusCode(IntEnum):
     NOT_FOUND = 404
     TEAPOT = 418
     UNPROCESSABLE_ENTITY = 422
+    TOO_MANY_REQUESTS = 429
     INTERNAL_SERVER_ERROR = 500
     BAD_GATEWAY = 502
     SERVICE_UNAVAILABLE = 503
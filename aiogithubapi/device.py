@@ -23,7 +23,7 @@ from .const import (
     HttpMethod,
 )
 from .exceptions import GitHubAuthenticationException, GitHubException
-from .helpers import random_float
+from .helpers import create_client_session, random_float
 from .legacy.device import AIOGitHubAPIDeviceLogin as LegacyAIOGitHubAPIDeviceLogin
 from .models.base import GitHubBase
 from .models.device_login import GitHubLoginDeviceModel
@@ -73,7 +73,7 @@ class GitHubDeviceAPI(GitHubBase):
         self._expires = None
 
         if session is None:
-            session = aiohttp.ClientSession()
+            session = create_client_session(**kwargs)
             self._close_session = True
 
         self._session = session
@@ -1,5 +1,12 @@
 """Custom exceptions for aiogithubapi."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models.response import GitHubResponseHeadersModel
+
 
 class GitHubException(Exception):
     """
@@ -38,6 +45,15 @@ class GitHubPermissionException(GitHubException):
 class GitHubNotModifiedException(GitHubException):
     """This is raised when the providede ETag matches and the content has not been modified."""
 
+    def __init__(self, *args: Any, headers: GitHubResponseHeadersModel | None = None) -> None:
+        """Initialise the exception, with the headers of the 304 response if there is one."""
+        super().__init__(*args)
+        self.headers = headers
+
 
 class GitHubAuthenticationException(GitHubException):
     """This is raised when we receive an authentication issue."""
+
+
+class GitHubCircuitOpenException(GitHubException):
+    """This is raised when a request is not sent because its circuit breaker is open."""
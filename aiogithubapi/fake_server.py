@@ -0,0 +1,286 @@
+"""In-process stand-in for the GitHub API, for benchmarking and load testing the client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import random
+import time
+from typing import Any, Dict, Mapping
+
+from aiohttp import hdrs, web
+from yarl import URL
+
+from .exceptions import GitHubException
+from .models.base import GitHubBase
+
+DEFAULT_RATE_LIMITS: Dict[str, int] = {"core": 5000, "search": 30, "graphql": 5000}
+RATE_LIMIT_WINDOWS: Dict[str, int] = {"core": 3600, "search": 60, "graphql": 3600}
+POLL_INTERVAL_SUFFIXES = ("/events", "/notifications")
+
+
+@dataclass
+class GitHubFakeRoute:
+    """A response served by the fake server for a path."""
+
+    data: Any
+    status: int = 200
+    headers: Mapping[str, str] | None = None
+
+
+@dataclass
+class GitHubFakeRateLimit:
+    """Rate limit budget of a resource of the fake server."""
+
+    limit: int
+    remaining: int
+    reset: int
+
+    def headers(self, resource: str) -> Dict[str, str]:
+        """Return the rate limit headers for the budget."""
+        return {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset),
+            "X-RateLimit-Used": str(self.limit - self.remaining),
+            "X-RateLimit-Resource": resource,
+        }
+
+
+class GitHubFakeServer(GitHubBase):
+    """
+    A small `aiohttp.web` server that answers like the GitHub API.
+
+    Responses come from routes added with `add_route` or from JSON and text
+    fixtures in a directory, named like the path with "/" replaced by "_",
+    example `repos_octocat_hello-world_issues.json` for
+    `/repos/octocat/hello-world/issues`.
+
+    Lists are paginated with the `page` and `per_page` params and a Link
+    header, every response has a weak ETag and a matching If-None-Match gets
+    a 304 that does not count against the rate limit. Rate limit headers are
+    sent for the core, search and graphql resources, and a 403 is returned
+    when a budget is used up. Events and notifications get an X-Poll-Interval.
+
+    Use it with `async with GitHubFakeServer(...) as server:` and pass
+    `server.url` as the BASE_URL client kwarg.
+
+    **Arguments**:
+
+    `fixtures` (Optional)
+
+    A directory with fixtures to serve.
+
+    `per_page` (Optional)
+
+    The default page size of lists, defaults to 30.
+
+    `rate_limits` (Optional)
+
+    The rate limit budget of the resources, defaults to 5000 for core and
+    graphql per hour, and 30 for search per minute.
+
+    `poll_interval` (Optional)
+
+    The X-Poll-Interval header for events and notifications, defaults to 60.
+
+    `latency` (Optional)
+
+    Seconds every response is delayed, defaults to 0.
+
+    `jitter` (Optional)
+
+    Up to this many seconds are randomly added to the latency, defaults to 0.
+
+    `error_rate` (Optional)
+
+    The share of requests that fail with `error_status`, defaults to 0.
+
+    `error_status` (Optional)
+
+    The status of injected errors, defaults to 502.
+
+    `seed` (Optional)
+
+    Seed for the jitter and the injected errors, to make runs repeatable.
+    """
+
+    def __init__(
+        self,
+        fixtures: str | os.PathLike | None = None,
+        *,
+        per_page: int = 30,
+        rate_limits: Mapping[str, int] | None = None,
+        poll_interval: int = 60,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        error_status: int = 502,
+        seed: int | None = None,
+    ) -> None:
+        """Initialise the fake server."""
+        self.fixtures = fixtures
+        self.per_page = per_page
+        self.poll_interval = poll_interval
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._rate_limits = {
+            resource: GitHubFakeRateLimit(limit, limit, 0)
+            for resource, limit in {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}.items()
+        }
+        self._routes: Dict[str, GitHubFakeRoute] = {}
+        self._fixtures: Dict[str, GitHubFakeRoute | None] = {}
+        self._runner: web.AppRunner | None = None
+        self._url: URL | None = None
+
+        self.app = web.Application()
+        self.app.router.add_route("*", "/{path:.*}", self._handle)
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the running server."""
+        if self._url is None:
+            raise GitHubException("The fake server is not started")
+        return str(self._url)
+
+    def add_route(
+        self,
+        path: str,
+        data: Any,
+        *,
+        status: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Serve data for a path, lists are paginated and strings are sent as text."""
+        self._routes[path] = GitHubFakeRoute(data=data, status=status, headers=headers)
+
+    def rate_limit(self, resource: str = "core") -> GitHubFakeRateLimit:
+        """Return the rate limit budget of a resource."""
+        return self._rate_limits[resource]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start the server and return its base URL, port 0 picks a free port."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self._url = URL.build(scheme="http", host=bound_host, port=bound_port)
+        return self.url
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    async def __aenter__(self) -> GitHubFakeServer:
+        """Async enter."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Async exit."""
+        await self.close()
+
+    def _route(self, path: str) -> GitHubFakeRoute | None:
+        """Return the route for a path, from the added routes or the fixtures."""
+        if (route := self._routes.get(path)) is not None:
+            return route
+        if self.fixtures is None:
+            return None
+        if path not in self._fixtures:
+            name = os.path.join(self.fixtures, path.strip("/").replace("/", "_").lower())
+            self._fixtures[path] = None
+            for extension, loader in ((".json", json.load), (".txt", lambda file: file.read())):
+                if os.path.exists(name + extension):
+                    with open(name + extension, encoding="utf-8") as file:
+                        self._fixtures[path] = GitHubFakeRoute(data=loader(file))
+                    break
+        return self._fixtures[path]
+
+    @staticmethod
+    def _resource(path: str) -> str:
+        """Return the rate limit resource of a path."""
+        if path.startswith("/search/"):
+            return "search"
+        if path == "/graphql":
+            return "graphql"
+        return "core"
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a request."""
+        self.requests += 1
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._random.uniform(0, self.jitter))
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.json_response({"message": "Server Error"}, status=self.error_status)
+
+        resource = self._resource(request.path)
+        rate_limit = self._rate_limits[resource]
+        now = int(time.time())
+        if rate_limit.reset <= now:
+            rate_limit.remaining = rate_limit.limit
+            rate_limit.reset = now + RATE_LIMIT_WINDOWS.get(resource, 3600)
+        headers = rate_limit.headers(resource)
+        if request.path.endswith(POLL_INTERVAL_SUFFIXES):
+            headers["X-Poll-Interval"] = str(self.poll_interval)
+        if rate_limit.remaining == 0:
+            return web.json_response(
+                {"message": f"API rate limit exceeded for {resource}"}, status=403, headers=headers
+            )
+
+        if (route := self._route(request.path)) is None:
+            rate_limit.remaining -= 1
+            headers.update(rate_limit.headers(resource))
+            return web.json_response({"message": "Not Found"}, status=404, headers=headers)
+
+        data = route.data
+        if isinstance(data, list) and request.method == hdrs.METH_GET:
+            data = self._paginate(request, data, headers)
+        if isinstance(data, str):
+            body, content_type = data.encode("utf-8"), "text/plain"
+        else:
+            body, content_type = json.dumps(data).encode("utf-8"), "application/json"
+        headers.update(route.headers or {})
+        headers[hdrs.ETAG] = f'W/"{hashlib.sha1(body).hexdigest()}"'
+
+        if request.headers.get(hdrs.IF_NONE_MATCH) == headers[hdrs.ETAG]:
+            return web.Response(status=304, headers=headers)
+
+        rate_limit.remaining -= 1
+        headers.update(rate_limit.headers(resource))
+        return web.Response(
+            body=body, status=route.status, headers=headers, content_type=content_type
+        )
+
+    def _paginate(self, request: web.Request, items: list, headers: Dict[str, str]) -> list:
+        """Return the requested page of a list and add the Link header for it."""
+        try:
+            page = max(int(request.query.get("page", 1)), 1)
+            per_page = min(max(int(request.query.get("per_page", self.per_page)), 1), 100)
+        except ValueError:
+            page, per_page = 1, self.per_page
+        last = max((len(items) + per_page - 1) // per_page, 1)
+
+        links = []
+        for rel, number in (
+            ("prev", page - 1 if page > 1 else None),
+            ("next", page + 1 if page < last else None),
+            ("last", last if page < last else None),
+            ("first", 1 if page > 1 else None),
+        ):
+            if number is not None:
+                url = request.url.update_query(page=number, per_page=per_page)
+                links.append(f'<{url}>; rel="{rel}"')
+        if links:
+            headers[hdrs.LINK] = ", ".join(links)
+        return items[(page - 1) * per_page : page * per_page]
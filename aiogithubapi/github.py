@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict
 
 import aiohttp
 
 from .client import GitHubClient
 from .const import GitHubClientKwarg, GitHubRequestKwarg, HttpMethod, RepositoryType
+from .helpers import create_client_session
 from .legacy.github import AIOGitHubAPI as LegacyAIOGitHubAPI
 from .models.base import GitHubBase
 from .models.meta import GitHubMetaModel
@@ -20,6 +21,13 @@ from .namespaces.projects import GitHubBaseProjectsNamespace
 from .namespaces.repos import GitHubReposNamespace
 from .namespaces.user import GitHubUserNamespace
 from .namespaces.users import GitHubUsersNamespace
+from .pagination import (
+    DEFAULT_PER_PAGE,
+    GitHubPageCache,
+    GitHubPaginationCursor,
+    GitHubPaginator,
+)
+from .stats import GitHubClientStats
 
 
 class AIOGitHubAPI(LegacyAIOGitHubAPI):
@@ -64,7 +72,7 @@ class GitHub(GitHubBase):
         See the `aiogithubapi.const.GitHubClientKwarg` enum for valid options.
         """
         if session is None:
-            session = aiohttp.ClientSession()
+            session = create_client_session(**kwargs)
             self._close_session = True
 
         if token is None:
@@ -111,6 +119,117 @@ class GitHub(GitHubBase):
         """Property to access the base projects namespace."""
         return self._projects
 
+    def stats(self) -> GitHubClientStats:
+        """
+        Return a snapshot of the statistics of the requests made by this client.
+
+        Returns a `aiogithubapi.stats.GitHubClientStats` object.
+        """
+        return self._client.stats()
+
+    def reset_stats(self) -> None:
+        """Reset the statistics of the requests made by this client."""
+        self._client.reset_stats()
+
+    def paginate(
+        self,
+        method: Callable[..., Awaitable[GitHubResponseModel]],
+        *args: Any,
+        per_page: int = DEFAULT_PER_PAGE,
+        max_items: int | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        prefetch: int = 0,
+        page_cache: GitHubPageCache | None = None,
+        cursor: GitHubPaginationCursor | None = None,
+        **kwargs: Any,
+    ) -> GitHubPaginator:
+        """
+        Iterate over every item of a list endpoint.
+
+        `async for issue in github.paginate(github.repos.issues.list, "octocat/hello-world"):`
+
+        **Arguments**:
+
+        `method` (Required)
+
+        A namespace method that returns a list, example `github.repos.issues.list`.
+
+        `*args` and `**kwargs` (Optional)
+
+        Passed to the method for every page.
+
+        `per_page` (Optional)
+
+        The number of items to request per page, defaults to 100, the maximum.
+
+        `max_items` (Optional)
+
+        Stop after this many items, defaults to all items.
+
+        `concurrency` (Optional)
+
+        When larger than 1 and the first response links to the last page, the
+        remaining pages are requested at the same time, with at most this many
+        in flight. Defaults to 1, one page after the other.
+
+        `ordered` (Optional)
+
+        When pages are requested at the same time, return them in page order,
+        set to False to return them as they arrive. Defaults to True.
+        An unordered walk can not be resumed, it can not be given a `cursor`
+        and its own `cursor` can not be used to resume it.
+
+        `prefetch` (Optional)
+
+        The number of pages to request in the background while the current
+        page is consumed. Defaults to 0, a page is requested when it is needed.
+
+        `page_cache` (Optional)
+
+        A `aiogithubapi.pagination.GitHubPageCache`, pass the same one to every
+        walk of a collection to revalidate the pages with their ETags,
+        unchanged pages come from the cache.
+
+        `cursor` (Optional)
+
+        A `aiogithubapi.pagination.GitHubPaginationCursor` from the `cursor` of
+        an earlier paginator, items are yielded from the first item after it.
+
+        Returns a `aiogithubapi.pagination.GitHubPaginator`, iterate over it
+        for the items or over `.pages()` for the responses.
+        """
+        return GitHubPaginator(
+            method,
+            *args,
+            per_page=per_page,
+            max_items=max_items,
+            concurrency=concurrency,
+            ordered=ordered,
+            prefetch=prefetch,
+            page_cache=page_cache,
+            cursor=cursor,
+            **kwargs,
+        )
+
+    async def warmup(self, connections: int = 1) -> int:
+        """
+        Open connections to the API host ahead of time.
+
+        This avoids the DNS lookup and TLS handshake on the first requests,
+        the connections are kept for the keep-alive timeout of the session.
+
+        **Arguments**:
+
+        `connections` (Optional)
+
+        The number of connections to open, defaults to 1.
+        This is capped by the connection limits of the session.
+
+        Returns the number of connections that were opened.
+        """
+        return await self._client.async_warmup(connections)
+
     async def __aenter__(self) -> GitHub:
         """Async enter."""
         return self
@@ -216,7 +335,7 @@ class GitHub(GitHubBase):
         https://docs.github.com/en/rest/reference/meta#get-github-meta-information
         """
         response = await self._client.async_call_api(endpoint="/meta", **kwargs)
-        response.data = GitHubMetaModel(response.data)
+        response.map_data(GitHubMetaModel)
         return response
 
     async def zen(self, **kwargs: Dict[GitHubRequestKwarg, Any]) -> GitHubResponseModel[str]:
@@ -245,7 +364,7 @@ class GitHub(GitHubBase):
         https://docs.github.com/en/rest/reference/rate-limit#get-rate-limit-status-for-the-authenticated-user
         """
         response = await self._client.async_call_api(endpoint="/rate_limit", **kwargs)
-        response.data = GitHubRateLimitModel(response.data)
+        response.map_data(GitHubRateLimitModel)
         return response
 
     async def graphql(
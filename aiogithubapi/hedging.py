@@ -0,0 +1,79 @@
+"""Hedging of slow GET requests made by the GitHub API client."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Deque
+
+from .exceptions import GitHubException
+from .models.base import GitHubBase
+
+
+class GitHubHedgingPolicy(GitHubBase):
+    """
+    Decides when a duplicate of a slow GET request is sent.
+
+    When a request has not answered within the given percentile of the
+    recent latencies, a duplicate is sent and the first answer is used.
+
+    **Arguments**:
+
+    `percentile` (Optional)
+
+    The percentile of the recent latencies to wait before hedging, defaults to 95.
+
+    `max_ratio` (Optional)
+
+    The maximum share of recent requests that may be hedged, defaults to 0.05.
+
+    `window` (Optional)
+
+    The number of recent requests used for the latency and the ratio, defaults to 200.
+
+    `min_samples` (Optional)
+
+    The number of latencies needed before requests are hedged, defaults to 20.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        max_ratio: float = 0.05,
+        *,
+        window: int = 200,
+        min_samples: int = 20,
+    ) -> None:
+        """Initialise the hedging policy."""
+        if not 0 < percentile <= 100:
+            raise GitHubException("percentile needs to be larger than 0 and at most 100")
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._requests: Deque[bool] = deque(maxlen=window)
+        self._hedged = 0
+
+    @property
+    def hedged_ratio(self) -> float:
+        """Return the share of recent requests that were hedged."""
+        return self._hedged / len(self._requests) if self._requests else 0
+
+    def delay(self) -> float | None:
+        """Return the seconds to wait before hedging, None if there are too few latencies."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)]
+
+    def allow_hedge(self) -> bool:
+        """Return True if another request can be hedged without going over the ratio."""
+        return self._hedged + 1 <= self.max_ratio * (len(self._requests) + 1)
+
+    def record(self, latency: float, *, hedged: bool) -> None:
+        """Record the latency of a request and if it was hedged."""
+        self._latencies.append(latency)
+        if len(self._requests) == self._requests.maxlen and self._requests[0]:
+            self._hedged -= 1
+        self._requests.append(hedged)
+        self._hedged += hedged
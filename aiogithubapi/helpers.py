@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import random
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import aiohttp
 
-from .const import HttpMethod, Repository, RepositoryType
+from .const import GitHubClientKwarg, HttpMethod, Repository, RepositoryType
 from .legacy.helpers import (
     async_call_api as legacy_async_call_api,
     short_message,
@@ -21,6 +22,49 @@ def random_float(minimum: float, maximum: float) -> float:
     return random.uniform(minimum, maximum)
 
 
+def fast_json_decoder() -> Callable[[bytes], Any]:
+    """Return the fastest installed JSON decoder, orjson, msgspec or the json module."""
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec  # pylint: disable=import-outside-toplevel
+
+        return msgspec.json.decode
+    except ImportError:
+        pass
+    return json.loads
+
+
+def create_client_session(**kwargs: Any) -> aiohttp.ClientSession:
+    """
+    Return a new `aiohttp.ClientSession` configured by the client kwargs.
+
+    Connection pool options that are not set keep the aiohttp defaults.
+    """
+    connector_kwargs = {
+        argument: kwargs[kwarg]
+        for kwarg, argument in (
+            (GitHubClientKwarg.CONNECTION_LIMIT, "limit"),
+            (GitHubClientKwarg.CONNECTION_LIMIT_PER_HOST, "limit_per_host"),
+            (GitHubClientKwarg.KEEPALIVE_TIMEOUT, "keepalive_timeout"),
+            (GitHubClientKwarg.DNS_CACHE_TTL, "ttl_dns_cache"),
+        )
+        if kwarg in kwargs
+    }
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(**connector_kwargs),
+        trace_configs=(
+            [tracer.trace_config]
+            if (tracer := kwargs.get(GitHubClientKwarg.REQUEST_TRACER)) is not None
+            else None
+        ),
+    )
+
+
 def repository_full_name(repository: RepositoryType) -> str:
     """Return the repository name."""
     if isinstance(repository, str):
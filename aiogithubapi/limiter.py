@@ -0,0 +1,105 @@
+"""Concurrency limits for requests made by the GitHub API client."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import time
+from typing import AsyncIterator, Dict
+
+from .models.base import GitHubBase
+
+
+@dataclass
+class GitHubConcurrencyLimiterStats:
+    """Statistics of a concurrency limiter."""
+
+    in_flight: int = 0
+    waiting: int = 0
+    acquired: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+
+    @property
+    def average_wait(self) -> float:
+        """Return the average time in seconds requests waited for a slot."""
+        return self.total_wait / self.acquired if self.acquired else 0
+
+
+class GitHubConcurrencyLimiter(GitHubBase):
+    """
+    Limits the number of requests that are in flight at the same time.
+
+    **Arguments**:
+
+    `limit` (Optional)
+
+    The maximum number of requests in flight, defaults to 10.
+    Set to None to only limit the groups.
+
+    `group_limits` (Optional)
+
+    Limits for groups of endpoints, keyed by a shell-style pattern that is
+    matched against the endpoint, example {"/search/*": 2}.
+    A request counts against every group it matches and the global limit.
+    """
+
+    def __init__(
+        self,
+        limit: int | None = 10,
+        *,
+        group_limits: Dict[str, int] | None = None,
+    ) -> None:
+        """Initialise the concurrency limiter."""
+        self.limit = limit
+        self.group_limits = group_limits or {}
+        self._semaphore = asyncio.Semaphore(limit) if limit is not None else None
+        self._group_semaphores = {
+            pattern: asyncio.Semaphore(group_limit)
+            for pattern, group_limit in self.group_limits.items()
+        }
+        self._stats = GitHubConcurrencyLimiterStats()
+
+    @property
+    def stats(self) -> GitHubConcurrencyLimiterStats:
+        """Return the statistics of the limiter."""
+        return self._stats
+
+    def reset_stats(self) -> None:
+        """Reset the wait time statistics."""
+        self._stats.acquired = 0
+        self._stats.total_wait = 0
+        self._stats.max_wait = 0
+
+    @asynccontextmanager
+    async def async_slot(self, endpoint: str) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it while the request is made."""
+        semaphores = [
+            semaphore
+            for pattern, semaphore in self._group_semaphores.items()
+            if fnmatchcase(endpoint, pattern)
+        ]
+        if self._semaphore is not None:
+            semaphores.append(self._semaphore)
+
+        async with AsyncExitStack() as stack:
+            started = time.monotonic()
+            self._stats.waiting += 1
+            try:
+                for semaphore in semaphores:
+                    await stack.enter_async_context(semaphore)
+            finally:
+                self._stats.waiting -= 1
+
+            waited = time.monotonic() - started
+            self._stats.acquired += 1
+            self._stats.total_wait += waited
+            self._stats.max_wait = max(self._stats.max_wait, waited)
+
+            self._stats.in_flight += 1
+            try:
+                yield
+            finally:
+                self._stats.in_flight -= 1
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from logging import Logger
 from typing import Any, Dict
 
 from ..const import LOGGER
 
 
+@lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    """Slugify, the same few keys are seen over and over so the result is cached."""
+    return str(value).replace("-", "_").lower()
+
+
 class GitHubBase:
     """Base class for all GitHub objects."""
 
@@ -16,7 +23,7 @@ class GitHubBase:
     @staticmethod
     def slugify(value: str) -> str:
         """Slugify."""
-        return str(value).replace("-", "_").lower()
+        return _slugify(value)
 
 
 class GitHubDataModelBase(GitHubBase):
@@ -43,19 +50,20 @@ class GitHubDataModelBase(GitHubBase):
     def __post_init__(self):
         """Post init."""
 
+    @staticmethod
+    def _expand_value_if_needed(value: Any) -> Any:
+        """Return models in a value as dicts."""
+        if isinstance(value, GitHubDataModelBase):
+            return value.as_dict
+        if isinstance(value, list):
+            return [GitHubDataModelBase._expand_value_if_needed(v) for v in value]
+        return value
+
     @property
     def as_dict(self) -> Dict[str, Any]:
         """Return attributes as a dict."""
-
-        def expand_value_if_needed(value: Any) -> Any:
-            if isinstance(value, GitHubDataModelBase):
-                return value.as_dict
-            if isinstance(value, list):
-                return [expand_value_if_needed(v) for v in value]
-            return value
-
         return {
-            key: expand_value_if_needed(value)
+            key: self._expand_value_if_needed(value)
             for key, value in self.__dict__.items()
             if not key.startswith("_")
         }
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from aiohttp.hdrs import AUTHORIZATION, USER_AGENT
 
@@ -36,19 +38,19 @@ class GitHubBaseRequestDataModel(GitHubBase):
         """Generate full request url."""
         return f"{self.base_url}{endpoint}"
 
-    @property
+    @cached_property
     def timeout(self) -> int:
         """Return timeout."""
         return self.kwargs.get(GitHubClientKwarg.TIMEOUT) or 20
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         """Return the base url."""
         return self.kwargs.get(GitHubClientKwarg.BASE_URL) or BASE_API_URL
 
-    @property
-    def headers(self) -> Dict[str, str]:
-        """Return base request headers."""
+    @cached_property
+    def headers(self) -> Mapping[str, str]:
+        """Return base request headers, these are only computed once."""
         headers = BASE_API_HEADERS.copy()
         if self.token:
             headers[AUTHORIZATION] = f"token {self.token}"
@@ -58,4 +60,4 @@ class GitHubBaseRequestDataModel(GitHubBase):
             headers[USER_AGENT] = client_name
         if self.api_version is not None:
             headers[HEADER_GITHUB_API_VERSION] = self.api_version
-        return headers
+        return MappingProxyType(headers)
@@ -3,7 +3,8 @@
 # pylint: disable=protected-access
 from __future__ import annotations
 
-from typing import Any, Dict, Generic
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic
 
 from aiohttp.client import ClientResponse
 from yarl import URL
@@ -11,6 +12,11 @@ from yarl import URL
 from ..const import GenericType, HttpStatusCode
 from .base import GitHubDataModelBase
 
+if TYPE_CHECKING:
+    from ..stats import GitHubClientStats
+
+LINK_HEADER_PATTERN = re.compile(r'<([^>]*)>\s*;\s*rel="?([^",]+)"?')
+
 
 class GitHubResponseHeadersModel(GitHubDataModelBase):
     """GitHub response header model."""
@@ -64,24 +70,74 @@ class GitHubResponseModel(GitHubDataModelBase, Generic[GenericType]):
 
     headers: GitHubResponseHeadersModel = None
     status: HttpStatusCode = None
-    data: GenericType | None = None
+    _data: GenericType | None = None
+    _data_loader: Callable[[], GenericType] | None = None
+    _stats: GitHubClientStats | None = None
 
     def __post_init__(self):
         """Post init."""
         self.headers = GitHubResponseHeadersModel(self._raw_data.headers)
         self.status = self._raw_data.status
 
+    @property
+    def data(self) -> GenericType | None:
+        """Return the data of this response, deferred data is decoded on first access."""
+        if self._data_loader is not None:
+            self._data = self._data_loader()
+            self._data_loader = None
+        return self._data
+
+    @data.setter
+    def data(self, value: GenericType | None) -> None:
+        """Set the data of this response."""
+        self._data_loader = None
+        self._data = value
+
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Return attributes as a dict, the data is kept in a private attribute."""
+        return {**super().as_dict, "data": self._expand_value_if_needed(self.data)}
+
+    @property
+    def data_deferred(self) -> bool:
+        """Return True if the data of this response is not decoded yet."""
+        return self._data_loader is not None
+
+    def defer_data(self, loader: Callable[[], GenericType]) -> None:
+        """Set a loader that is used to get the data the first time it is accessed."""
+        self._data_loader = loader
+
+    def map_data(self, func: Callable[[Any], Any]) -> None:
+        """Replace the data with the result of func, this is deferred with the data."""
+        if (loader := self._data_loader) is None:
+            self._data = self._build_data(func, self._data)
+        else:
+            self._data_loader = lambda: self._build_data(func, loader())
+
+    def _build_data(self, func: Callable[[Any], Any], data: Any) -> Any:
+        """Build the data with func, this counts as model time in the client statistics."""
+        if self._stats is None:
+            return func(data)
+        with self._stats.model_time.measure():
+            return func(data)
+
     @property
     def etag(self) -> str | None:
         """Return the ETag for this response."""
         return self.headers.etag
 
+    @property
+    def links(self) -> Dict[str, URL]:
+        """Return the URLs in the Link header of this response, keyed by relation."""
+        if not self.headers.link:
+            return {}
+        return {rel: URL(url) for url, rel in LINK_HEADER_PATTERN.findall(self.headers.link)}
+
     @property
     def pages(self) -> Dict[str, int]:
         """Return the pages for this response."""
         return {
-            key: int(self._raw_data.links[key]["url"].query.get("page"))
-            for key in self._raw_data.links
+            key: int(url.query["page"]) for key, url in self.links.items() if "page" in url.query
         }
 
     @property
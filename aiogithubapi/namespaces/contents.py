@@ -14,8 +14,12 @@ from ..const import GitHubRequestAcceptHeader, GitHubRequestKwarg, RepositoryTyp
 from ..helpers import repository_full_name
 from ..models.contents import GitHubContentsModel
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+CONTENTS_ROUTE = GitHubRoute("/repos/{repository}/contents")
+CONTENTS_PATH_ROUTE = GitHubRoute("/repos/{repository}/contents/{path}")
+
 
 class GitHubContentsNamespace(BaseNamespace):
     """Methods for the contents namespace"""
@@ -49,16 +53,22 @@ class GitHubContentsNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/repos#get-repository-content
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}"
-            f"/contents{f'/{path}' if path else ''}",
+            endpoint=(
+                CONTENTS_PATH_ROUTE.format(repository=repository_full_name(repository), path=path)
+                if path
+                else CONTENTS_ROUTE.format(repository=repository_full_name(repository))
+            ),
             **{
                 GitHubRequestKwarg.HEADERS: {ACCEPT: GitHubRequestAcceptHeader.BASE_JSON.value},
                 **kwargs,
             },
         )
 
-        if isinstance(response.data, list):
-            response.data = [GitHubContentsModel(data) for data in response.data]
-        else:
-            response.data = GitHubContentsModel(response.data)
+        response.map_data(
+            lambda data: (
+                [GitHubContentsModel(item) for item in data]
+                if isinstance(data, list)
+                else GitHubContentsModel(data)
+            )
+        )
         return response
@@ -21,8 +21,11 @@ from ..exceptions import (
 )
 from ..helpers import repository_full_name
 from ..models.events import GitHubEventModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+EVENTS_ROUTE = GitHubRoute("/{space}/{name}/events")
+
 if TYPE_CHECKING:
     from ..client import GitHubClient
 
@@ -88,7 +91,7 @@ class _GitHubEventsBaseNamespace(BaseNamespace):
             while not subscription_task.cancelled():
                 try:
                     response = await self._client.async_call_api(
-                        endpoint=f"/{self._space}/{name}/events",
+                        endpoint=EVENTS_ROUTE.format(space=self._space, name=name),
                         etag=_last_etag,
                         **kwargs,
                     )
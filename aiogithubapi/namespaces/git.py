@@ -11,8 +11,11 @@ from typing import Any, Dict
 from ..const import GitHubRequestKwarg, RepositoryType
 from ..models.git_tree import GitHubGitTreeModel
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+TREE_ROUTE = GitHubRoute("/repos/{repository}/git/trees/{tree_sha}")
+
 
 class GitHubGitNamespace(BaseNamespace):
     """Methods for the git namespace"""
@@ -45,8 +48,8 @@ class GitHubGitNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/git#get-a-tree
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository}/git/trees/{tree_sha}",
+            endpoint=TREE_ROUTE.format(repository=repository, tree_sha=tree_sha),
             **kwargs,
         )
-        response.data = GitHubGitTreeModel(response.data)
+        response.map_data(GitHubGitTreeModel)
         return response
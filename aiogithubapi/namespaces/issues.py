@@ -18,8 +18,15 @@ from ..helpers import repository_full_name
 from ..models.issue import GitHubIssueModel
 from ..models.issue_comment import GitHubIssueCommentModel
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+ISSUES_ROUTE = GitHubRoute("/repos/{repository}/issues")
+ISSUE_ROUTE = GitHubRoute("/repos/{repository}/issues/{issue_number}")
+ISSUE_LOCK_ROUTE = GitHubRoute("/repos/{repository}/issues/{issue_number}/lock")
+ISSUE_COMMENTS_ROUTE = GitHubRoute("/repos/{repository}/issues/{issue_number}/comments")
+ISSUE_COMMENT_ROUTE = GitHubRoute("/repos/{repository}/issues/comments/{comment_id}")
+
 
 class GitHubIssuesNamespace(BaseNamespace):
     """
@@ -53,10 +60,12 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#get-an-issue
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/issues/{issue_number}",
+            endpoint=ISSUE_ROUTE.format(
+                repository=repository_full_name(repository), issue_number=issue_number
+            ),
             **kwargs,
         )
-        response.data = GitHubIssueModel(response.data)
+        response.map_data(GitHubIssueModel)
         return response
 
     async def create(
@@ -81,11 +90,11 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#create-an-issue
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/issues",
+            endpoint=ISSUES_ROUTE.format(repository=repository_full_name(repository)),
             data=data,
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.POST},
         )
-        response.data = GitHubIssueModel(response.data)
+        response.map_data(GitHubIssueModel)
         return response
 
     async def update(
@@ -115,11 +124,13 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#update-an-issue
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/issues/{issue_number}",
+            endpoint=ISSUE_ROUTE.format(
+                repository=repository_full_name(repository), issue_number=issue_number
+            ),
             data=data,
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.PATCH},
         )
-        response.data = GitHubIssueModel(response.data)
+        response.map_data(GitHubIssueModel)
         return response
 
     async def lock(
@@ -153,7 +164,9 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#lock-an-issue
         """
         response = await self._client.async_call_api(
-            endpoint=(f"/repos/{repository_full_name(repository)}/issues/{issue_number}/lock"),
+            endpoint=ISSUE_LOCK_ROUTE.format(
+                repository=repository_full_name(repository), issue_number=issue_number
+            ),
             data={"lock_reason": lock_reason},
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.PUT},
         )
@@ -181,7 +194,9 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#unlock-an-issue
         """
         response = await self._client.async_call_api(
-            endpoint=(f"/repos/{repository_full_name(repository)}/issues/{issue_number}/lock"),
+            endpoint=ISSUE_LOCK_ROUTE.format(
+                repository=repository_full_name(repository), issue_number=issue_number
+            ),
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.DELETE},
         )
         return response
@@ -203,10 +218,10 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#list-repository-issues
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/issues",
+            endpoint=ISSUES_ROUTE.format(repository=repository_full_name(repository)),
             **kwargs,
         )
-        response.data = [GitHubIssueModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubIssueModel(item) for item in items])
         return response
 
     async def get_comment(
@@ -231,12 +246,12 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#list-issue-comments
         """
         response = await self._client.async_call_api(
-            endpoint=(
-                f"/repos/{repository_full_name(repository)}" f"/issues/comments/{comment_id}"
+            endpoint=ISSUE_COMMENT_ROUTE.format(
+                repository=repository_full_name(repository), comment_id=comment_id
             ),
             **kwargs,
         )
-        response.data = GitHubIssueCommentModel(response.data)
+        response.map_data(GitHubIssueCommentModel)
         return response
 
     async def create_comment(
@@ -266,11 +281,13 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#create-an-issue-comment
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/issues/{issue_number}/comments",
+            endpoint=ISSUE_COMMENTS_ROUTE.format(
+                repository=repository_full_name(repository), issue_number=issue_number
+            ),
             data=data,
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.POST},
         )
-        response.data = GitHubIssueCommentModel(response.data)
+        response.map_data(GitHubIssueCommentModel)
         return response
 
     async def update_comment(
@@ -300,13 +317,13 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#update-an-issue-comment
         """
         response = await self._client.async_call_api(
-            endpoint=(
-                f"/repos/{repository_full_name(repository)}" f"/issues/comments/{comment_id}"
+            endpoint=ISSUE_COMMENT_ROUTE.format(
+                repository=repository_full_name(repository), comment_id=comment_id
             ),
             data=data,
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.PATCH},
         )
-        response.data = GitHubIssueCommentModel(response.data)
+        response.map_data(GitHubIssueCommentModel)
         return response
 
     async def delete_comment(
@@ -331,8 +348,8 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#delete-an-issue-comment
         """
         response = await self._client.async_call_api(
-            endpoint=(
-                f"/repos/{repository_full_name(repository)}" f"/issues/comments/{comment_id}"
+            endpoint=ISSUE_COMMENT_ROUTE.format(
+                repository=repository_full_name(repository), comment_id=comment_id
             ),
             **{**kwargs, GitHubRequestKwarg.METHOD: HttpMethod.DELETE},
         )
@@ -360,8 +377,10 @@ class GitHubIssuesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/issues#list-issue-comments
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/issues/{issue_number}/comments",
+            endpoint=ISSUE_COMMENTS_ROUTE.format(
+                repository=repository_full_name(repository), issue_number=issue_number
+            ),
             **kwargs,
         )
-        response.data = [GitHubIssueCommentModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubIssueCommentModel(item) for item in items])
         return response
@@ -55,5 +55,5 @@ class GitHubNotificationsNamespace(BaseNamespace):
             params=request_params,
             **kwargs,
         )
-        response.data = [GitHubNotificationModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubNotificationModel(item) for item in items])
         return response
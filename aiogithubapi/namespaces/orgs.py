@@ -14,9 +14,12 @@ from ..models.organization import (
     GitHubOrganizationModel,
 )
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 from .projects import GitHubOrganizationProjectsNamespace
 
+ORG_ROUTE = GitHubRoute("/orgs/{org}")
+
 
 class GitHubOrgsNamespace(BaseNamespace):
     """Methods for the orgs namespace"""
@@ -43,7 +46,9 @@ class GitHubOrgsNamespace(BaseNamespace):
             endpoint="/organizations",
             **kwargs,
         )
-        response.data = [GitHubOrganizationMinimalModel(org) for org in response.data or []]
+        response.map_data(
+            lambda items: [GitHubOrganizationMinimalModel(item) for item in items or []]
+        )
         return response
 
     async def get(
@@ -63,10 +68,10 @@ class GitHubOrgsNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/orgs#get-an-organization
         """
         response = await self._client.async_call_api(
-            endpoint=f"/orgs/{org}",
+            endpoint=ORG_ROUTE.format(org=org),
             **kwargs,
         )
-        response.data = GitHubOrganizationModel(response.data)
+        response.map_data(GitHubOrganizationModel)
         return response
 
     async def update(
@@ -91,10 +96,10 @@ class GitHubOrgsNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/orgs#update-an-organization
         """
         response = await self._client.async_call_api(
-            endpoint=f"/orgs/{org}",
+            endpoint=ORG_ROUTE.format(org=org),
             data=data,
             method=HttpMethod.PATCH,
             **kwargs,
         )
-        response.data = GitHubOrganizationModel(response.data)
+        response.map_data(GitHubOrganizationModel)
         return response
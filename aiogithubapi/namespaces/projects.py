@@ -13,8 +13,14 @@ from aiogithubapi.helpers import repository_full_name
 from ..const import GitHubRequestKwarg, HttpMethod, RepositoryType
 from ..models.projects import GitHubProjectModel
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+PROJECT_ROUTE = GitHubRoute("/projects/{project_id}")
+ORG_PROJECTS_ROUTE = GitHubRoute("/orgs/{org}/projects")
+REPOSITORY_PROJECTS_ROUTE = GitHubRoute("/repos/{repository}/projects")
+USER_PROJECTS_ROUTE = GitHubRoute("/users/{username}/projects")
+
 
 class _BaseProjectsNamespace(BaseNamespace):
     """Methods for the base projects namespace"""
@@ -26,7 +32,7 @@ class _BaseProjectsNamespace(BaseNamespace):
     ) -> GitHubResponseModel[list[GitHubProjectModel]]:
         """Internal helper"""
         response = await self._client.async_call_api(endpoint=endpoint, **kwargs)
-        response.data = [GitHubProjectModel(project) for project in response.data or []]
+        response.map_data(lambda items: [GitHubProjectModel(item) for item in items or []])
         return response
 
     async def _get(
@@ -36,7 +42,7 @@ class _BaseProjectsNamespace(BaseNamespace):
     ) -> GitHubResponseModel[GitHubProjectModel]:
         """Internal helper"""
         response = await self._client.async_call_api(endpoint=endpoint, **kwargs)
-        response.data = GitHubProjectModel(response.data)
+        response.map_data(GitHubProjectModel)
         return response
 
     async def _update(
@@ -52,7 +58,7 @@ class _BaseProjectsNamespace(BaseNamespace):
             method=HttpMethod.PATCH,
             **kwargs,
         )
-        response.data = GitHubProjectModel(response.data)
+        response.map_data(GitHubProjectModel)
         return response
 
     async def _create(
@@ -68,7 +74,7 @@ class _BaseProjectsNamespace(BaseNamespace):
             method=HttpMethod.POST,
             **kwargs,
         )
-        response.data = GitHubProjectModel(response.data)
+        response.map_data(GitHubProjectModel)
         return response
 
     async def _delete(
@@ -103,7 +109,7 @@ class GitHubBaseProjectsNamespace(_BaseProjectsNamespace):
 
         https://docs.github.com/en/rest/reference/projects#list-organization-projects
         """
-        return await super()._get(endpoint=f"/projects/{project_id}", **kwargs)
+        return await super()._get(endpoint=PROJECT_ROUTE.format(project_id=project_id), **kwargs)
 
     async def update(
         self,
@@ -126,7 +132,9 @@ class GitHubBaseProjectsNamespace(_BaseProjectsNamespace):
 
         https://docs.github.com/en/rest/reference/projects#update-a-project
         """
-        return await super()._update(endpoint=f"/projects/{project_id}", data=data, **kwargs)
+        return await super()._update(
+            endpoint=PROJECT_ROUTE.format(project_id=project_id), data=data, **kwargs
+        )
 
     async def delete(
         self,
@@ -144,7 +152,7 @@ class GitHubBaseProjectsNamespace(_BaseProjectsNamespace):
 
         https://docs.github.com/en/rest/reference/projects#delete-a-project
         """
-        return await super()._delete(endpoint=f"/projects/{project_id}", **kwargs)
+        return await super()._delete(endpoint=PROJECT_ROUTE.format(project_id=project_id), **kwargs)
 
 
 class GitHubOrganizationProjectsNamespace(_BaseProjectsNamespace):
@@ -166,7 +174,7 @@ class GitHubOrganizationProjectsNamespace(_BaseProjectsNamespace):
 
         https://docs.github.com/en/rest/reference/projects#list-organization-projects
         """
-        return await super()._list(endpoint=f"/orgs/{org}/projects", **kwargs)
+        return await super()._list(endpoint=ORG_PROJECTS_ROUTE.format(org=org), **kwargs)
 
     async def create(
         self,
@@ -196,7 +204,7 @@ class GitHubOrganizationProjectsNamespace(_BaseProjectsNamespace):
         https://docs.github.com/en/rest/reference/projects#create-an-organization-project
         """
         return await super()._create(
-            endpoint=f"/orgs/{org}/projects",
+            endpoint=ORG_PROJECTS_ROUTE.format(org=org),
             data={"name": name, "body": body},
             **kwargs,
         )
@@ -222,7 +230,7 @@ class GitHubRepositoryProjectsNamespace(_BaseProjectsNamespace):
         https://docs.github.com/en/rest/reference/projects#list-repository-projects
         """
         return await super()._list(
-            endpoint=f"/repos/{repository_full_name(repository)}/projects",
+            endpoint=REPOSITORY_PROJECTS_ROUTE.format(repository=repository_full_name(repository)),
             **kwargs,
         )
 
@@ -254,7 +262,7 @@ class GitHubRepositoryProjectsNamespace(_BaseProjectsNamespace):
         https://docs.github.com/en/rest/reference/projects#create-an-organization-project
         """
         return await super()._create(
-            endpoint=f"/repos/{repository_full_name(repository)}/projects",
+            endpoint=REPOSITORY_PROJECTS_ROUTE.format(repository=repository_full_name(repository)),
             data={"name": name, "body": body},
             **kwargs,
         )
@@ -279,7 +287,7 @@ class GitHubUsersProjectsNamespace(_BaseProjectsNamespace):
 
         https://docs.github.com/en/rest/reference/projects#list-user-projects
         """
-        return await super()._list(endpoint=f"/users/{username}/projects", **kwargs)
+        return await super()._list(endpoint=USER_PROJECTS_ROUTE.format(username=username), **kwargs)
 
 
 class GitHubUserProjectsNamespace(_BaseProjectsNamespace):
@@ -308,7 +316,7 @@ class GitHubUserProjectsNamespace(_BaseProjectsNamespace):
         https://docs.github.com/en/rest/reference/projects#create-a-user-project
         """
         return await super()._create(
-            endpoint=f"/user/projects",
+            endpoint="/user/projects",
             data={"name": name, "body": body},
             **kwargs,
         )
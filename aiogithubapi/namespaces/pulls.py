@@ -10,8 +10,11 @@ from ..const import GitHubRequestKwarg, RepositoryType
 from ..helpers import repository_full_name
 from ..models.pull_request import GitHubPullRequestModel
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+PULLS_ROUTE = GitHubRoute("/repos/{repository}/pulls")
+
 
 class GitHubPullsNamespace(BaseNamespace):
     """
@@ -39,8 +42,8 @@ class GitHubPullsNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/pulls#list-pull-requests
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/pulls",
+            endpoint=PULLS_ROUTE.format(repository=repository_full_name(repository)),
             **kwargs,
         )
-        response.data = [GitHubPullRequestModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubPullRequestModel(item) for item in items])
         return response
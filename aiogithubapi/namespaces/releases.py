@@ -11,8 +11,12 @@ from typing import Any, Dict, List
 from ..const import GitHubRequestKwarg, RepositoryType
 from ..models.release import GitHubReleaseModel
 from ..models.response import GitHubResponseModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+LATEST_RELEASE_ROUTE = GitHubRoute("/repos/{repository}/releases/latest")
+RELEASES_ROUTE = GitHubRoute("/repos/{repository}/releases")
+
 
 class GitHubReleasesNamespace(BaseNamespace):
     """Methods for the releases namespace"""
@@ -37,10 +41,10 @@ class GitHubReleasesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/repos#list-releases
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository}/releases",
+            endpoint=RELEASES_ROUTE.format(repository=repository),
             **kwargs,
         )
-        response.data = [GitHubReleaseModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubReleaseModel(item) for item in items])
         return response
 
     async def latest(
@@ -62,8 +66,8 @@ class GitHubReleasesNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/repos#get-the-latest-release
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository}/releases/latest",
+            endpoint=LATEST_RELEASE_ROUTE.format(repository=repository),
             **kwargs,
         )
-        response.data = GitHubReleaseModel(response.data)
+        response.map_data(GitHubReleaseModel)
         return response
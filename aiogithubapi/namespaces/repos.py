@@ -6,14 +6,16 @@ https://docs.github.com/en/rest/reference/repos
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import os
+from typing import Any, AsyncIterator, BinaryIO, Dict, List
 
-from ..const import GitHubRequestKwarg, RepositoryType
+from ..const import DEFAULT_CHUNK_SIZE, GitHubRequestKwarg, RepositoryType
 from ..helpers import repository_full_name
 from ..models.commit import GitHubCommitModel
 from ..models.repository import GitHubRepositoryModel
 from ..models.response import GitHubResponseModel
 from ..models.tag import GitHubTagModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 from .contents import GitHubContentsNamespace
 from .events import GitHubEventsReposNamespace
@@ -24,6 +26,13 @@ from .pulls import GitHubPullsNamespace
 from .releases import GitHubReleasesNamespace
 from .traffic import GitHubTrafficNamespace
 
+REPOSITORY_ROUTE = GitHubRoute("/repos/{repository}")
+COMMITS_ROUTE = GitHubRoute("/repos/{repository}/commits")
+TAGS_ROUTE = GitHubRoute("/repos/{repository}/tags")
+TARBALL_ROUTE = GitHubRoute("/repos/{repository}/tarball/{ref}")
+ZIPBALL_ROUTE = GitHubRoute("/repos/{repository}/zipball/{ref}")
+README_ROUTE = GitHubRoute("/repos/{repository}/readme/{dir}")
+
 
 class GitHubReposNamespace(BaseNamespace):
     """Methods for the repos namespace"""
@@ -95,10 +104,10 @@ class GitHubReposNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/repos#get-a-repository
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}",
+            endpoint=REPOSITORY_ROUTE.format(repository=repository_full_name(repository)),
             **kwargs,
         )
-        response.data = GitHubRepositoryModel(response.data)
+        response.map_data(GitHubRepositoryModel)
         return response
 
     async def list_commits(
@@ -154,11 +163,11 @@ class GitHubReposNamespace(BaseNamespace):
             params["until"] = until
 
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/commits",
+            endpoint=COMMITS_ROUTE.format(repository=repository_full_name(repository)),
             params=params,
             **kwargs,
         )
-        response.data = [GitHubCommitModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubCommitModel(item) for item in items])
         return response
 
     async def list_tags(
@@ -178,10 +187,10 @@ class GitHubReposNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/repos#list-repository-tags
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/tags",
+            endpoint=TAGS_ROUTE.format(repository=repository_full_name(repository)),
             **kwargs,
         )
-        response.data = [GitHubTagModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubTagModel(item) for item in items])
         return response
 
     async def tarball(
@@ -208,7 +217,9 @@ class GitHubReposNamespace(BaseNamespace):
         """
 
         return await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/tarball/{ref or ''}",
+            endpoint=TARBALL_ROUTE.format(
+                repository=repository_full_name(repository), ref=ref or ""
+            ),
             **kwargs,
         )
 
@@ -236,7 +247,161 @@ class GitHubReposNamespace(BaseNamespace):
         """
 
         return await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/zipball/{ref or ''}",
+            endpoint=ZIPBALL_ROUTE.format(
+                repository=repository_full_name(repository), ref=ref or ""
+            ),
+            **kwargs,
+        )
+
+    def stream_tarball(
+        self,
+        repository: RepositoryType,
+        *,
+        ref: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Dict[GitHubRequestKwarg, Any],
+    ) -> AsyncIterator[bytes]:
+        """
+         Stream a repository archive (tar) in chunks
+
+         **Arguments**:
+
+         `repository`
+
+         The repository to return the tar from, example "octocat/hello-world"
+
+         `ref`
+
+         The name of the commit/branch/tag. Default: the repository's default branch (usually main)
+
+         `chunk_size`
+
+         The maximum size of each chunk in bytes
+
+        https://docs.github.com/en/rest/reference/repos#download-a-repository-archive-tar
+        """
+        return self._client.async_stream_api(
+            endpoint=TARBALL_ROUTE.format(
+                repository=repository_full_name(repository), ref=ref or ""
+            ),
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    async def download_tarball(
+        self,
+        repository: RepositoryType,
+        destination: str | os.PathLike | BinaryIO,
+        *,
+        ref: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Dict[GitHubRequestKwarg, Any],
+    ) -> int:
+        """
+         Download a repository archive (tar) to a path or a binary file object
+
+         Returns the number of bytes written.
+
+         **Arguments**:
+
+         `repository`
+
+         The repository to return the tar from, example "octocat/hello-world"
+
+         `destination`
+
+         The path or binary file object to write the archive to
+
+         `ref`
+
+         The name of the commit/branch/tag. Default: the repository's default branch (usually main)
+
+         `chunk_size`
+
+         The maximum size of each chunk in bytes
+
+        https://docs.github.com/en/rest/reference/repos#download-a-repository-archive-tar
+        """
+        return await self._client.async_download_api(
+            TARBALL_ROUTE.format(repository=repository_full_name(repository), ref=ref or ""),
+            destination,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    def stream_zipball(
+        self,
+        repository: RepositoryType,
+        *,
+        ref: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Dict[GitHubRequestKwarg, Any],
+    ) -> AsyncIterator[bytes]:
+        """
+         Stream a repository archive (zip) in chunks
+
+         **Arguments**:
+
+         `repository`
+
+         The repository to return the zip from, example "octocat/hello-world"
+
+         `ref`
+
+         The name of the commit/branch/tag. Default: the repository's default branch (usually main)
+
+         `chunk_size`
+
+         The maximum size of each chunk in bytes
+
+        https://docs.github.com/en/rest/reference/repos#download-a-repository-archive-zip
+        """
+        return self._client.async_stream_api(
+            endpoint=ZIPBALL_ROUTE.format(
+                repository=repository_full_name(repository), ref=ref or ""
+            ),
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    async def download_zipball(
+        self,
+        repository: RepositoryType,
+        destination: str | os.PathLike | BinaryIO,
+        *,
+        ref: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Dict[GitHubRequestKwarg, Any],
+    ) -> int:
+        """
+         Download a repository archive (zip) to a path or a binary file object
+
+         Returns the number of bytes written.
+
+         **Arguments**:
+
+         `repository`
+
+         The repository to return the zip from, example "octocat/hello-world"
+
+         `destination`
+
+         The path or binary file object to write the archive to
+
+         `ref`
+
+         The name of the commit/branch/tag. Default: the repository's default branch (usually main)
+
+         `chunk_size`
+
+         The maximum size of each chunk in bytes
+
+        https://docs.github.com/en/rest/reference/repos#download-a-repository-archive-zip
+        """
+        return await self._client.async_download_api(
+            ZIPBALL_ROUTE.format(repository=repository_full_name(repository), ref=ref or ""),
+            destination,
+            chunk_size=chunk_size,
             **kwargs,
         )
 
@@ -264,6 +429,8 @@ class GitHubReposNamespace(BaseNamespace):
         """
 
         return await self._client.async_call_api(
-            endpoint=f"/repos/{repository_full_name(repository)}/readme/{dir or ''}",
+            endpoint=README_ROUTE.format(
+                repository=repository_full_name(repository), dir=dir or ""
+            ),
             **kwargs,
         )
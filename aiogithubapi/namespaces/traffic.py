@@ -12,8 +12,12 @@ from ..const import GitHubRequestKwarg, RepositoryType
 from ..models.clones import GitHubClonesModel
 from ..models.response import GitHubResponseModel
 from ..models.views import GitHubViewsModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 
+CLONES_ROUTE = GitHubRoute("/repos/{repository}/traffic/clones")
+VIEWS_ROUTE = GitHubRoute("/repos/{repository}/traffic/views")
+
 
 class GitHubTrafficNamespace(BaseNamespace):
     """Methods for the traffic namespace"""
@@ -39,10 +43,10 @@ class GitHubTrafficNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/git#get-a-tree
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository}/traffic/clones",
+            endpoint=CLONES_ROUTE.format(repository=repository),
             **kwargs,
         )
-        response.data = GitHubClonesModel(response.data)
+        response.map_data(GitHubClonesModel)
         return response
 
     async def views(
@@ -66,8 +70,8 @@ class GitHubTrafficNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/git#get-a-tree
         """
         response = await self._client.async_call_api(
-            endpoint=f"/repos/{repository}/traffic/views",
+            endpoint=VIEWS_ROUTE.format(repository=repository),
             **kwargs,
         )
-        response.data = GitHubViewsModel(response.data)
+        response.map_data(GitHubViewsModel)
         return response
@@ -42,7 +42,7 @@ class GitHubUserNamespace(BaseNamespace):
             endpoint="/user",
             **kwargs,
         )
-        response.data = GitHubAuthenticatedUserModel(response.data)
+        response.map_data(GitHubAuthenticatedUserModel)
 
         return response
 
@@ -61,7 +61,7 @@ class GitHubUserNamespace(BaseNamespace):
             **kwargs,
         )
 
-        response.data = [GitHubRepositoryModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubRepositoryModel(item) for item in items])
 
         return response
 
@@ -80,7 +80,7 @@ class GitHubUserNamespace(BaseNamespace):
             **kwargs,
         )
 
-        response.data = [GitHubRepositoryModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubRepositoryModel(item) for item in items])
 
         return response
 
@@ -95,5 +95,7 @@ class GitHubUserNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/orgs#list-organizations-for-the-authenticated-user
         """
         response = await self._client.async_call_api(endpoint="/user/orgs", **kwargs)
-        response.data = [GitHubOrganizationMinimalModel(data) for data in response.data or []]
+        response.map_data(
+            lambda items: [GitHubOrganizationMinimalModel(item) for item in items or []]
+        )
         return response
@@ -13,9 +13,15 @@ from ..models.organization import GitHubOrganizationMinimalModel
 from ..models.repository import GitHubRepositoryModel
 from ..models.response import GitHubResponseModel
 from ..models.user import GitHubUserModel
+from ..routes import GitHubRoute
 from .base import BaseNamespace
 from .projects import GitHubUsersProjectsNamespace
 
+USER_ROUTE = GitHubRoute("/users/{username}")
+USER_STARRED_ROUTE = GitHubRoute("/users/{username}/starred")
+USER_REPOS_ROUTE = GitHubRoute("/users/{username}/repos")
+USER_ORGS_ROUTE = GitHubRoute("/users/{username}/orgs")
+
 
 class GitHubUsersNamespace(BaseNamespace):
     """Methods for the users namespace"""
@@ -45,10 +51,10 @@ class GitHubUsersNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/users#get-a-user
         """
         response = await self._client.async_call_api(
-            endpoint=f"/users/{username}",
+            endpoint=USER_ROUTE.format(username=username),
             **kwargs,
         )
-        response.data = GitHubUserModel(response.data)
+        response.map_data(GitHubUserModel)
 
         return response
 
@@ -70,11 +76,11 @@ class GitHubUsersNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/users#get-a-user
         """
         response = await self._client.async_call_api(
-            endpoint=f"/users/{username}/starred",
+            endpoint=USER_STARRED_ROUTE.format(username=username),
             **kwargs,
         )
 
-        response.data = [GitHubRepositoryModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubRepositoryModel(item) for item in items])
 
         return response
 
@@ -96,11 +102,11 @@ class GitHubUsersNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/repos#list-repositories-for-a-user
         """
         response = await self._client.async_call_api(
-            endpoint=f"/users/{username}/repos",
+            endpoint=USER_REPOS_ROUTE.format(username=username),
             **kwargs,
         )
 
-        response.data = [GitHubRepositoryModel(data) for data in response.data]
+        response.map_data(lambda items: [GitHubRepositoryModel(item) for item in items])
 
         return response
 
@@ -122,10 +128,12 @@ class GitHubUsersNamespace(BaseNamespace):
         https://docs.github.com/en/rest/reference/orgs#list-organizations-for-a-user
         """
         response = await self._client.async_call_api(
-            endpoint=f"/users/{username}/orgs",
+            endpoint=USER_ORGS_ROUTE.format(username=username),
             **kwargs,
         )
 
-        response.data = [GitHubOrganizationMinimalModel(data) for data in response.data or []]
+        response.map_data(
+            lambda items: [GitHubOrganizationMinimalModel(item) for item in items or []]
+        )
 
         return response
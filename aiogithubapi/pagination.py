@@ -0,0 +1,466 @@
+"""Pagination of list endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import aclosing
+import copy
+from dataclasses import asdict, dataclass
+import inspect
+import math
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Tuple
+
+from .const import GitHubRequestKwarg
+from .exceptions import GitHubException, GitHubNotModifiedException
+from .models.base import GitHubBase
+from .models.response import GitHubResponseHeadersModel, GitHubResponseModel
+
+DEFAULT_PER_PAGE = 100
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark the exception of a page request that is no longer needed as retrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _item_id(item: Any) -> str | int | None:
+    """Return the id of an item of a collection, commits use the sha."""
+    for key in ("id", "sha"):
+        value = item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+        if value is not None:
+            return value
+    return None
+
+
+@dataclass
+class GitHubPaginationCursor:
+    """
+    A position in a collection, used to resume a paginator where it stopped.
+
+    `query` has the params of the page with the next item, like the page
+    number or the `since` id from the next link. `etag` is the ETag of that
+    page, `offset` the number of its items that were yielded and `last_id`
+    the id of the last yielded item. When the page changed before the
+    paginator was resumed, the last yielded item is looked up on it, on the
+    page before when items were removed and on the page after when items
+    were added. When the last yielded item was removed from the collection,
+    the other items of its page are yielded again rather than risking to
+    skip one.
+
+    A walk with `ordered` set to False yields pages out of order, its cursor
+    can not be used to resume it.
+
+    Use `as_dict` and `from_dict` to store the cursor, example as JSON.
+    """
+
+    query: Dict[str, str]
+    etag: str | None = None
+    offset: int = 0
+    last_id: str | int | None = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the cursor as a dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> GitHubPaginationCursor:
+        """Return a cursor from a dictionary created by `as_dict`."""
+        return cls(**{**data, "query": dict(data["query"])})
+
+
+class GitHubPageCache(GitHubBase):
+    """
+    The responses of the pages of collections, kept to revalidate them.
+
+    Pass the same page cache to every walk of a collection, each page is then
+    requested with the ETag of the last response for it. Pages that did not
+    change are answered with 304 Not Modified, which does not count against
+    the rate limit, and the kept response is used.
+
+    `downloaded` and `not_modified` count the pages that were requested, a
+    walk where `downloaded` did not change found no changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the page cache."""
+        self.downloaded = 0
+        self.not_modified = 0
+        self._pages: Dict[Tuple[Any, ...], GitHubResponseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, key: Tuple[Any, ...]) -> GitHubResponseModel | None:
+        """Return the kept response for a page."""
+        return self._pages.get(key)
+
+    def set(self, key: Tuple[Any, ...], response: GitHubResponseModel) -> None:
+        """Keep the response for a page."""
+        self._pages[key] = response
+
+    def clear(self) -> None:
+        """Remove all kept responses."""
+        self._pages.clear()
+
+
+class GitHubPaginator(GitHubBase):
+    """
+    Iterates over every item of a list endpoint, page by page.
+
+    The `next` link of each response is followed until there is none,
+    only one page is held at a time.
+
+    **Arguments**:
+
+    `method` (Required)
+
+    A namespace method that returns a list, example `github.repos.issues.list`.
+
+    `*args` and `**kwargs` (Optional)
+
+    Passed to the method for every page.
+
+    `per_page` (Optional)
+
+    The number of items to request per page, defaults to 100, the maximum.
+
+    `max_items` (Optional)
+
+    Stop after this many items, defaults to all items.
+
+    `concurrency` (Optional)
+
+    When larger than 1 and the first response links to the last page, the
+    remaining pages are requested at the same time, with at most this many
+    in flight. Defaults to 1, one page after the other.
+
+    `ordered` (Optional)
+
+    When pages are requested at the same time, return them in page order,
+    set to False to return them as they arrive. Defaults to True.
+    An unordered walk can not be resumed, it can not be given a `cursor`
+    and its own `cursor` can not be used to resume it.
+
+    `prefetch` (Optional)
+
+    The number of pages to request in the background while the current
+    page is consumed. Defaults to 0, a page is requested when it is needed.
+
+    `page_cache` (Optional)
+
+    A `GitHubPageCache` used to revalidate the pages with their ETags,
+    unchanged pages come from the cache.
+
+    `cursor` (Optional)
+
+    A `GitHubPaginationCursor` from the `cursor` of an earlier paginator,
+    items are yielded from the first item after it.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[GitHubResponseModel]],
+        *args: Any,
+        per_page: int = DEFAULT_PER_PAGE,
+        max_items: int | None = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        prefetch: int = 0,
+        page_cache: GitHubPageCache | None = None,
+        cursor: GitHubPaginationCursor | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialise the paginator."""
+        if cursor is not None and not ordered and concurrency > 1:
+            raise GitHubException("A cursor can not be used when the pages are not ordered")
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.prefetch = prefetch
+        self.page_cache = page_cache
+        self.cursor = cursor
+        """The position after the last yielded item, None when every item was yielded."""
+        self.per_page = per_page if max_items is None else max(min(per_page, max_items), 1)
+        self.max_items = max_items
+        parameters = inspect.signature(method).parameters
+        # Some methods take the page as arguments, these are used over the params.
+        self._page_arguments = "page" in parameters and "per_page" in parameters
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """Return an iterator over the items."""
+        return self.items()
+
+    async def items(self) -> AsyncIterator[Any]:
+        """Yield the items of every page, up to `max_items`."""
+        if self.max_items is not None and self.max_items <= 0:
+            return
+        count = 0
+        resume = self.cursor
+        last_id = None if resume is None else resume.last_id
+        # The last yielded item moves to the page before when items before it are
+        # removed and to the page after when items are added. Items of the page
+        # are held back until the page after is checked for it.
+        held: List[Tuple[GitHubPaginationCursor, Any]] = []
+        async with aclosing(self._query_pages()) as pages:
+            async for query, response in pages:
+                data = response.data or []
+                positions = self._positions(query, response, data)
+                start = 0
+                if resume is not None:
+                    start = self._resume_offset(resume, response, data)
+                    if start is None and not held and resume.query == query:
+                        previous = await self._async_previous_positions(resume, response)
+                        if previous is not None:
+                            held = previous
+                        else:
+                            # It is on the page after or was removed, the whole page is held
+                            held = positions
+                            if "next" in response.links and data:
+                                continue
+                            start = len(data)
+                    elif start is not None:
+                        # The held items were yielded before the last item
+                        held = []
+                    resume = None
+                for cursor, item in held + positions[start or 0 :]:
+                    self.cursor = cursor
+                    last_id = cursor.last_id
+                    yield item
+                    count += 1
+                    if self.max_items is not None and count >= self.max_items:
+                        return
+                held = []
+                if (next_url := response.links.get("next")) is not None and data:
+                    self.cursor = GitHubPaginationCursor(
+                        query=dict(next_url.query), last_id=last_id
+                    )
+                else:
+                    self.cursor = None
+
+    async def pages(self) -> AsyncIterator[GitHubResponseModel]:
+        """Yield the response of every page."""
+        async with aclosing(self._query_pages()) as pages:
+            async for _, response in pages:
+                yield response
+
+    async def _query_pages(self) -> AsyncIterator[Tuple[Dict[str, str], GitHubResponseModel]]:
+        """Yield the query and the response of every page, prefetched if enabled."""
+        resumed = self.cursor is not None
+        if resumed:
+            query = dict(self.cursor.query)
+        else:
+            query = {"per_page": str(self.per_page)}
+
+        if self.prefetch <= 0:
+            async with aclosing(self._pages(query, resumed=resumed)) as pages:
+                async for page in pages:
+                    yield page
+            return
+
+        slots = asyncio.Semaphore(self.prefetch)
+        queue: asyncio.Queue[
+            Tuple[Tuple[Dict[str, str], GitHubResponseModel] | None, Exception | None]
+        ] = asyncio.Queue()
+
+        async def _produce() -> None:
+            try:
+                async with aclosing(self._pages(query, resumed=resumed)) as pages:
+                    while True:
+                        await slots.acquire()
+                        try:
+                            page = await anext(pages)
+                        except StopAsyncIteration:
+                            break
+                        queue.put_nowait((page, None))
+            except Exception as exception:  # pylint: disable=broad-except
+                queue.put_nowait((None, exception))
+            else:
+                queue.put_nowait((None, None))
+
+        producer = asyncio.create_task(_produce())
+        try:
+            while True:
+                page, exception = await queue.get()
+                if exception is not None:
+                    raise exception
+                if page is None:
+                    return
+                # The next page is requested while this one is consumed
+                slots.release()
+                yield page
+        finally:
+            producer.cancel()
+
+    async def _pages(
+        self,
+        query: Dict[str, str],
+        *,
+        resumed: bool = False,
+    ) -> AsyncIterator[Tuple[Dict[str, str], GitHubResponseModel]]:
+        """Yield the query and the response of every page, as they are requested."""
+        first = int(query.get("page", 1))
+        while True:
+            response = await self._async_fetch(query)
+            yield query, response
+            if (next_url := response.links.get("next")) is None or not response.data:
+                return
+            query = dict(next_url.query)
+            if (
+                self.concurrency > 1
+                and "page" in query
+                and (last := response.last_page_number) is not None
+            ):
+                if self.max_items is not None:
+                    # One more page when resuming, part of the first page was already yielded
+                    needed = math.ceil(self.max_items / self.per_page) + resumed
+                    last = min(last, first + needed - 1)
+                async with aclosing(self._fan_out(query, int(query["page"]), last)) as pages:
+                    async for page in pages:
+                        yield page
+                return
+
+    async def _fan_out(
+        self,
+        query: Dict[str, str],
+        first: int,
+        last: int,
+    ) -> AsyncIterator[Tuple[Dict[str, str], GitHubResponseModel]]:
+        """Yield the query and the response of the pages from first to last, requested together."""
+        pages = iter(range(first, last + 1))
+        tasks: Deque[Tuple[Dict[str, str], asyncio.Task[GitHubResponseModel]]] = deque()
+
+        def _schedule() -> None:
+            if (page := next(pages, None)) is not None:
+                page_query = {**query, "page": str(page)}
+                tasks.append((page_query, asyncio.create_task(self._async_fetch(page_query))))
+
+        try:
+            for _ in range(self.concurrency):
+                _schedule()
+            while tasks:
+                if self.ordered:
+                    entry = tasks[0]
+                    await asyncio.wait([entry[1]])
+                else:
+                    done, _ = await asyncio.wait(
+                        [task for _, task in tasks], return_when=asyncio.FIRST_COMPLETED
+                    )
+                    entry = next(entry for entry in tasks if entry[1] in done)
+                tasks.remove(entry)
+                _schedule()
+                yield entry[0], entry[1].result()
+        finally:
+            for _, task in tasks:
+                task.cancel()
+                task.add_done_callback(_retrieve_exception)
+
+    @staticmethod
+    def _positions(
+        query: Dict[str, str],
+        response: GitHubResponseModel,
+        data: List[Any],
+    ) -> List[Tuple[GitHubPaginationCursor, Any]]:
+        """Return the items of a page with the cursor after each of them."""
+        return [
+            (
+                GitHubPaginationCursor(
+                    query=query, etag=response.etag, offset=index + 1, last_id=_item_id(item)
+                ),
+                item,
+            )
+            for index, item in enumerate(data)
+        ]
+
+    async def _async_previous_positions(
+        self,
+        cursor: GitHubPaginationCursor,
+        response: GitHubResponseModel,
+    ) -> List[Tuple[GitHubPaginationCursor, Any]] | None:
+        """
+        Return the items after the last yielded item when it is on the page before.
+
+        None is returned when there is no page before or the item is not on it.
+        """
+        if (previous_url := response.links.get("prev")) is None:
+            return None
+        query = dict(previous_url.query)
+        previous = await self._async_fetch(query)
+        data = previous.data or []
+        for index, item in enumerate(data):
+            if _item_id(item) == cursor.last_id:
+                return self._positions(query, previous, data)[index + 1 :]
+        return None
+
+    def _resume_offset(
+        self,
+        cursor: GitHubPaginationCursor,
+        response: GitHubResponseModel,
+        data: List[Any],
+    ) -> int | None:
+        """
+        Return the index of the first item of the page that was not yielded before.
+
+        None is returned when the page changed and the last yielded item is not on it.
+        """
+        if cursor.etag is not None and response.etag == cursor.etag:
+            return min(cursor.offset, len(data))
+        if cursor.last_id is None:
+            return min(cursor.offset, len(data))
+        for index, item in enumerate(data):
+            if _item_id(item) == cursor.last_id:
+                return index + 1
+        return None
+
+    async def _async_fetch(self, query: Dict[str, str]) -> GitHubResponseModel:
+        """Request the page in the query."""
+        kwargs = self._page_kwargs(query)
+        if self.page_cache is None:
+            return await self.method(*self.args, **kwargs)
+
+        key = (
+            getattr(self.method, "__qualname__", repr(self.method)),
+            repr(self.args),
+            repr(sorted(self.kwargs.items())),
+            tuple(sorted(query.items())),
+        )
+        if (cached := self.page_cache.get(key)) is not None:
+            kwargs[GitHubRequestKwarg.ETAG] = cached.etag
+            try:
+                response = await self.method(*self.args, **kwargs)
+            except GitHubNotModifiedException as exception:
+                self.page_cache.not_modified += 1
+                if exception.headers is None:
+                    return cached
+                # The Link header of the page changes when the collection grows or shrinks
+                response = copy.copy(cached)
+                response.headers = GitHubResponseHeadersModel(
+                    {**cached.headers.as_dict, **exception.headers.as_dict}
+                )
+                self.page_cache.set(key, response)
+                return response
+        else:
+            response = await self.method(*self.args, **kwargs)
+
+        self.page_cache.downloaded += 1
+        if response.etag:
+            self.page_cache.set(key, response)
+        return response
+
+    def _page_kwargs(self, query: Dict[str, str]) -> Dict[str, Any]:
+        """Return the kwargs for the method to request the page in the query."""
+        kwargs = dict(self.kwargs)
+        if self._page_arguments:
+            # The other params in the query come from the arguments of the method
+            kwargs["per_page"] = int(query.get("per_page", self.per_page))
+            if "page" in query:
+                kwargs["page"] = int(query["page"])
+            return kwargs
+        kwargs[GitHubRequestKwarg.PARAMS] = {
+            **kwargs.pop(GitHubRequestKwarg.PARAMS, kwargs.pop(GitHubRequestKwarg.QUERY, {})),
+            **query,
+        }
+        return kwargs
@@ -0,0 +1,128 @@
+"""Priority scheduling for requests made by the GitHub API client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict
+
+from .const import GitHubRequestPriority
+from .models.base import GitHubBase
+
+
+class GitHubPriorityScheduler(GitHubBase):
+    """
+    Limits the number of requests in flight and serves waiting requests by priority.
+
+    When a slot frees up it is given to the waiting request with the highest
+    priority, unless a lower priority has had less than `min_share` of the
+    recent slots, then that priority is served first so it is never starved.
+    Requests with the same priority are served in the order they were made.
+
+    The share is counted in slots, every request that is let through takes
+    one, so it is the share of the requests made rather than of the rate
+    limit budget. Searches and GraphQL queries have their own budgets and
+    are counted like any other request. When the client also has a rate limit
+    scheduler, requests that are held or paced there wait by priority too.
+
+    **Arguments**:
+
+    `limit` (Optional)
+
+    The maximum number of requests in flight, defaults to 10.
+
+    `min_share` (Optional)
+
+    The minimum share of the recent slots, that is of the requests let
+    through, that is given to each priority that has waiting requests,
+    defaults to 0.1.
+
+    `window` (Optional)
+
+    The number of recent slots used for the share, defaults to 50.
+    """
+
+    def __init__(
+        self,
+        limit: int = 10,
+        *,
+        min_share: float = 0.1,
+        window: int = 50,
+    ) -> None:
+        """Initialise the priority scheduler."""
+        self.limit = limit
+        self.min_share = min_share
+        self._in_flight = 0
+        self._granted: Deque[GitHubRequestPriority] = deque(maxlen=window)
+        self._waiters: Dict[GitHubRequestPriority, Deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in sorted(GitHubRequestPriority, reverse=True)
+        }
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests in flight."""
+        return self._in_flight
+
+    def waiting(self, priority: GitHubRequestPriority | None = None) -> int:
+        """Return the number of waiting requests, optionally only for one priority."""
+        lanes = self._waiters.values() if priority is None else [self._waiters[priority]]
+        return sum(not future.done() for lane in lanes for future in lane)
+
+    def share(self, priority: GitHubRequestPriority) -> float:
+        """Return the share of the recent slots that was given to a priority."""
+        if not self._granted:
+            return 0
+        return self._granted.count(priority) / len(self._granted)
+
+    @asynccontextmanager
+    async def async_slot(
+        self,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+    ) -> AsyncIterator[None]:
+        """Wait for a slot for the priority and hold it while the request is made."""
+        if self._in_flight < self.limit and not self.waiting():
+            self._grant(priority)
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters[priority].append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was given while the request was cancelled
+                    self._release()
+                raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _grant(self, priority: GitHubRequestPriority) -> None:
+        """Give a slot to a priority."""
+        self._in_flight += 1
+        self._granted.append(priority)
+
+    def _release(self) -> None:
+        """Free a slot and give free slots to waiting requests."""
+        self._in_flight -= 1
+        while self._in_flight < self.limit and (priority := self._next_priority()) is not None:
+            future = self._waiters[priority].popleft()
+            self._grant(priority)
+            future.set_result(None)
+
+    def _next_priority(self) -> GitHubRequestPriority | None:
+        """Return the priority that gets the next slot, None if no request is waiting."""
+        waiting = []
+        for priority, lane in self._waiters.items():
+            while lane and lane[0].done():
+                lane.popleft()
+            if lane:
+                waiting.append(priority)
+        if not waiting:
+            return None
+        for priority in reversed(waiting[1:]):
+            if self.share(priority) < self.min_share:
+                return priority
+        return waiting[0]
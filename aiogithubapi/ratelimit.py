@@ -0,0 +1,354 @@
+"""
+Rate limit aware scheduling of requests.
+
+GitHub reports the remaining budget of a rate limit resource in the
+X-RateLimit-* headers of every response. The scheduler keeps track of those
+and holds requests until the reset time when the budget runs out, instead of
+letting them fail with `GitHubRateLimitException`.
+
+Mutating requests are also subject to secondary rate limits, the write lane
+serializes those and keeps a gap between them.
+
+https://docs.github.com/en/rest/overview/resources-in-the-rest-api#rate-limiting
+https://docs.github.com/en/rest/guides/best-practices-for-integrators#dealing-with-secondary-rate-limits
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import math
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List
+
+from .const import GitHubRequestPriority
+from .exceptions import GitHubException
+from .models.base import GitHubBase
+from .models.response import GitHubResponseHeadersModel
+
+RESET_MARGIN = 1
+
+
+@dataclass
+class GitHubRateLimitState:
+    """The last known state of a rate limit resource."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset: float = 0
+    inflight: int = 0
+    next_request: float = 0
+    waiters: List[List[Any]] = field(default_factory=list, repr=False)
+    """Requests waiting for budget, as a heap of [-priority, sequence, future]."""
+
+    @property
+    def available(self) -> int | None:
+        """Return the budget that is not claimed by requests in flight."""
+        if self.remaining is None:
+            return None
+        return self.remaining - self.inflight
+
+    def update(self, headers: GitHubResponseHeadersModel) -> None:
+        """Update the state from response headers."""
+        if headers.x_ratelimit_remaining is None or headers.x_ratelimit_reset is None:
+            return
+        remaining = int(headers.x_ratelimit_remaining)
+        reset = float(headers.x_ratelimit_reset)
+
+        if reset > self.reset or self.remaining is None:
+            self.reset = reset
+            self.remaining = remaining
+            self.next_request = 0
+        else:
+            # Responses can arrive out of order, the lowest value is the most recent one
+            self.remaining = min(self.remaining, remaining)
+        if headers.x_ratelimit_limit is not None:
+            self.limit = int(headers.x_ratelimit_limit)
+
+
+class GitHubRateLimitScheduler(GitHubBase):
+    """
+    Holds or paces requests based on the remaining rate limit budget.
+
+    **Arguments**:
+
+    `reserve` (Optional)
+
+    The number of requests to keep in reserve, when the remaining budget of a
+    resource reaches this, requests are held until the reset. Defaults to 0.
+
+    `pace_below` (Optional)
+
+    When the remaining budget of a resource is below this, requests are spread
+    evenly over the time left until the reset.
+    Defaults to None, which disables pacing.
+
+    Requests that are held or paced wait in order of their priority, a
+    request with a higher priority gets the next paced slot or goes first
+    after the reset, ahead of requests with a lower priority that waited longer.
+    """
+
+    def __init__(self, *, reserve: int = 0, pace_below: int | None = None) -> None:
+        """Initialise the scheduler."""
+        self.reserve = reserve
+        self.pace_below = pace_below
+        self._states: Dict[str, GitHubRateLimitState] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def states(self) -> Dict[str, GitHubRateLimitState]:
+        """Return the known state of all resources."""
+        return self._states
+
+    @staticmethod
+    def resource_for_endpoint(endpoint: str) -> str:
+        """Return the rate limit resource an endpoint is expected to use."""
+        if endpoint.startswith("/graphql"):
+            return "graphql"
+        if endpoint.startswith("/search/code"):
+            return "code_search"
+        if endpoint.startswith("/search/"):
+            return "search"
+        return "core"
+
+    async def async_acquire(
+        self,
+        resource: str,
+        priority: GitHubRequestPriority = GitHubRequestPriority.NORMAL,
+    ) -> None:
+        """Wait until a request for the resource can be made and claim budget for it."""
+        state = self._states.setdefault(resource, GitHubRateLimitState())
+        waiter: List[Any] = [-priority, next(self._sequence), None]
+        heapq.heappush(state.waiters, waiter)
+        try:
+            while True:
+                if state.waiters[0] is not waiter:
+                    # Only the first waiter waits for the budget, the others wait for their turn
+                    waiter[2] = asyncio.get_running_loop().create_future()
+                    await waiter[2]
+                    continue
+                if (wait := self._wait(resource, state)) <= 0:
+                    break
+                await asyncio.sleep(wait)
+                if (available := state.available) is not None and available <= self.reserve:
+                    state.remaining = None
+                if state.waiters[0] is waiter:
+                    break
+        finally:
+            if state.waiters and state.waiters[0] is waiter:
+                heapq.heappop(state.waiters)
+            elif waiter in state.waiters:
+                state.waiters.remove(waiter)
+                heapq.heapify(state.waiters)
+            if state.waiters and (future := state.waiters[0][2]) is not None and not future.done():
+                future.set_result(None)
+
+        self._pace(state)
+        state.inflight += 1
+
+    def _wait(self, resource: str, state: GitHubRateLimitState) -> float:
+        """Return the seconds the next request for a resource needs to wait."""
+        now = time.time()
+        if state.reset and state.reset <= now:
+            state.remaining = None
+
+        if (available := state.available) is not None and available <= self.reserve:
+            wait = state.reset - now + RESET_MARGIN
+            self.logger.warning(
+                "Rate limit for %s is exhausted, waiting %.0f seconds for the reset",
+                resource,
+                wait,
+            )
+            return wait
+
+        if (
+            self.pace_below is not None
+            and available is not None
+            and available < self.pace_below
+            and (wait := state.next_request - now) > 0
+        ):
+            self.logger.debug("Pacing request for %s, waiting %.2f seconds", resource, wait)
+            return wait
+        return 0
+
+    def _pace(self, state: GitHubRateLimitState) -> None:
+        """Set the time of the next paced request when the budget is low."""
+        if (
+            self.pace_below is not None
+            and (available := state.available) is not None
+            and available < self.pace_below
+        ):
+            now = time.time()
+            interval = (state.reset - now) / max(available - self.reserve, 1)
+            state.next_request = max(now, state.next_request) + interval
+
+    def release(self, resource: str) -> None:
+        """Release the claim of a request that is no longer in flight."""
+        if (state := self._states.get(resource)) is not None and state.inflight > 0:
+            state.inflight -= 1
+
+    def update(self, resource: str, headers: GitHubResponseHeadersModel) -> None:
+        """Update the state of a resource from response headers."""
+        if headers.x_ratelimit_remaining is None or headers.x_ratelimit_reset is None:
+            return
+        self._states.setdefault(
+            headers.x_ratelimit_resource or resource, GitHubRateLimitState()
+        ).update(headers)
+
+
+class GitHubTokenPool(GitHubBase):
+    """
+    Spreads requests over multiple tokens based on their remaining budget.
+
+    Every request uses the token with the most remaining budget for its rate
+    limit resource, as last reported by GitHub. Tokens that have run out are
+    parked until their reset. When all tokens are parked, requests are held
+    until the first reset, so the pool does not need a rate limit scheduler.
+
+    **Arguments**:
+
+    `tokens`
+
+    The GitHub access tokens to use.
+    """
+
+    def __init__(self, tokens: Iterable[str]) -> None:
+        """Initialise the token pool."""
+        self.tokens = list(tokens)
+        if not self.tokens:
+            raise GitHubException("A token pool needs at least one token")
+        self._states: Dict[str, Dict[str, GitHubRateLimitState]] = {
+            token: {} for token in self.tokens
+        }
+
+    def state(self, token: str, resource: str) -> GitHubRateLimitState:
+        """Return the state of a rate limit resource for a token."""
+        return self._states[token].setdefault(resource, GitHubRateLimitState())
+
+    async def async_acquire(self, resource: str) -> str:
+        """Return the token to use for a request and claim budget for it."""
+        while True:
+            now = time.time()
+            candidates: list[tuple[float, int, str]] = []
+            resets: list[float] = []
+            for token in self.tokens:
+                state = self.state(token, resource)
+                if state.reset and state.reset <= now:
+                    state.remaining = None
+                if (available := state.available) is not None and available <= 0:
+                    resets.append(state.reset)
+                    continue
+                candidates.append(
+                    (math.inf if available is None else available, -state.inflight, token)
+                )
+
+            if candidates:
+                token = max(candidates, key=lambda candidate: candidate[:2])[2]
+                self.state(token, resource).inflight += 1
+                return token
+
+            reset = min(resets)
+            self.logger.warning(
+                "All tokens are exhausted for %s, waiting %.0f seconds for the reset",
+                resource,
+                reset - now + RESET_MARGIN,
+            )
+            await asyncio.sleep(reset - now + RESET_MARGIN)
+            for token in self.tokens:
+                if (state := self.state(token, resource)).reset <= reset:
+                    state.remaining = None
+
+    def release(self, token: str, resource: str) -> None:
+        """Release the claim of a request that is no longer in flight."""
+        if (state := self.state(token, resource)).inflight > 0:
+            state.inflight -= 1
+
+    def update(self, token: str, resource: str, headers: GitHubResponseHeadersModel) -> None:
+        """Update the state of a token from response headers."""
+        self.state(token, headers.x_ratelimit_resource or resource).update(headers)
+
+
+@dataclass
+class GitHubWriteLaneState:
+    """The state of a write lane for one token."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_request: float = 0
+    penalty: float = 0
+
+
+class GitHubWriteLane(GitHubBase):
+    """
+    Serializes mutating requests to stay clear of secondary rate limits.
+
+    Requests going through the lane are made one at a time per token, with
+    a minimum gap between them. When a secondary rate limit is hit the lane
+    is paused, for the time given by the Retry-After header or else for
+    a backoff that doubles every time the limit is hit in a row.
+
+    **Arguments**:
+
+    `min_interval` (Optional)
+
+    The minimum time in seconds between two requests. Defaults to 1.
+
+    `backoff` (Optional)
+
+    The time in seconds to pause when a secondary rate limit is hit without
+    a Retry-After header. Defaults to 60.
+
+    `backoff_max` (Optional)
+
+    The maximum time in seconds to pause. Defaults to 900.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 1,
+        backoff: float = 60,
+        backoff_max: float = 900,
+    ) -> None:
+        """Initialise the write lane."""
+        self.min_interval = min_interval
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self._states: Dict[str | None, GitHubWriteLaneState] = {}
+
+    def state(self, token: str | None) -> GitHubWriteLaneState:
+        """Return the state of the lane for a token."""
+        if (state := self._states.get(token)) is None:
+            state = self._states[token] = GitHubWriteLaneState()
+        return state
+
+    @asynccontextmanager
+    async def async_slot(self, token: str | None) -> AsyncIterator[None]:
+        """Wait for the turn of a request and hold the lane while it is made."""
+        state = self.state(token)
+        async with state.lock:
+            if (wait := state.next_request - time.monotonic()) > 0:
+                self.logger.debug("Waiting %.2f seconds before the next write request", wait)
+                await asyncio.sleep(wait)
+            try:
+                yield
+            finally:
+                state.next_request = max(state.next_request, time.monotonic() + self.min_interval)
+
+    def secondary_rate_limited(self, token: str | None, retry_after: float | None = None) -> None:
+        """Pause the lane after hitting a secondary rate limit."""
+        state = self.state(token)
+        if retry_after is not None:
+            state.penalty = retry_after
+        else:
+            state.penalty = min(state.penalty * 2 or self.backoff, self.backoff_max)
+        self.logger.warning(
+            "Secondary rate limit hit, pausing write requests for %.0f seconds", state.penalty
+        )
+        state.next_request = time.monotonic() + state.penalty
+
+    def succeeded(self, token: str | None) -> None:
+        """Reset the backoff after a successful request."""
+        self.state(token).penalty = 0
@@ -0,0 +1,129 @@
+"""
+Retry policy for requests made by the GitHub API client.
+
+Pass a `GitHubRetryPolicy` with the `retry_policy` client kwarg to retry
+requests that failed because of connection issues, server errors or rate
+limits. The same kwarg can be passed to a single request to override the
+policy of the client, pass None to disable retries for that request.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+from .const import HttpMethod, HttpStatusCode
+from .helpers import random_float
+from .models.response import GitHubResponseHeadersModel
+
+
+@dataclass(frozen=True)
+class GitHubRetryPolicy:
+    """
+    Retry policy with exponential backoff.
+
+    **Arguments**:
+
+    `max_attempts` (Optional)
+
+    The maximum number of attempts, including the first one. Defaults to 3.
+
+    `backoff_factor` (Optional)
+
+    The delay before the first retry in seconds, doubled for every
+    following retry. Defaults to 1.
+
+    `backoff_max` (Optional)
+
+    The maximum delay between two attempts in seconds. Defaults to 30.
+
+    `max_elapsed` (Optional)
+
+    The maximum time in seconds to spend on a request including retries,
+    no retry is made if waiting for it would exceed this. Defaults to 60.
+
+    `jitter` (Optional)
+
+    Pick a random delay between 0 and the backoff delay. Defaults to True.
+
+    `methods` (Optional)
+
+    The HTTP methods that are retried, defaults to the idempotent methods.
+
+    `statuses` (Optional)
+
+    The HTTP status codes that are retried, defaults to server errors.
+
+    `retry_rate_limited` (Optional)
+
+    Retry rate limited requests after the time given by the Retry-After or
+    X-RateLimit-Reset headers. Defaults to True.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 1
+    backoff_max: float = 30
+    max_elapsed: float | None = 60
+    jitter: bool = True
+    methods: frozenset[str] = frozenset((HttpMethod.GET, HttpMethod.PUT, HttpMethod.DELETE))
+    statuses: frozenset[int] = frozenset(
+        (
+            HttpStatusCode.INTERNAL_SERVER_ERROR,
+            HttpStatusCode.BAD_GATEWAY,
+            HttpStatusCode.SERVICE_UNAVAILABLE,
+            HttpStatusCode.GATEWAY_TIMEOUT,
+        )
+    )
+    retry_rate_limited: bool = True
+
+    def allows_method(self, method: str) -> bool:
+        """Return True if requests with this method can be retried."""
+        return method.upper() in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay in seconds before the next attempt."""
+        delay = min(self.backoff_max, self.backoff_factor * 2 ** (attempt - 1))
+        return random_float(0, delay) if self.jitter else delay
+
+    def rate_limit_delay(self, status: int, headers: GitHubResponseHeadersModel) -> float | None:
+        """Return the delay in seconds for a rate limited response, or None."""
+        if not self.retry_rate_limited or status not in (
+            HttpStatusCode.FORBIDDEN,
+            HttpStatusCode.TOO_MANY_REQUESTS,
+        ):
+            return None
+        if headers.retry_after is not None and headers.retry_after.isdigit():
+            return float(headers.retry_after)
+        if headers.x_ratelimit_remaining == "0" and headers.x_ratelimit_reset is not None:
+            return max(float(headers.x_ratelimit_reset) - time.time(), 0) + 1
+        return None
+
+    def allows_delay(self, started: float, delay: float) -> bool:
+        """Return True if waiting for delay seconds stays within the max_elapsed budget."""
+        if self.max_elapsed is None:
+            return True
+        return time.monotonic() - started + delay <= self.max_elapsed
+
+    def retry_delay(
+        self,
+        *,
+        method: str,
+        attempt: int,
+        started: float,
+        status: int | None = None,
+        headers: GitHubResponseHeadersModel | None = None,
+    ) -> float | None:
+        """
+        Return the delay in seconds before the next attempt.
+
+        None is returned if the request should not be retried.
+        Pass the status and headers of the response, or leave them out if the
+        request failed with a connection issue.
+        """
+        if attempt >= self.max_attempts or not self.allows_method(method):
+            return None
+        if status is None or status in self.statuses:
+            delay = self.backoff(attempt)
+        elif (delay := self.rate_limit_delay(status, headers)) is None:
+            return None
+        return delay if self.allows_delay(started, delay) else None
@@ -0,0 +1,60 @@
+"""Route templates for GitHub API endpoints."""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any, Tuple
+
+
+class GitHubEndpoint(str):
+    """An endpoint that remembers the route template it was built from."""
+
+    template: str
+
+    def __new__(cls, value: str, template: str | None = None) -> GitHubEndpoint:
+        """Create the endpoint."""
+        endpoint = super().__new__(cls, value)
+        endpoint.template = template if template is not None else value
+        return endpoint
+
+
+class GitHubRoute:
+    """
+    A route template that is parsed once and formatted for each request.
+
+    **Arguments**:
+
+    `template`
+
+    The route template, example "/repos/{repository}/issues/{issue_number}"
+    """
+
+    __slots__ = ("template", "_parts")
+
+    def __init__(self, template: str) -> None:
+        """Initialise the route."""
+        self.template = template
+        self._parts: Tuple[Tuple[str, str | None], ...] = tuple(
+            (literal, field) for literal, field, _, _ in Formatter().parse(template)
+        )
+
+    def __repr__(self) -> str:
+        """Return the representation of the route."""
+        return f"GitHubRoute({self.template!r})"
+
+    def format(self, **values: Any) -> GitHubEndpoint:
+        """Return the endpoint for the given values."""
+        return GitHubEndpoint(
+            "".join(
+                literal if field is None else f"{literal}{values[field]}"
+                for literal, field in self._parts
+            ),
+            self.template,
+        )
+
+    __call__ = format
+
+
+def route_template(endpoint: str) -> str:
+    """Return the route template of an endpoint, or the endpoint if it has none."""
+    return getattr(endpoint, "template", endpoint)
@@ -0,0 +1,130 @@
+"""Statistics of the requests made by the GitHub API client."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import Dict, Iterator, List, Tuple
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+@dataclass
+class GitHubLatencyHistogram:
+    """
+    Histogram of durations in seconds.
+
+    `counts[i]` is the number of observations less than or equal to `buckets[i]`
+    and greater than the previous bucket, the last count is for observations
+    greater than the last bucket.
+    """
+
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0
+
+    def __post_init__(self) -> None:
+        """Create the counts for the buckets."""
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the observations."""
+        return self.total / self.count if self.count else 0
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Observe the duration of the block, nothing is observed if it raises."""
+        started = time.monotonic()
+        yield
+        self.observe(time.monotonic() - started)
+
+    def copy(self) -> GitHubLatencyHistogram:
+        """Return a copy of the histogram."""
+        return GitHubLatencyHistogram(
+            buckets=self.buckets, counts=list(self.counts), count=self.count, total=self.total
+        )
+
+
+@dataclass
+class GitHubClientStats:
+    """
+    Statistics of the requests made by a client.
+
+    `requests` is keyed by the route template and then by the status,
+    every attempt of a request is counted.
+    `hedged` is the number of duplicate requests sent for slow requests.
+    `network_time` is the time from sending a request until the body is received,
+    `decode_time` is the time spent decoding bodies and
+    `model_time` is the time spent building models from the decoded data.
+    """
+
+    requests: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    bytes_received: int = 0
+    not_modified: int = 0
+    retries: int = 0
+    hedged: int = 0
+    exceptions: Dict[str, int] = field(default_factory=dict)
+    network_time: GitHubLatencyHistogram = field(default_factory=GitHubLatencyHistogram)
+    decode_time: GitHubLatencyHistogram = field(default_factory=GitHubLatencyHistogram)
+    model_time: GitHubLatencyHistogram = field(default_factory=GitHubLatencyHistogram)
+
+    def record_response(self, route: str, status: int) -> None:
+        """Count a response."""
+        statuses = self.requests.setdefault(route, {})
+        statuses[status] = statuses.get(status, 0) + 1
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Count an exception."""
+        name = type(exception).__name__
+        self.exceptions[name] = self.exceptions.get(name, 0) + 1
+
+    def snapshot(self) -> GitHubClientStats:
+        """Return a copy of the statistics."""
+        return GitHubClientStats(
+            requests={route: dict(statuses) for route, statuses in self.requests.items()},
+            bytes_received=self.bytes_received,
+            not_modified=self.not_modified,
+            retries=self.retries,
+            hedged=self.hedged,
+            exceptions=dict(self.exceptions),
+            network_time=self.network_time.copy(),
+            decode_time=self.decode_time.copy(),
+            model_time=self.model_time.copy(),
+        )
+
+    def reset(self) -> None:
+        """Reset all statistics."""
+        self.requests = {}
+        self.bytes_received = 0
+        self.not_modified = 0
+        self.retries = 0
+        self.hedged = 0
+        self.exceptions = {}
+        self.network_time = GitHubLatencyHistogram()
+        self.decode_time = GitHubLatencyHistogram()
+        self.model_time = GitHubLatencyHistogram()
@@ -0,0 +1,171 @@
+"""Per request timing for requests made by the GitHub API client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable
+
+import aiohttp
+
+from .models.base import GitHubBase
+
+
+@dataclass
+class GitHubRequestTiming:
+    """
+    Timing of the phases of a single request, all durations are in seconds.
+
+    A phase is None when it did not happen for the request, like `dns` and
+    `connect` when a pooled connection was reused.
+    """
+
+    method: str
+    url: str
+    route: str
+    status: int | None = None
+    exception: str | None = None
+    reused_connection: bool = False
+    bytes_received: int | None = None
+    queued: float | None = None
+    """Time spent waiting for a free connection in the connection pool."""
+    dns: float | None = None
+    """Time spent resolving the host."""
+    connect: float | None = None
+    """Time spent creating the connection, this includes the TLS handshake."""
+    ttfb: float | None = None
+    """Time from sending the request headers until the response headers arrived."""
+    transfer: float | None = None
+    """Time from the response headers until the body was received."""
+    total: float | None = None
+    """Time from the start of the request until it was finished."""
+    _marks: Dict[str, float] = field(default_factory=dict, repr=False, compare=False)
+
+    def mark(self, name: str) -> None:
+        """Mark the start of a phase."""
+        self._marks[name] = time.monotonic()
+
+    def elapsed(self, name: str) -> float | None:
+        """Return the time since a mark, or None if it was not marked."""
+        if (started := self._marks.get(name)) is None:
+            return None
+        return time.monotonic() - started
+
+    def body_received(self, size: int) -> None:
+        """Record that the response body was received."""
+        self.bytes_received = (self.bytes_received or 0) + size
+        self.transfer = self.elapsed("headers")
+
+
+class GitHubRequestTracer(GitHubBase):
+    """
+    Records the timing of the phases of each request and passes it to hooks.
+
+    The `trace_config` of the tracer needs to be part of the `trace_configs`
+    of the `aiohttp.ClientSession` used by the client, this is done for you
+    when the session is created by `aiogithubapi`.
+
+    **Arguments**:
+
+    `hooks` (Optional)
+
+    Callables that are called with a `GitHubRequestTiming` when a request is finished.
+    """
+
+    def __init__(
+        self,
+        hooks: Iterable[Callable[[GitHubRequestTiming], Any]] | None = None,
+    ) -> None:
+        """Initialise the request tracer."""
+        self.hooks = list(hooks or [])
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_connection_queued_start.append(self._mark("queued"))
+        self.trace_config.on_connection_queued_end.append(self._measure("queued"))
+        self.trace_config.on_dns_resolvehost_start.append(self._mark("dns"))
+        self.trace_config.on_dns_resolvehost_end.append(self._measure("dns"))
+        self.trace_config.on_connection_create_start.append(self._mark("connect"))
+        self.trace_config.on_connection_create_end.append(self._measure("connect"))
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        self.trace_config.on_request_headers_sent.append(self._mark("sent"))
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.on_response_chunk_received.append(self._on_response_chunk_received)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+
+    def start(self, method: str, url: str, route: str) -> GitHubRequestTiming:
+        """Return a new timing for a request, this is passed as the trace request context."""
+        timing = GitHubRequestTiming(method=method.upper(), url=url, route=route)
+        timing.mark("start")
+        return timing
+
+    def finish(self, timing: GitHubRequestTiming) -> None:
+        """Finish the timing and pass it to the hooks."""
+        timing.total = timing.elapsed("start")
+        for hook in self.hooks:
+            try:
+                hook(timing)
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception("Request timing hook %s failed", hook)
+
+    @staticmethod
+    def _timing(trace_config_ctx: SimpleNamespace) -> GitHubRequestTiming | None:
+        """Return the timing of a traced request, None for requests made by others."""
+        if isinstance(timing := trace_config_ctx.trace_request_ctx, GitHubRequestTiming):
+            return timing
+        return None
+
+    def _mark(self, name: str) -> Callable[..., Any]:
+        """Return a trace callback that marks the start of a phase."""
+
+        async def _callback(_session, trace_config_ctx: SimpleNamespace, _params) -> None:
+            if (timing := self._timing(trace_config_ctx)) is not None:
+                timing.mark(name)
+
+        return _callback
+
+    def _measure(self, name: str) -> Callable[..., Any]:
+        """Return a trace callback that records the duration of a phase."""
+
+        async def _callback(_session, trace_config_ctx: SimpleNamespace, _params) -> None:
+            if (timing := self._timing(trace_config_ctx)) is not None:
+                setattr(timing, name, timing.elapsed(name))
+
+        return _callback
+
+    async def _on_connection_reuseconn(
+        self,
+        _session: aiohttp.ClientSession,
+        trace_config_ctx: SimpleNamespace,
+        _params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        if (timing := self._timing(trace_config_ctx)) is not None:
+            timing.reused_connection = True
+
+    async def _on_request_end(
+        self,
+        _session: aiohttp.ClientSession,
+        trace_config_ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        if (timing := self._timing(trace_config_ctx)) is not None:
+            timing.status = params.response.status
+            timing.ttfb = timing.elapsed("sent")
+            timing.mark("headers")
+
+    async def _on_response_chunk_received(
+        self,
+        _session: aiohttp.ClientSession,
+        trace_config_ctx: SimpleNamespace,
+        params: aiohttp.TraceResponseChunkReceivedParams,
+    ) -> None:
+        if (timing := self._timing(trace_config_ctx)) is not None:
+            timing.body_received(len(params.chunk))
+
+    async def _on_request_exception(
+        self,
+        _session: aiohttp.ClientSession,
+        trace_config_ctx: SimpleNamespace,
+        params: aiohttp.TraceRequestExceptionParams,
+    ) -> None:
+        if (timing := self._timing(trace_config_ctx)) is not None:
+            timing.exception = type(params.exception).__name__
@@ -0,0 +1,308 @@
+"""Record and replay transport for requests made by the GitHub API client."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from enum import StrEnum
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Deque, Dict, List, Tuple
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .exceptions import GitHubException
+from .models.base import GitHubBase
+
+CASSETTE_VERSION = 1
+
+# Request headers that are never written to a cassette.
+UNRECORDED_HEADERS = frozenset({aiohttp.hdrs.AUTHORIZATION.lower()})
+
+
+class GitHubCassetteMode(StrEnum):
+    """Mode of a cassette transport."""
+
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class GitHubCassetteMatch(StrEnum):
+    """
+    How requests are matched to recorded interactions when replaying.
+
+    ORDERED:
+        Requests need to be made in the order they were recorded.
+    UNORDERED:
+        A request is matched to the first unused interaction with the same
+        method, URL, params, body and If-None-Match header, wherever it is
+        in the cassette.
+    """
+
+    ORDERED = "ordered"
+    UNORDERED = "unordered"
+
+
+@dataclass
+class GitHubCassetteInteraction:
+    """A recorded request and its response."""
+
+    method: str
+    url: str
+    params: Dict[str, str] = field(default_factory=dict)
+    body: str | None = None
+    request_headers: Dict[str, str] = field(default_factory=dict)
+    status: int = 200
+    headers: List[Tuple[str, str]] = field(default_factory=list)
+    response_body: str = ""
+    response_body_base64: bool = False
+    latency: float = 0
+    """Seconds from sending the request until the response body was received."""
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """Return the values a request is matched on."""
+        return (
+            self.method,
+            self.url,
+            tuple(sorted(self.params.items())),
+            self.body,
+            CIMultiDict(self.request_headers).get(aiohttp.hdrs.IF_NONE_MATCH),
+        )
+
+    @property
+    def content(self) -> bytes:
+        """Return the response body."""
+        if self.response_body_base64:
+            return base64.b64decode(self.response_body)
+        return self.response_body.encode("utf-8")
+
+    @classmethod
+    def from_request(cls, request_arguments: Dict[str, Any]) -> GitHubCassetteInteraction:
+        """Return an interaction without a response for the arguments of a request."""
+        if (body := request_arguments.get("json")) is not None:
+            body = json.dumps(body, sort_keys=True)
+        elif isinstance(body := request_arguments.get("data"), bytes):
+            body = body.decode("utf-8")
+        return cls(
+            method=str(request_arguments["method"]).upper(),
+            url=str(request_arguments["url"]),
+            params={
+                str(key): str(value)
+                for key, value in (request_arguments.get("params") or {}).items()
+            },
+            body=body,
+            request_headers={
+                str(key): str(value)
+                for key, value in (request_arguments.get("headers") or {}).items()
+                if str(key).lower() not in UNRECORDED_HEADERS
+            },
+        )
+
+
+class GitHubCassette(GitHubBase):
+    """
+    Recorded interactions that are stored as JSON in a file.
+
+    **Arguments**:
+
+    `path` (Optional)
+
+    The file of the cassette, it is loaded if it exists.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        """Initialise the cassette."""
+        self.path = path
+        self.interactions: List[GitHubCassetteInteraction] = []
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def load(self) -> None:
+        """Load the interactions from the file of the cassette."""
+        with open(self.path, encoding="utf-8") as file:
+            content = json.load(file)
+        if content.get("version") != CASSETTE_VERSION:
+            raise GitHubException(f"Unsupported cassette version {content.get('version')}")
+        self.interactions = [
+            GitHubCassetteInteraction(
+                **{**interaction, "headers": [tuple(header) for header in interaction["headers"]]}
+            )
+            for interaction in content["interactions"]
+        ]
+
+    def save(self) -> None:
+        """Write the interactions to the file of the cassette."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": CASSETTE_VERSION,
+                    "interactions": [asdict(interaction) for interaction in self.interactions],
+                },
+                file,
+                indent=2,
+            )
+
+
+class GitHubReplayStream:
+    """Replayed response body that is read in chunks."""
+
+    def __init__(self, content: bytes) -> None:
+        """Initialise the stream."""
+        self._content = content
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        """Yield the body in chunks of the given size."""
+        for start in range(0, len(self._content), size):
+            yield self._content[start : start + size]
+
+
+class GitHubReplayResponse:
+    """A response created from a recorded interaction, used in place of `aiohttp.ClientResponse`."""
+
+    def __init__(self, interaction: GitHubCassetteInteraction) -> None:
+        """Initialise the response."""
+        self.method = interaction.method
+        self.url = URL(interaction.url)
+        self.status = interaction.status
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        self._body = interaction.content
+
+    @property
+    def content(self) -> GitHubReplayStream:
+        """Return the body as a stream."""
+        return GitHubReplayStream(self._body)
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def text(self, encoding: str | None = None) -> str:
+        """Return the body as text."""
+        return self._body.decode(encoding or "utf-8")
+
+    async def json(self, encoding: str | None = None, **_: Any) -> Any:
+        """Return the body decoded as JSON."""
+        if not self._body.strip():
+            return None
+        return json.loads(self._body.decode(encoding or "utf-8"))
+
+    def release(self) -> None:
+        """Release the response, there is no connection to release."""
+
+
+class GitHubCassetteTransport(GitHubBase):
+    """
+    Records the requests made by the client to a cassette, or replays them from it.
+
+    When recording, requests are sent with the session of the client and
+    the status, headers, body and latency of every response is added to the
+    cassette, call `cassette.save()` to write it to its file afterwards.
+    When replaying, nothing is sent and responses come from the cassette.
+    The Authorization header is never recorded.
+
+    **Arguments**:
+
+    `cassette` (Required)
+
+    The `GitHubCassette` to record to or replay from.
+
+    `mode` (Optional)
+
+    A `GitHubCassetteMode`, defaults to replaying.
+
+    `match` (Optional)
+
+    A `GitHubCassetteMatch` used when replaying, defaults to matching
+    requests regardless of the order they are made in.
+
+    `latency_scale` (Optional)
+
+    When set, replayed responses are delayed by their recorded latency
+    multiplied by this, 1 replays at the recorded speed. Defaults to no delay.
+    """
+
+    def __init__(
+        self,
+        cassette: GitHubCassette,
+        mode: GitHubCassetteMode = GitHubCassetteMode.REPLAY,
+        *,
+        match: GitHubCassetteMatch = GitHubCassetteMatch.UNORDERED,
+        latency_scale: float | None = None,
+    ) -> None:
+        """Initialise the transport."""
+        self.cassette = cassette
+        self.mode = mode
+        self.match = match
+        self.latency_scale = latency_scale
+        self._position = 0
+        self._unused: Dict[Tuple[Any, ...], Deque[GitHubCassetteInteraction]] | None = None
+
+    def rewind(self) -> None:
+        """Make all recorded interactions available to be replayed again."""
+        self._position = 0
+        self._unused = None
+
+    async def async_request(
+        self,
+        session: aiohttp.ClientSession,
+        request_arguments: Dict[str, Any],
+    ) -> GitHubReplayResponse:
+        """Record or replay a request."""
+        interaction = GitHubCassetteInteraction.from_request(request_arguments)
+        if self.mode == GitHubCassetteMode.RECORD:
+            return await self._async_record(session, request_arguments, interaction)
+
+        recorded = self._find(interaction)
+        if self.latency_scale:
+            await asyncio.sleep(recorded.latency * self.latency_scale)
+        return GitHubReplayResponse(recorded)
+
+    async def _async_record(
+        self,
+        session: aiohttp.ClientSession,
+        request_arguments: Dict[str, Any],
+        interaction: GitHubCassetteInteraction,
+    ) -> GitHubReplayResponse:
+        """Send the request and add the response to the cassette."""
+        started = time.monotonic()
+        result = await session.request(**request_arguments)
+        try:
+            body = await result.read()
+        finally:
+            result.release()
+        interaction.latency = time.monotonic() - started
+        interaction.status = result.status
+        interaction.headers = list(result.headers.items())
+        try:
+            interaction.response_body = body.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction.response_body = base64.b64encode(body).decode("ascii")
+            interaction.response_body_base64 = True
+        self.cassette.interactions.append(interaction)
+        return GitHubReplayResponse(interaction)
+
+    def _find(self, interaction: GitHubCassetteInteraction) -> GitHubCassetteInteraction:
+        """Return the recorded interaction for a request."""
+        interactions = self.cassette.interactions
+        if self.match == GitHubCassetteMatch.ORDERED:
+            if self._position < len(interactions):
+                recorded = interactions[self._position]
+                if recorded.key == interaction.key:
+                    self._position += 1
+                    return recorded
+        else:
+            if self._unused is None:
+                self._unused = {}
+                for recorded in interactions:
+                    self._unused.setdefault(recorded.key, deque()).append(recorded)
+            if unused := self._unused.get(interaction.key):
+                return unused.popleft()
+        raise GitHubException(
+            f"No recorded response for {interaction.method} {interaction.url} in the cassette"
+        )
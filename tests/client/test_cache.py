@@ -0,0 +1,177 @@
+"""Test client cache"""
+# pylint: disable=missing-docstring,protected-access
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubNotModifiedException
+from aiogithubapi.cache import (
+    GitHubCacheBackend,
+    GitHubCacheEntry,
+    GitHubMemoryCache,
+    GitHubSQLiteCache,
+    cache_key,
+)
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg
+
+from tests.common import EXPECTED_ETAG, HEADERS, TOKEN, MockedRequests, MockResponse
+
+
+@pytest.mark.asyncio
+async def test_cache_revalidation(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    cache = GitHubMemoryCache()
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.CACHE: cache}
+    ) as github:
+        response = await github.repos.get("octocat/hello-world")
+        assert response.status == 200
+        assert "If-None-Match" not in mock_requests.last_request["headers"]
+        assert len(cache) == 1
+
+        mock_response.mock_status = 304
+        mock_response.mock_headers = {"X-RateLimit-Remaining": "4998"}
+        response = await github.repos.get("octocat/hello-world")
+        assert mock_requests.last_request["headers"]["If-None-Match"] == EXPECTED_ETAG
+        assert response.status == 304
+        assert response.data.name == "Hello-World"
+        assert response.etag == EXPECTED_ETAG
+        assert response.headers.x_ratelimit_remaining == "4998"
+        assert response.next_page_number == 3
+        assert mock_requests.called == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_bypassed(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    cache = GitHubMemoryCache()
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.CACHE: cache}
+    ) as github:
+        await github.generic("/generic", **{GitHubRequestKwarg.METHOD: "POST"})
+        assert len(cache) == 0
+
+        await github.generic("/generic")
+        assert len(cache) == 1
+
+        mock_response.mock_status = 304
+        with pytest.raises(GitHubNotModifiedException) as exception:
+            await github.generic("/generic", **{GitHubRequestKwarg.ETAG: "other"})
+        assert mock_requests.last_request["headers"]["If-None-Match"] == "other"
+        assert exception.value.headers.etag == EXPECTED_ETAG
+
+    mock_response.clear()
+    mock_response.mock_headers = {**HEADERS, "Etag": None}
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.CACHE: cache}
+    ) as github:
+        await github.generic("/no-etag")
+        assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_eviction():
+    cache = GitHubMemoryCache(max_entries=2)
+    for key in ("a", "b"):
+        await cache.async_set(key, GitHubCacheEntry(etag=key, data=key))
+    assert (await cache.async_get("a")).data == "a"
+
+    await cache.async_set("c", GitHubCacheEntry(etag="c", data="c"))
+    assert await cache.async_get("b") is None
+    assert len(cache) == 2
+
+    await cache.async_delete("a")
+    assert await cache.async_get("a") is None
+    await cache.async_clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = GitHubSQLiteCache(path)
+    await cache.async_set(
+        "key", GitHubCacheEntry(etag="etag", data={"name": "Hello-World"}, headers={"Link": "x"})
+    )
+    await cache.async_close()
+
+    cache = GitHubSQLiteCache(path)
+    entry = await cache.async_get("key")
+    assert entry == GitHubCacheEntry(
+        etag="etag", data={"name": "Hello-World"}, headers={"Link": "x"}
+    )
+    assert await cache.async_get("missing") is None
+
+    await cache.async_delete("key")
+    assert await cache.async_get("key") is None
+
+    await cache.async_set("key", GitHubCacheEntry(etag="etag", data="data"))
+    await cache.async_clear()
+    assert await cache.async_get("key") is None
+    await cache.async_close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_eviction(tmp_path):
+    cache = GitHubSQLiteCache(tmp_path / "cache.db", max_bytes=60)
+    await cache.async_set("a", GitHubCacheEntry(etag="a", data="a" * 20))
+    await cache.async_set("b", GitHubCacheEntry(etag="b", data="b" * 20))
+    assert await cache.async_get("a") is not None
+
+    await cache.async_set("c", GitHubCacheEntry(etag="c", data="c" * 20))
+    assert await cache.async_get("b") is None
+    assert await cache.async_get("a") is not None
+    assert await cache.async_get("c") is not None
+
+    await cache.async_set("d", GitHubCacheEntry(etag="d", data="d" * 100))
+    assert await cache.async_get("d") is None
+    await cache.async_close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_reopen(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = GitHubSQLiteCache(path, max_bytes=60)
+    await cache.async_set("a", GitHubCacheEntry(etag="a", data="a" * 20))
+    await cache.async_set("b", GitHubCacheEntry(etag="b", data="b" * 20))
+    await cache.async_set("b", GitHubCacheEntry(etag="b", data="b" * 20))
+    assert cache._total == 52
+    assert await cache.async_get("a") is not None
+    # The access time is written when the cache is closed
+    await cache.async_close()
+
+    cache = GitHubSQLiteCache(path, max_bytes=60)
+    await cache.async_set("c", GitHubCacheEntry(etag="c", data="c" * 20))
+    assert cache._total == 52
+    assert await cache.async_get("b") is None
+    assert await cache.async_get("a") is not None
+
+    await cache.async_delete("a")
+    assert cache._total == 26
+    await cache.async_close()
+
+
+def test_incomplete_cache_backend():
+    class IncompleteCache(GitHubCacheBackend):
+        async def async_get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteCache()
+
+
+def test_cache_key():
+    assert cache_key("get", "https://api.github.com/a", {"b": 2, "a": 1}, "json") == (
+        "GET https://api.github.com/a?a=1&b=2 json"
+    )
+    assert cache_key("get", "https://api.github.com/a", {"a": 1, "b": 2}, "json") == cache_key(
+        "GET", "https://api.github.com/a", {"b": 2, "a": 1}, "json"
+    )
+    assert cache_key("get", "https://api.github.com/a", None, "raw") != cache_key(
+        "get", "https://api.github.com/a", None, "json"
+    )
@@ -0,0 +1,81 @@
+"""Test circuit breaker"""
+# pylint: disable=missing-docstring,protected-access
+import time
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubCircuitOpenException
+from aiogithubapi.circuit import GitHubCircuitBreaker, GitHubCircuitState
+from aiogithubapi.const import GitHubClientKwarg
+
+from tests.common import TEST_REPOSITORY_NAME, TOKEN, MockedRequests, MockResponse
+
+
+def test_circuit_breaker_states():
+    breaker = GitHubCircuitBreaker(failure_threshold=2, cooldown=30)
+    now = time.monotonic()
+
+    group = breaker.before_request("/generic")
+    assert group == "/generic"
+    breaker.record(group, failed=True)
+    assert breaker.state(group) == GitHubCircuitState.CLOSED
+    breaker.record(group, failed=False)
+    breaker.record(group, failed=True)
+    assert breaker.state(group) == GitHubCircuitState.CLOSED
+    breaker.record(group, failed=True)
+    assert breaker.state(group) == GitHubCircuitState.OPEN
+
+    with pytest.raises(GitHubCircuitOpenException):
+        breaker.before_request("/generic")
+
+    with patch("aiogithubapi.circuit.time.monotonic", return_value=now + 31):
+        assert breaker.state(group) == GitHubCircuitState.HALF_OPEN
+        breaker.before_request("/generic")
+        with pytest.raises(GitHubCircuitOpenException):
+            breaker.before_request("/generic")
+        breaker.record(group, failed=True)
+        assert breaker.state(group) == GitHubCircuitState.OPEN
+
+    with patch("aiogithubapi.circuit.time.monotonic", return_value=now + 62):
+        breaker.before_request("/generic")
+        breaker.release(group)
+        breaker.before_request("/generic")
+        breaker.record(group, failed=False)
+        assert breaker.state(group) == GitHubCircuitState.CLOSED
+        assert breaker.circuit(group).failures == 0
+
+
+def test_circuit_breaker_groups():
+    breaker = GitHubCircuitBreaker(groups=["/repos/*/git/*"])
+    assert breaker.group("/repos/octocat/hello-world/git/trees/main") == "/repos/*/git/*"
+    assert breaker.group("/repos/octocat/hello-world") == "/repos/octocat/hello-world"
+
+
+@pytest.mark.asyncio
+async def test_client_with_circuit_breaker(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    breaker = GitHubCircuitBreaker(failure_threshold=2, cooldown=30)
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.CIRCUIT_BREAKER: breaker}
+    ) as github:
+        mock_response.mock_status = 502
+        for _ in range(2):
+            await github.repos.get(TEST_REPOSITORY_NAME)
+        assert breaker.state("/repos/{repository}") == GitHubCircuitState.OPEN
+
+        with pytest.raises(GitHubCircuitOpenException):
+            await github.repos.get("octocat/other")
+        assert mock_requests.called == 2
+
+        mock_response.clear()
+        await github.generic("/generic")
+        assert mock_requests.called == 3
+
+        with patch("aiogithubapi.circuit.time.monotonic", return_value=time.monotonic() + 31):
+            await github.repos.get(TEST_REPOSITORY_NAME)
+        assert breaker.state("/repos/{repository}") == GitHubCircuitState.CLOSED
@@ -0,0 +1,65 @@
+"""Test coalescing of identical requests"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubNotFoundException, GitHubRepositoryModel
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg
+
+from tests.common import TOKEN, MockedRequests, MockResponse
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+):
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.COALESCE: True}
+    ) as github:
+        responses = await asyncio.gather(
+            *(github.repos.get("octocat/hello-world") for _ in range(10))
+        )
+        assert mock_requests.called == 1
+        assert len({id(response) for response in responses}) == 10
+        for response in responses:
+            assert isinstance(response.data, GitHubRepositoryModel)
+            assert response.data.name == "Hello-World"
+        assert github._client._inflight == {}
+
+        await asyncio.gather(
+            github.repos.get("octocat/hello-world"),
+            github.repos.get("octocat/hello-world", **{GitHubRequestKwarg.PARAMS: {"a": 1}}),
+            github.generic("/generic", **{GitHubRequestKwarg.METHOD: "POST"}),
+            github.generic("/generic", **{GitHubRequestKwarg.METHOD: "POST"}),
+        )
+        assert mock_requests.called == 5
+
+
+@pytest.mark.asyncio
+async def test_coalesced_errors_reach_all_callers(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    mock_response.mock_status = 404
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.COALESCE: True}
+    ) as github:
+        results = await asyncio.gather(
+            *(github.repos.get("octocat/hello-world") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert mock_requests.called == 1
+        assert all(isinstance(result, GitHubNotFoundException) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_requests_are_not_coalesced_by_default(
+    github_api: GitHubAPI,
+    mock_requests: MockedRequests,
+):
+    await asyncio.gather(*(github_api.repos.get("octocat/hello-world") for _ in range(3)))
+    assert mock_requests.called == 3
@@ -0,0 +1,146 @@
+"""Test hedged requests"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubException
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg
+from aiogithubapi.hedging import GitHubHedgingPolicy
+
+from tests.common import TOKEN, MockResponse
+
+
+def _policy(**kwargs) -> GitHubHedgingPolicy:
+    policy = GitHubHedgingPolicy(min_samples=4, **kwargs)
+    for _ in range(4):
+        policy.record(0.01, hedged=False)
+    return policy
+
+
+def test_hedging_policy():
+    with pytest.raises(GitHubException):
+        GitHubHedgingPolicy(percentile=0)
+
+    policy = GitHubHedgingPolicy(percentile=50, max_ratio=0.25, window=4, min_samples=2)
+    assert policy.delay() is None
+    policy.record(0.1, hedged=False)
+    policy.record(0.3, hedged=False)
+    assert policy.delay() == 0.1
+    policy.record(0.2, hedged=False)
+    assert policy.delay() == 0.2
+
+    assert policy.allow_hedge()
+    policy.record(0.4, hedged=True)
+    assert policy.hedged_ratio == 0.25
+    assert not policy.allow_hedge()
+
+    # The hedged request leaves the window
+    for _ in range(4):
+        policy.record(0.1, hedged=False)
+    assert policy.hedged_ratio == 0
+    assert policy.allow_hedge()
+
+@pytest.mark.asyncio
+async def test_hedged_request(client_session: ClientSession):
+    policy = _policy(max_ratio=0.5)
+    slow = asyncio.Event()
+    slow_cancelled = asyncio.Event()
+    calls = 0
+
+    async def _request(*_, **__):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await slow.wait()
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+            return MockResponse(mock_data={"request": "primary"})
+        return MockResponse(mock_data={"request": "hedge"})
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.HEDGING_POLICY: policy}
+    ) as github:
+        with patch("aiohttp.ClientSession.request", side_effect=_request):
+            response = await github.generic("/generic", **{GitHubRequestKwarg.HEDGE: True})
+            assert response.data == {"request": "hedge"}
+            assert calls == 2
+            await asyncio.wait_for(slow_cancelled.wait(), 1)
+            assert github.stats().hedged == 1
+            assert policy.hedged_ratio == 0.2
+
+            # Over the ratio, the request is not hedged
+            calls = 0
+            slow.set()
+            response = await github.generic("/generic", **{GitHubRequestKwarg.HEDGE: True})
+            assert response.data == {"request": "primary"}
+            assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_not_opted_in(client_session: ClientSession):
+    policy = _policy(max_ratio=1)
+    calls = 0
+
+    async def _request(*_, **__):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return MockResponse()
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.HEDGING_POLICY: policy}
+    ) as github:
+        with patch("aiohttp.ClientSession.request", side_effect=_request):
+            await github.generic("/generic")
+            assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_first_failure(client_session: ClientSession):
+    policy = _policy(max_ratio=1)
+    calls = 0
+
+    async def _request(*_, **__):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.05)
+            raise asyncio.TimeoutError
+        await asyncio.sleep(0.1)
+        return MockResponse()
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.HEDGING_POLICY: policy}
+    ) as github:
+        with patch("aiohttp.ClientSession.request", side_effect=_request):
+            response = await github.generic("/generic", **{GitHubRequestKwarg.HEDGE: True})
+            assert response.status == 200
+            assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_warming_up(client_session: ClientSession):
+    policy = GitHubHedgingPolicy(max_ratio=1, min_samples=3)
+    calls = 0
+
+    async def _request(*_, **__):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return MockResponse()
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.HEDGING_POLICY: policy}
+    ) as github:
+        with patch("aiohttp.ClientSession.request", side_effect=_request):
+            # Too few latencies to know when a request is slow, nothing is hedged
+            for _ in range(3):
+                await github.generic("/generic", **{GitHubRequestKwarg.HEDGE: True})
+            assert calls == 3
+            assert github.stats().hedged == 0
+            assert policy.delay() is not None
@@ -0,0 +1,49 @@
+"""Test JSON decoder"""
+# pylint: disable=missing-docstring,protected-access
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubException
+from aiogithubapi.const import GitHubClientKwarg
+from aiogithubapi.helpers import fast_json_decoder
+
+from tests.common import TOKEN, MockResponse
+
+
+def test_fast_json_decoder():
+    assert fast_json_decoder()(b'{"key": "value"}') == {"key": "value"}
+
+    with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+        assert fast_json_decoder() is json.loads
+
+    orjson = MagicMock()
+    with patch.dict(sys.modules, {"orjson": orjson}):
+        assert fast_json_decoder() is orjson.loads
+
+
+@pytest.mark.asyncio
+async def test_client_with_json_decoder(
+    client_session: ClientSession,
+    mock_response: MockResponse,
+):
+    decoder = MagicMock(side_effect=json.loads)
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.JSON_DECODER: decoder}
+    ) as github:
+        mock_response.mock_content = b'{"key": "value"}'
+        response = await github.generic("/generic")
+        assert response.data == {"key": "value"}
+        decoder.assert_called_once_with(b'{"key": "value"}')
+
+        mock_response.mock_content = b""
+        response = await github.generic("/generic")
+        assert response.data is None
+        assert decoder.call_count == 1
+
+        mock_response.mock_content = b"{not json"
+        with pytest.raises(GitHubException, match="Could not handle response data"):
+            await github.generic("/generic")
@@ -0,0 +1,74 @@
+"""Test lazy response data"""
+# pylint: disable=missing-docstring,protected-access
+import json
+from unittest.mock import MagicMock
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import (
+    GitHubAPI,
+    GitHubException,
+    GitHubNotFoundException,
+    GitHubRepositoryModel,
+)
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg
+
+from tests.common import HEADERS_TEXT, TEST_REPOSITORY_NAME, TOKEN, MockResponse
+
+
+@pytest.mark.asyncio
+async def test_lazy_data(client_session: ClientSession, mock_response: MockResponse):
+    decoder = MagicMock(side_effect=json.loads)
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.JSON_DECODER: decoder}
+    ) as github:
+        mock_response.mock_content = b'{"name": "Hello-World"}'
+        response = await github.repos.get(
+            TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.LAZY_DATA: True}
+        )
+        assert response.status == 200
+        assert response.etag is not None
+        assert response.data_deferred
+        decoder.assert_not_called()
+
+        assert isinstance(response.data, GitHubRepositoryModel)
+        assert response.data.name == "Hello-World"
+        assert not response.data_deferred
+        decoder.assert_called_once()
+
+        response = await github.repos.get(TEST_REPOSITORY_NAME)
+        assert not response.data_deferred
+        assert decoder.call_count == 2
+
+        response = await github.repos.get(
+            TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.LAZY_DATA: True}
+        )
+        as_dict = response.as_dict
+        assert set(as_dict) == {"headers", "status", "data"}
+        assert as_dict["status"] == 200
+        assert as_dict["data"]["name"] == "Hello-World"
+
+
+@pytest.mark.asyncio
+async def test_lazy_data_errors(client_session: ClientSession, mock_response: MockResponse):
+    async with GitHubAPI(TOKEN, session=client_session) as github:
+        mock_response.mock_status = 404
+        mock_response.mock_data = {"message": "Not Found"}
+        with pytest.raises(GitHubNotFoundException):
+            await github.generic("/generic", **{GitHubRequestKwarg.LAZY_DATA: True})
+
+        mock_response.clear()
+        mock_response.mock_content = b"{not json"
+        response = await github.generic("/generic", **{GitHubRequestKwarg.LAZY_DATA: True})
+        with pytest.raises(GitHubException, match="Could not handle response data"):
+            response.data  # pylint: disable=pointless-statement
+        assert response.data_deferred
+
+        mock_response.mock_headers = HEADERS_TEXT
+        mock_response.mock_content = b"Hello"
+        response = await github.generic("/generic", **{GitHubRequestKwarg.LAZY_DATA: True})
+        assert response.data_deferred
+        assert response.data == "Hello"
+        response.data = "replaced"
+        assert response.data == "replaced"
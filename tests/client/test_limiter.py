@@ -0,0 +1,89 @@
+"""Test concurrency limiter"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI
+from aiogithubapi.const import GitHubClientKwarg
+from aiogithubapi.limiter import GitHubConcurrencyLimiter, GitHubConcurrencyLimiterStats
+
+from tests.common import TOKEN, MockResponse
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter(client_session: ClientSession):
+    limiter = GitHubConcurrencyLimiter(3, group_limits={"/search/*": 1})
+    release = asyncio.Event()
+    max_in_flight = 0
+
+    async def _request(*_, **__):
+        nonlocal max_in_flight
+        max_in_flight = max(max_in_flight, limiter.stats.in_flight)
+        await release.wait()
+        return MockResponse()
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.CONCURRENCY_LIMITER: limiter}
+    ) as github:
+        with patch("aiohttp.ClientSession.request", side_effect=_request):
+            tasks = [asyncio.create_task(github.generic(f"/generic/{idx}")) for idx in range(5)]
+            await asyncio.sleep(0)
+            assert limiter.stats.in_flight == 3
+            assert limiter.stats.waiting == 2
+
+            release.set()
+            await asyncio.gather(*tasks)
+            assert max_in_flight == 3
+            assert limiter.stats.in_flight == 0
+            assert limiter.stats.waiting == 0
+            assert limiter.stats.acquired == 5
+            assert limiter.stats.max_wait > 0
+
+            release.clear()
+            tasks = [asyncio.create_task(github.generic(f"/search/{idx}")) for idx in range(3)]
+            tasks.append(asyncio.create_task(github.generic("/generic")))
+            await asyncio.sleep(0)
+            assert limiter.stats.in_flight == 2
+            assert limiter.stats.waiting == 2
+
+            release.set()
+            await asyncio.gather(*tasks)
+
+    limiter.reset_stats()
+    assert limiter.stats == GitHubConcurrencyLimiterStats()
+    assert limiter.stats.average_wait == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter_cancelled_while_waiting():
+    limiter = GitHubConcurrencyLimiter(1)
+
+    async def _hold(event: asyncio.Event):
+        async with limiter.async_slot("/generic"):
+            await event.wait()
+
+    event = asyncio.Event()
+    first = asyncio.create_task(_hold(event))
+    second = asyncio.create_task(_hold(event))
+    await asyncio.sleep(0)
+    assert limiter.stats.waiting == 1
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert limiter.stats.waiting == 0
+
+    event.set()
+    await first
+    assert limiter.stats.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_group_only_limiter():
+    limiter = GitHubConcurrencyLimiter(None, group_limits={"/search/*": 1})
+    async with limiter.async_slot("/generic"):
+        async with limiter.async_slot("/generic"):
+            assert limiter.stats.in_flight == 2
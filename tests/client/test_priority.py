@@ -0,0 +1,121 @@
+"""Test priority scheduling"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg, GitHubRequestPriority
+from aiogithubapi.priority import GitHubPriorityScheduler
+
+from tests.common import TOKEN, MockResponse
+
+
+async def _hold(scheduler: GitHubPriorityScheduler, priority, name, order, release):
+    async with scheduler.async_slot(priority):
+        order.append(name)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_priority_scheduler():
+    scheduler = GitHubPriorityScheduler(1, min_share=0.25, window=4)
+    order = []
+    release = asyncio.Event()
+    release.set()
+
+    blocker = asyncio.Event()
+    first = asyncio.create_task(_hold(scheduler, GitHubRequestPriority.LOW, "first", order, blocker))
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(_hold(scheduler, GitHubRequestPriority.LOW, f"low{idx}", order, release))
+        for idx in range(3)
+    ]
+    tasks += [
+        asyncio.create_task(_hold(scheduler, GitHubRequestPriority.HIGH, f"high{idx}", order, release))
+        for idx in range(5)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.in_flight == 1
+    assert scheduler.waiting() == 8
+    assert scheduler.waiting(GitHubRequestPriority.HIGH) == 5
+
+    blocker.set()
+    await asyncio.gather(first, *tasks)
+    # High requests go first, low requests keep a quarter of the slots
+    assert order == [
+        "first",
+        "high0",
+        "high1",
+        "high2",
+        "high3",
+        "low0",
+        "high4",
+        "low1",
+        "low2",
+    ]
+    assert scheduler.in_flight == 0
+    assert scheduler.waiting() == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_scheduler_cancelled():
+    scheduler = GitHubPriorityScheduler(1)
+    order = []
+    blocker = asyncio.Event()
+    release = asyncio.Event()
+    release.set()
+
+    first = asyncio.create_task(_hold(scheduler, GitHubRequestPriority.NORMAL, "first", order, blocker))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(_hold(scheduler, GitHubRequestPriority.HIGH, "cancelled", order, release))
+    waiting = asyncio.create_task(_hold(scheduler, GitHubRequestPriority.LOW, "waiting", order, release))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.waiting() == 1
+
+    blocker.set()
+    await asyncio.gather(first, waiting)
+    assert order == ["first", "waiting"]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_request_kwarg(client_session: ClientSession):
+    scheduler = GitHubPriorityScheduler(1, min_share=0)
+    release = asyncio.Event()
+    order = []
+
+    async def _request(*_, url, **__):
+        order.append(url.rsplit("/", 1)[-1])
+        await release.wait()
+        return MockResponse()
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.PRIORITY_SCHEDULER: scheduler}
+    ) as github:
+        with patch("aiohttp.ClientSession.request", side_effect=_request):
+            tasks = [
+                asyncio.create_task(
+                    github.generic(
+                        f"/crawl/{idx}", **{GitHubRequestKwarg.PRIORITY: GitHubRequestPriority.LOW}
+                    )
+                )
+                for idx in range(3)
+            ]
+            tasks.append(asyncio.create_task(github.generic("/normal")))
+            tasks.append(
+                asyncio.create_task(
+                    github.generic(
+                        "/interactive", **{GitHubRequestKwarg.PRIORITY: GitHubRequestPriority.HIGH}
+                    )
+                )
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*tasks)
+
+    assert order == ["0", "interactive", "normal", "1", "2"]
@@ -0,0 +1,149 @@
+"""Test rate limit scheduler"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubResponseHeadersModel
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestPriority
+from aiogithubapi.ratelimit import GitHubRateLimitScheduler
+
+from tests.common import HEADERS, TOKEN, MockResponse
+
+
+def _headers(remaining: int, reset: float, resource: str = "core") -> GitHubResponseHeadersModel:
+    return GitHubResponseHeadersModel(
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+            "X-RateLimit-Resource": resource,
+        }
+    )
+
+
+def test_resource_for_endpoint():
+    assert GitHubRateLimitScheduler.resource_for_endpoint("/repos/octocat/hello-world") == "core"
+    assert GitHubRateLimitScheduler.resource_for_endpoint("/graphql") == "graphql"
+    assert GitHubRateLimitScheduler.resource_for_endpoint("/search/issues") == "search"
+    assert GitHubRateLimitScheduler.resource_for_endpoint("/search/code") == "code_search"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_state(asyncio_sleep: AsyncMock):
+    scheduler = GitHubRateLimitScheduler()
+    reset = time.time() + 100
+
+    await scheduler.async_acquire("core")
+    scheduler.update("core", _headers(10, reset))
+    scheduler.release("core")
+    assert scheduler.states["core"].remaining == 10
+    assert scheduler.states["core"].limit == 5000
+
+    scheduler.update("core", _headers(12, reset))
+    assert scheduler.states["core"].remaining == 10
+
+    scheduler.update("core", _headers(4999, reset + 3600))
+    assert scheduler.states["core"].remaining == 4999
+
+    scheduler.update("core", GitHubResponseHeadersModel({}))
+    assert scheduler.states["core"].remaining == 4999
+    asyncio_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_holds_when_exhausted(asyncio_sleep: AsyncMock):
+    scheduler = GitHubRateLimitScheduler(reserve=1)
+    reset = time.time() + 100
+    scheduler.update("core", _headers(2, reset))
+
+    await scheduler.async_acquire("core")
+    asyncio_sleep.assert_not_called()
+    assert scheduler.states["core"].available == 1
+
+    await scheduler.async_acquire("core")
+    asyncio_sleep.assert_called_once()
+    assert 99 < asyncio_sleep.call_args[0][0] <= 101
+    assert scheduler.states["core"].remaining is None
+    assert scheduler.states["core"].inflight == 2
+
+    scheduler.release("core")
+    scheduler.release("core")
+    scheduler.release("core")
+    assert scheduler.states["core"].inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_pacing(asyncio_sleep: AsyncMock):
+    scheduler = GitHubRateLimitScheduler(pace_below=100)
+    scheduler.update("search", _headers(10, time.time() + 100, "search"))
+
+    await scheduler.async_acquire("search")
+    asyncio_sleep.assert_not_called()
+    await scheduler.async_acquire("search")
+    asyncio_sleep.assert_called_once()
+    assert 9 < asyncio_sleep.call_args[0][0] <= 10
+
+
+@pytest.mark.asyncio
+async def test_scheduler_pacing_priority():
+    scheduler = GitHubRateLimitScheduler(pace_below=100)
+    scheduler.update("core", _headers(10, time.time() + 0.3))
+    await scheduler.async_acquire("core")
+    order = []
+
+    async def _acquire(name, priority):
+        await scheduler.async_acquire("core", priority)
+        order.append(name)
+
+    tasks = {}
+    for name, priority in (
+        ("low0", GitHubRequestPriority.LOW),
+        ("low1", GitHubRequestPriority.LOW),
+        ("cancelled", GitHubRequestPriority.HIGH),
+        ("low2", GitHubRequestPriority.LOW),
+        ("high", GitHubRequestPriority.HIGH),
+    ):
+        tasks[name] = asyncio.create_task(_acquire(name, priority))
+        await asyncio.sleep(0)
+    tasks.pop("cancelled").cancel()
+
+    await asyncio.gather(*tasks.values())
+    # The high priority request gets the next paced slot
+    assert order == ["high", "low0", "low1", "low2"]
+    assert scheduler.states["core"].inflight == 5
+    assert not scheduler.states["core"].waiters
+
+
+@pytest.mark.asyncio
+async def test_client_with_scheduler(
+    client_session: ClientSession,
+    mock_response: MockResponse,
+    asyncio_sleep: AsyncMock,
+):
+    scheduler = GitHubRateLimitScheduler()
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.RATE_LIMIT_SCHEDULER: scheduler}
+    ) as github:
+        mock_response.mock_headers = {
+            **HEADERS,
+            "X-RateLimit-Remaining": "1",
+            "X-RateLimit-Reset": str(int(time.time()) + 60),
+        }
+        await github.repos.get("octocat/hello-world")
+        assert scheduler.states["core"].remaining == 1
+        assert scheduler.states["core"].inflight == 0
+
+        mock_response.mock_headers = {
+            **HEADERS,
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 60),
+        }
+        await github.repos.get("octocat/hello-world")
+        asyncio_sleep.assert_not_called()
+
+        await github.repos.get("octocat/hello-world")
+        asyncio_sleep.assert_called_once()
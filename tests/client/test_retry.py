@@ -0,0 +1,216 @@
+"""Test retry policy"""
+# pylint: disable=missing-docstring,protected-access
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import (
+    GitHubAPI,
+    GitHubConnectionException,
+    GitHubRatelimitException,
+    GitHubResponseHeadersModel,
+)
+from aiogithubapi.circuit import GitHubCircuitBreaker
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg, HttpMethod
+from aiogithubapi.retry import GitHubRetryPolicy
+
+from tests.common import HEADERS, HEADERS_RATELIMITED, TOKEN, MockResponse
+
+
+def test_retry_policy_backoff():
+    policy = GitHubRetryPolicy(jitter=False, backoff_factor=1, backoff_max=5)
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+    policy = GitHubRetryPolicy(backoff_factor=1)
+    for _ in range(20):
+        assert 0 <= policy.backoff(3) <= 4
+
+
+def test_retry_policy_retry_delay():
+    policy = GitHubRetryPolicy(jitter=False, max_attempts=3, max_elapsed=10)
+    started = time.monotonic()
+    assert policy.retry_delay(method="get", attempt=1, started=started) == 1
+    assert policy.retry_delay(method="get", attempt=1, started=started, status=502) == 1
+    assert policy.retry_delay(method="get", attempt=3, started=started) is None
+    assert policy.retry_delay(method="post", attempt=1, started=started) is None
+    assert policy.retry_delay(method="get", attempt=1, started=started, status=404) is None
+    assert policy.retry_delay(method="get", attempt=1, started=started - 10) is None
+
+    headers = GitHubResponseHeadersModel({"Retry-After": "5"})
+    assert (
+        policy.retry_delay(method="get", attempt=1, started=started, status=403, headers=headers)
+        == 5
+    )
+    assert (
+        policy.retry_delay(method="get", attempt=1, started=started, status=429, headers=headers)
+        == 5
+    )
+
+    headers = GitHubResponseHeadersModel(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 3)}
+    )
+    assert (
+        3
+        < policy.retry_delay(method="get", attempt=1, started=started, status=403, headers=headers)
+        <= 4
+    )
+
+    headers = GitHubResponseHeadersModel(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 3600)}
+    )
+    assert (
+        policy.retry_delay(method="get", attempt=1, started=started, status=403, headers=headers)
+        is None
+    )
+
+    headers = GitHubResponseHeadersModel({"Retry-After": "5"})
+    policy = GitHubRetryPolicy(retry_rate_limited=False)
+    assert (
+        policy.retry_delay(method="get", attempt=1, started=started, status=403, headers=headers)
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_connection_errors(client_session: ClientSession, asyncio_sleep: AsyncMock):
+    async with GitHubAPI(
+        TOKEN,
+        session=client_session,
+        **{GitHubClientKwarg.RETRY_POLICY: GitHubRetryPolicy(max_attempts=3)},
+    ) as github:
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[aiohttp.ClientError("client_error"), MockResponse()],
+        ) as request:
+            response = await github.generic("/generic")
+            assert response.status == 200
+            assert request.call_count == 2
+            assert asyncio_sleep.call_count == 1
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=aiohttp.ClientError("client_error"),
+        ) as request:
+            with pytest.raises(GitHubConnectionException):
+                await github.generic("/generic")
+            assert request.call_count == 3
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=aiohttp.ClientError("client_error"),
+        ) as request:
+            with pytest.raises(GitHubConnectionException):
+                await github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST})
+            assert request.call_count == 1
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=aiohttp.ClientError("client_error"),
+        ) as request:
+            with pytest.raises(GitHubConnectionException):
+                await github.generic("/generic", **{GitHubRequestKwarg.RETRY_POLICY: None})
+            assert request.call_count == 1
+
+
+class DroppedBodyResponse(MockResponse):
+    async def read(self, **_):
+        raise aiohttp.ClientPayloadError("Response payload is not completed")
+
+
+@pytest.mark.asyncio
+async def test_retry_dropped_body(client_session: ClientSession, asyncio_sleep: AsyncMock):
+    breaker = GitHubCircuitBreaker(failure_threshold=5)
+    async with GitHubAPI(
+        TOKEN,
+        session=client_session,
+        **{
+            GitHubClientKwarg.RETRY_POLICY: GitHubRetryPolicy(max_attempts=3),
+            GitHubClientKwarg.CIRCUIT_BREAKER: breaker,
+        },
+    ) as github:
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[DroppedBodyResponse(), MockResponse()],
+        ) as request:
+            response = await github.generic("/generic")
+            assert response.status == 200
+            assert request.call_count == 2
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=lambda **_: DroppedBodyResponse(),
+        ) as request:
+            with pytest.raises(GitHubConnectionException):
+                await github.generic("/generic")
+            assert request.call_count == 3
+        assert breaker.circuit("/generic").failures == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_status(client_session: ClientSession, asyncio_sleep: AsyncMock):
+    async with GitHubAPI(
+        TOKEN,
+        session=client_session,
+        **{GitHubClientKwarg.RETRY_POLICY: GitHubRetryPolicy(max_attempts=3)},
+    ) as github:
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[MockResponse(mock_status=502), MockResponse()],
+        ) as request:
+            response = await github.generic("/generic")
+            assert response.status == 200
+            assert request.call_count == 2
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[
+                MockResponse(
+                    mock_status=403,
+                    mock_headers={**HEADERS_RATELIMITED, "Retry-After": "10"},
+                    mock_data={"message": "API rate limit exceeded"},
+                ),
+                MockResponse(),
+            ],
+        ) as request:
+            response = await github.generic("/generic")
+            assert response.status == 200
+            assert request.call_count == 2
+            assert asyncio_sleep.call_args[0][0] == 10
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[
+                MockResponse(
+                    mock_status=403,
+                    mock_headers={
+                        **HEADERS_RATELIMITED,
+                        "X-RateLimit-Reset": str(int(time.time()) + 3600),
+                    },
+                    mock_data={"message": "API rate limit exceeded"},
+                ),
+            ],
+        ) as request:
+            with pytest.raises(GitHubRatelimitException):
+                await github.generic("/generic")
+            assert request.call_count == 1
+
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[MockResponse(mock_status=502, mock_headers=HEADERS)] * 3,
+        ) as request:
+            response = await github.generic("/generic")
+            assert response.status == 502
+            assert request.call_count == 3
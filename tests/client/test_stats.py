@@ -0,0 +1,127 @@
+"""Test client statistics"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubNotFoundException, GitHubNotModifiedException
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg
+from aiogithubapi.ratelimit import GitHubRateLimitScheduler
+from aiogithubapi.retry import GitHubRetryPolicy
+from aiogithubapi.stats import GitHubClientStats, GitHubLatencyHistogram
+
+from tests.common import TEST_REPOSITORY_NAME, TOKEN, MockResponse
+
+
+def test_latency_histogram():
+    histogram = GitHubLatencyHistogram(buckets=(0.1, 1))
+    assert histogram.mean == 0
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(5.65 / 4)
+
+    copy = histogram.copy()
+    histogram.observe(0.5)
+    assert copy.counts == [2, 1, 1]
+
+    with pytest.raises(ValueError):
+        with histogram.measure():
+            raise ValueError
+    assert histogram.count == 5
+    with histogram.measure():
+        pass
+    assert histogram.count == 6
+
+
+@pytest.mark.asyncio
+async def test_client_stats(
+    client_session: ClientSession,
+    mock_response: MockResponse,
+    asyncio_sleep: AsyncMock,
+):
+    async with GitHubAPI(
+        TOKEN,
+        session=client_session,
+        **{GitHubClientKwarg.RETRY_POLICY: GitHubRetryPolicy(max_attempts=2)},
+    ) as github:
+        mock_response.mock_content = b"12345"
+        await github.repos.get(TEST_REPOSITORY_NAME)
+        await github.repos.get("octocat/other")
+
+        mock_response.mock_status = 304
+        with pytest.raises(GitHubNotModifiedException):
+            await github.repos.get(TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.ETAG: "etag"})
+
+        mock_response.mock_status = 404
+        mock_response.mock_data = {"message": "Not Found"}
+        with pytest.raises(GitHubNotFoundException):
+            await github.generic("/generic")
+
+        mock_response.clear()
+        with patch(
+            "aiohttp.ClientSession.request",
+            new_callable=AsyncMock,
+            side_effect=[MockResponse(mock_status=502), MockResponse()],
+        ):
+            await github.generic("/generic")
+
+        stats = github.stats()
+        assert stats.requests == {
+            "/repos/{repository}": {200: 2, 304: 1},
+            "/generic": {404: 1, 502: 1, 200: 1},
+        }
+        assert stats.bytes_received == 20
+        assert stats.not_modified == 1
+        assert stats.retries == 1
+        assert stats.exceptions == {"GitHubNotModifiedException": 1, "GitHubNotFoundException": 1}
+        # The body of the retried response is received too
+        assert stats.network_time.count == 6
+        assert stats.decode_time.count == 5
+        assert stats.model_time.count == 2
+
+        await github.generic("/generic")
+        assert stats.requests["/generic"][200] == 1
+        assert github.stats().requests["/generic"][200] == 2
+
+        github.reset_stats()
+        assert github.stats() == GitHubClientStats()
+
+
+@pytest.mark.asyncio
+async def test_client_stats_lazy_data(
+    client_session: ClientSession,
+    mock_response: MockResponse,
+):
+    async with GitHubAPI(TOKEN, session=client_session) as github:
+        mock_response.mock_content = b'{"name": "Hello-World"}'
+        response = await github.repos.get(
+            TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.LAZY_DATA: True}
+        )
+        assert github.stats().decode_time.count == 0
+        assert github.stats().model_time.count == 0
+
+        assert response.data.name == "Hello-World"
+        assert github.stats().decode_time.count == 1
+        assert github.stats().model_time.count == 1
+
+
+@pytest.mark.asyncio
+async def test_client_stats_network_time_without_budget_wait(client_session: ClientSession):
+    scheduler = GitHubRateLimitScheduler()
+
+    async def _acquire(*_):
+        await asyncio.sleep(0.2)
+
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.RATE_LIMIT_SCHEDULER: scheduler}
+    ) as github:
+        with patch.object(scheduler, "async_acquire", side_effect=_acquire):
+            await github.generic("/generic")
+
+        stats = github.stats()
+        assert stats.network_time.count == 1
+        assert stats.network_time.total < 0.1
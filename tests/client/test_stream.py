@@ -0,0 +1,77 @@
+"""Test streaming responses"""
+# pylint: disable=missing-docstring,protected-access
+from unittest.mock import MagicMock
+
+import aiohttp
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import (
+    GitHubAPI,
+    GitHubConnectionException,
+    GitHubException,
+    GitHubNotFoundException,
+)
+
+from tests.common import TOKEN, MockedRequests, MockResponse
+
+
+@pytest.mark.asyncio
+async def test_stream_api(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    mock_response.release = release = MagicMock()
+    mock_response.mock_content = b"abcdef"
+    async with GitHubAPI(TOKEN, session=client_session) as github:
+        assert [
+            chunk async for chunk in github._client.async_stream_api("/generic", chunk_size=4)
+        ] == [b"abcd", b"ef"]
+        assert isinstance(mock_requests.last_request["timeout"], aiohttp.ClientTimeout)
+        assert mock_requests.last_request["timeout"].total is None
+        assert mock_requests.last_request["timeout"].sock_read == 20
+        assert mock_requests.last_request["timeout"].sock_connect == 20
+        assert mock_requests.last_request["timeout"].total is None
+        release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_api_errors(
+    client_session: ClientSession,
+    mock_response: MockResponse,
+):
+    async with GitHubAPI(TOKEN, session=client_session) as github:
+        mock_response.mock_status = 404
+        mock_response.mock_data = {"message": "Not Found"}
+        with pytest.raises(GitHubNotFoundException):
+            async for _ in github._client.async_stream_api("/generic"):
+                pass
+
+        mock_response.mock_status = 502
+        mock_response.mock_data = {}
+        with pytest.raises(GitHubException, match="Unexpected status 502"):
+            async for _ in github._client.async_stream_api("/generic"):
+                pass
+
+        mock_response.clear()
+        mock_response.mock_content = b"abcdef"
+        mock_response.mock_content_raises = aiohttp.ClientPayloadError("broken")
+        with pytest.raises(GitHubConnectionException):
+            async for _ in github._client.async_stream_api("/generic"):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_download_api_removes_partial_file(
+    client_session: ClientSession,
+    mock_response: MockResponse,
+    tmp_path,
+):
+    mock_response.mock_content = b"abcdef"
+    mock_response.mock_content_raises = aiohttp.ClientPayloadError("broken")
+    destination = tmp_path / "archive.tar.gz"
+    async with GitHubAPI(TOKEN, session=client_session) as github:
+        with pytest.raises(GitHubConnectionException):
+            await github._client.async_download_api("/generic", destination, chunk_size=2)
+    assert not destination.exists()
@@ -0,0 +1,95 @@
+"""Test token pool"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubException, GitHubResponseHeadersModel
+from aiogithubapi.const import GitHubClientKwarg
+from aiogithubapi.ratelimit import GitHubTokenPool
+
+from tests.common import HEADERS, MockedRequests, MockResponse
+
+
+def _headers(remaining: int, reset: float) -> GitHubResponseHeadersModel:
+    return GitHubResponseHeadersModel(
+        {
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+            "X-RateLimit-Resource": "core",
+        }
+    )
+
+
+def test_token_pool_needs_tokens():
+    with pytest.raises(GitHubException):
+        GitHubTokenPool([])
+
+
+@pytest.mark.asyncio
+async def test_token_pool_rotation(asyncio_sleep: AsyncMock):
+    pool = GitHubTokenPool(["a", "b", "c"])
+
+    tokens = [await pool.async_acquire("core") for _ in range(3)]
+    assert sorted(tokens) == ["a", "b", "c"]
+    for token in tokens:
+        pool.release(token, "core")
+
+    reset = time.time() + 100
+    pool.update("a", "core", _headers(100, reset))
+    pool.update("b", "core", _headers(500, reset))
+    pool.update("c", "core", _headers(0, reset))
+    assert await pool.async_acquire("core") == "b"
+    pool.release("b", "core")
+
+    pool.update("b", "core", _headers(0, reset))
+    assert await pool.async_acquire("core") == "a"
+    pool.release("a", "core")
+
+    assert await pool.async_acquire("search") in ("a", "b", "c")
+    asyncio_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_token_pool_parks_exhausted_tokens(asyncio_sleep: AsyncMock):
+    pool = GitHubTokenPool(["a", "b"])
+    pool.update("a", "core", _headers(0, time.time() + 100))
+    pool.update("b", "core", _headers(0, time.time() + 200))
+
+    assert await pool.async_acquire("core") == "a"
+    asyncio_sleep.assert_called_once()
+    assert 99 < asyncio_sleep.call_args[0][0] <= 101
+    assert pool.state("b", "core").remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_client_with_token_pool(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    pool = GitHubTokenPool(["a", "b"])
+    async with GitHubAPI(
+        "base", session=client_session, **{GitHubClientKwarg.TOKEN_POOL: pool}
+    ) as github:
+        mock_response.mock_headers = {**HEADERS, "X-RateLimit-Reset": str(time.time() + 100)}
+        await asyncio.gather(github.generic("/generic"), github.generic("/generic"))
+        assert mock_requests._calls[0]["headers"]["Authorization"] == "token a"
+        assert mock_requests._calls[1]["headers"]["Authorization"] == "token b"
+        assert pool.state("a", "core").remaining == 4999
+        assert pool.state("a", "core").inflight == 0
+
+        mock_response.mock_headers = {
+            **HEADERS,
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": str(time.time() + 100),
+        }
+        await github.generic("/generic")
+        assert mock_requests.last_request["headers"]["Authorization"] == "token a"
+        assert pool.state("a", "core").remaining == 10
+
+        await github.generic("/generic")
+        assert mock_requests.last_request["headers"]["Authorization"] == "token b"
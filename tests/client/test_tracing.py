@@ -0,0 +1,81 @@
+"""Test request tracing"""
+# pylint: disable=missing-docstring,protected-access
+from unittest.mock import MagicMock
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubNotFoundException
+from aiogithubapi.const import GitHubClientKwarg
+from aiogithubapi.tracing import GitHubRequestTiming, GitHubRequestTracer
+
+from tests.common import TEST_REPOSITORY_NAME, TOKEN
+
+
+async def _repository(request: web.Request) -> web.Response:
+    if request.match_info["repo"] == "missing":
+        return web.json_response({"message": "Not Found"}, status=404)
+    return web.json_response({"full_name": "octocat/hello-world"}, headers={"ETag": '"abc"'})
+
+
+@pytest.mark.asyncio
+async def test_request_tracer():
+    app = web.Application()
+    app.router.add_get("/repos/{owner}/{repo}", _repository)
+    timings: list[GitHubRequestTiming] = []
+    tracer = GitHubRequestTracer([timings.append])
+
+    async with TestServer(app) as server:
+        async with GitHubAPI(
+            TOKEN,
+            **{
+                GitHubClientKwarg.BASE_URL: str(server.make_url("")).rstrip("/"),
+                GitHubClientKwarg.REQUEST_TRACER: tracer,
+            },
+        ) as github:
+            await github.repos.get(TEST_REPOSITORY_NAME)
+            await github.repos.get(TEST_REPOSITORY_NAME)
+            with pytest.raises(GitHubNotFoundException):
+                await github.repos.get("octocat/missing")
+
+    assert len(timings) == 3
+    first, second, missing = timings
+    assert first.method == "GET"
+    assert first.route == "/repos/{repository}"
+    assert first.url.endswith("/repos/octocat/hello-world")
+    assert first.status == 200
+    assert not first.reused_connection
+    assert first.connect is not None
+    assert first.ttfb is not None
+    assert first.transfer is not None
+    assert first.bytes_received == len(b'{"full_name": "octocat/hello-world"}')
+    assert first.total >= first.ttfb
+    assert second.reused_connection
+    assert second.connect is None
+    assert missing.status == 404
+
+
+@pytest.mark.asyncio
+async def test_request_tracer_connection_error():
+    hook = MagicMock(side_effect=Exception("broken hook"))
+    timings: list[GitHubRequestTiming] = []
+    tracer = GitHubRequestTracer([hook, timings.append])
+    async with aiohttp.ClientSession(trace_configs=[tracer.trace_config]) as session:
+        async with GitHubAPI(
+            TOKEN,
+            session=session,
+            **{
+                GitHubClientKwarg.BASE_URL: "http://127.0.0.1:1",
+                GitHubClientKwarg.REQUEST_TRACER: tracer,
+            },
+        ) as github:
+            with pytest.raises(Exception):
+                await github.generic("/generic")
+
+    hook.assert_called_once()
+    assert len(timings) == 1
+    assert timings[0].route == "/generic"
+    assert timings[0].status is None
+    assert timings[0].exception is not None
@@ -0,0 +1,138 @@
+"""Test record and replay transport"""
+# pylint: disable=missing-docstring,protected-access
+import json
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubException, GitHubNotModifiedException
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg
+from aiogithubapi.transport import (
+    GitHubCassette,
+    GitHubCassetteMatch,
+    GitHubCassetteMode,
+    GitHubCassetteTransport,
+)
+
+from tests.common import TEST_REPOSITORY_NAME, TOKEN
+
+TARBALL = b"\x1f\x8b\x00\xff"
+
+
+async def _repository(request: web.Request) -> web.Response:
+    if request.headers.get("If-None-Match") == '"abc"':
+        return web.Response(status=304)
+    name = request.match_info["repo"]
+    return web.json_response(
+        {"full_name": f"octocat/{name}"}, headers={"ETag": '"abc"', "X-RateLimit-Remaining": "42"}
+    )
+
+
+async def _tarball(_: web.Request) -> web.Response:
+    return web.Response(body=TARBALL, content_type="application/x-gzip")
+
+
+async def _record(path) -> str:
+    app = web.Application()
+    app.router.add_get("/repos/{owner}/{repo}", _repository)
+    app.router.add_get("/repos/{owner}/{repo}/tarball/{ref}", _tarball)
+    cassette = GitHubCassette(path)
+    transport = GitHubCassetteTransport(cassette, GitHubCassetteMode.RECORD)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with GitHubAPI(
+            TOKEN,
+            **{GitHubClientKwarg.BASE_URL: base_url, GitHubClientKwarg.TRANSPORT: transport},
+        ) as github:
+            await github.repos.get(TEST_REPOSITORY_NAME)
+            await github.repos.get("octocat/other")
+            with pytest.raises(GitHubNotModifiedException):
+                await github.repos.get(TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.ETAG: '"abc"'})
+            chunks = [
+                chunk async for chunk in github.repos.stream_tarball(TEST_REPOSITORY_NAME, ref="main")
+            ]
+            assert b"".join(chunks) == TARBALL
+
+    cassette.save()
+    return base_url
+
+
+@pytest.mark.asyncio
+async def test_record(tmp_path):
+    path = tmp_path / "cassette.json"
+    await _record(path)
+
+    with open(path, encoding="utf-8") as file:
+        content = json.load(file)
+    assert content["version"] == 1
+    interactions = content["interactions"]
+    assert [interaction["status"] for interaction in interactions] == [200, 200, 304, 200]
+    assert interactions[0]["method"] == "GET"
+    assert interactions[0]["response_body"] == '{"full_name": "octocat/hello-world"}'
+    assert ["X-RateLimit-Remaining", "42"] in interactions[0]["headers"]
+    assert interactions[0]["latency"] > 0
+    assert interactions[2]["request_headers"]["If-None-Match"] == '"abc"'
+    assert interactions[3]["response_body_base64"]
+    assert all("Authorization" not in interaction["request_headers"] for interaction in interactions)
+
+
+@pytest.mark.asyncio
+async def test_replay_unordered(tmp_path):
+    path = tmp_path / "cassette.json"
+    base_url = await _record(path)
+    transport = GitHubCassetteTransport(GitHubCassette(path))
+
+    async with GitHubAPI(
+        TOKEN, **{GitHubClientKwarg.BASE_URL: base_url, GitHubClientKwarg.TRANSPORT: transport}
+    ) as github:
+        chunks = [
+            chunk async for chunk in github.repos.stream_tarball(TEST_REPOSITORY_NAME, ref="main")
+        ]
+        assert b"".join(chunks) == TARBALL
+        with pytest.raises(GitHubNotModifiedException):
+            await github.repos.get(TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.ETAG: '"abc"'})
+        other = await github.repos.get("octocat/other")
+        assert other.data.full_name == "octocat/other"
+        response = await github.repos.get(TEST_REPOSITORY_NAME)
+        assert response.data.full_name == "octocat/hello-world"
+        assert response.etag == '"abc"'
+        assert response.headers.x_ratelimit_remaining == "42"
+
+        # Every interaction is used once
+        with pytest.raises(GitHubException, match="No recorded response"):
+            await github.repos.get(TEST_REPOSITORY_NAME)
+
+        transport.rewind()
+        response = await github.repos.get(TEST_REPOSITORY_NAME)
+        assert response.data.full_name == "octocat/hello-world"
+
+
+@pytest.mark.asyncio
+async def test_replay_ordered_with_latency(tmp_path):
+    path = tmp_path / "cassette.json"
+    base_url = await _record(path)
+    cassette = GitHubCassette(path)
+    transport = GitHubCassetteTransport(
+        cassette, match=GitHubCassetteMatch.ORDERED, latency_scale=2
+    )
+
+    async with GitHubAPI(
+        TOKEN, **{GitHubClientKwarg.BASE_URL: base_url, GitHubClientKwarg.TRANSPORT: transport}
+    ) as github:
+        with patch("aiogithubapi.transport.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await github.repos.get(TEST_REPOSITORY_NAME)
+            sleep.assert_awaited_once_with(cassette.interactions[0].latency * 2)
+
+            with pytest.raises(GitHubException, match="No recorded response"):
+                await github.repos.get(TEST_REPOSITORY_NAME, **{GitHubRequestKwarg.ETAG: '"abc"'})
+            await github.repos.get("octocat/other")
+
+
+def test_cassette_version(tmp_path):
+    path = tmp_path / "cassette.json"
+    path.write_text(json.dumps({"version": 0, "interactions": []}), encoding="utf-8")
+    with pytest.raises(GitHubException, match="Unsupported cassette version"):
+        GitHubCassette(path)
@@ -0,0 +1,132 @@
+"""Test write lane"""
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from aiohttp import ClientSession
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubRatelimitException
+from aiogithubapi.client import MESSAGE_EXCEPTIONS
+from aiogithubapi.const import GitHubClientKwarg, GitHubRequestKwarg, HttpMethod
+from aiogithubapi.ratelimit import GitHubTokenPool, GitHubWriteLane
+
+from tests.common import HEADERS, TOKEN, MockedRequests, MockResponse
+
+SECONDARY_RATE_LIMIT_MESSAGE = next(
+    message for message in MESSAGE_EXCEPTIONS if "secondary rate limit" in message
+)
+
+
+@pytest.mark.asyncio
+async def test_write_lane_gap(asyncio_sleep: AsyncMock):
+    lane = GitHubWriteLane(min_interval=1)
+    async with lane.async_slot(TOKEN):
+        pass
+    asyncio_sleep.assert_not_called()
+
+    async with lane.async_slot(TOKEN):
+        pass
+    asyncio_sleep.assert_called_once()
+    assert 0 < asyncio_sleep.call_args[0][0] <= 1
+
+    async with lane.async_slot("other"):
+        pass
+    asyncio_sleep.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_write_lane_backoff(asyncio_sleep: AsyncMock):
+    lane = GitHubWriteLane(min_interval=0, backoff=60, backoff_max=100)
+    lane.secondary_rate_limited(TOKEN)
+    assert lane.state(TOKEN).penalty == 60
+    lane.secondary_rate_limited(TOKEN)
+    assert lane.state(TOKEN).penalty == 100
+    lane.secondary_rate_limited(TOKEN, retry_after=30)
+    assert lane.state(TOKEN).penalty == 30
+
+    async with lane.async_slot(TOKEN):
+        pass
+    assert 29 < asyncio_sleep.call_args[0][0] <= 30
+
+    lane.succeeded(TOKEN)
+    assert lane.state(TOKEN).penalty == 0
+
+
+@pytest.mark.asyncio
+async def test_client_with_write_lane(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+    asyncio_sleep: AsyncMock,
+):
+    lane = GitHubWriteLane(min_interval=1)
+    async with GitHubAPI(
+        TOKEN, session=client_session, **{GitHubClientKwarg.WRITE_LANE: lane}
+    ) as github:
+        await asyncio.gather(
+            github.generic("/generic"),
+            github.generic("/generic"),
+        )
+        asyncio_sleep.assert_not_called()
+
+        await asyncio.gather(
+            github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST}),
+            github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.PATCH}),
+        )
+        assert mock_requests.called == 4
+        asyncio_sleep.assert_called_once()
+
+        mock_response.mock_status = 403
+        mock_response.mock_headers = {**HEADERS, "Retry-After": "120"}
+        mock_response.mock_data = {"message": SECONDARY_RATE_LIMIT_MESSAGE}
+        with pytest.raises(GitHubRatelimitException):
+            await github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST})
+        assert lane.state(TOKEN).penalty == 120
+
+        mock_response.clear()
+        await github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST})
+        assert 119 < asyncio_sleep.call_args[0][0] <= 120
+        assert lane.state(TOKEN).penalty == 0
+
+
+@pytest.mark.asyncio
+async def test_write_lane_with_token_pool(
+    client_session: ClientSession,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+    asyncio_sleep: AsyncMock,
+):
+    lane = GitHubWriteLane(min_interval=1)
+    pool = GitHubTokenPool(["a", "b"])
+    async with GitHubAPI(
+        "base",
+        session=client_session,
+        **{GitHubClientKwarg.WRITE_LANE: lane, GitHubClientKwarg.TOKEN_POOL: pool},
+    ) as github:
+        mock_response.mock_headers = {**HEADERS, "X-RateLimit-Reset": str(time.time() + 100)}
+        await asyncio.gather(
+            github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST}),
+            github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST}),
+        )
+        assert sorted(call["headers"]["Authorization"] for call in mock_requests._calls) == [
+            "token a",
+            "token b",
+        ]
+        asyncio_sleep.assert_not_called()
+        assert pool.state("a", "core").inflight == 0
+
+        mock_response.mock_status = 403
+        mock_response.mock_headers = {
+            **HEADERS,
+            "Retry-After": "120",
+            "X-RateLimit-Reset": str(time.time() + 100),
+        }
+        mock_response.mock_data = {"message": SECONDARY_RATE_LIMIT_MESSAGE}
+        with pytest.raises(GitHubRatelimitException):
+            await github.generic("/generic", **{GitHubRequestKwarg.METHOD: HttpMethod.POST})
+        token = mock_requests.last_request["headers"]["Authorization"].split()[1]
+        assert lane.state(token).penalty == 120
+        assert lane.state({"a": "b", "b": "a"}[token]).penalty == 0
+        assert lane.state(None).penalty == 0
@@ -64,6 +64,21 @@ TEXT_ENDPOINTS = (
 BYTES_ENDPOINT = ("tarball", "zipball")
 
 
+class MockStreamReader:
+    """Mock stream reader class."""
+
+    def __init__(self, data: bytes, raises: BaseException | None = None):
+        self._data = data
+        self._raises = raises
+
+    async def iter_chunked(self, size: int):
+        """iter_chunked."""
+        for start in range(0, len(self._data), size):
+            yield self._data[start : start + size]
+        if self._raises is not None:
+            raise self._raises
+
+
 @dataclass
 class MockResponse:
     """Mock response class."""
@@ -72,6 +87,8 @@ class MockResponse:
 
     throw_on_file_error = False
 
+    mock_content: bytes = b""
+    mock_content_raises: BaseException | None = None
     mock_data: Any | None = None
     mock_data_list: list[Any] | None = None
     mock_endpoint: str = ""
@@ -140,12 +157,22 @@ class MockResponse:
                 raise OSError(f"Missing fixture for {self.mock_endpoint}") from None
             return ""
 
+    @property
+    def content(self):
+        """content."""
+        return MockStreamReader(self.mock_content, self.mock_content_raises)
+
     async def read(self, **_):
         """read."""
-        return b""
+        return self.mock_content
+
+    def release(self):
+        """release."""
 
     def clear(self):
         """clear."""
+        self.mock_content = b""
+        self.mock_content_raises = None
         self.mock_data = None
         self.mock_endpoint = ""
         self.mock_headers = None
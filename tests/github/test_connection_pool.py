@@ -0,0 +1,66 @@
+"""Test connection pool configuration and warmup."""
+# pylint: disable=protected-access,missing-function-docstring
+from __future__ import annotations
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from aiogithubapi import GitHubAPI, GitHubClientKwarg, GitHubDeviceAPI
+
+from tests.common import CLIENT_ID, TOKEN
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_kwargs():
+    async with GitHubAPI(
+        TOKEN,
+        **{
+            GitHubClientKwarg.CONNECTION_LIMIT: 5,
+            GitHubClientKwarg.CONNECTION_LIMIT_PER_HOST: 2,
+            GitHubClientKwarg.KEEPALIVE_TIMEOUT: 60,
+            GitHubClientKwarg.DNS_CACHE_TTL: 300,
+        },
+    ) as github:
+        connector = github._session.connector
+        assert connector.limit == 5
+        assert connector.limit_per_host == 2
+        assert connector._keepalive_timeout == 60
+        assert connector._cached_hosts._ttl == 300
+
+    async with GitHubDeviceAPI(
+        client_id=CLIENT_ID, **{GitHubClientKwarg.CONNECTION_LIMIT: 3}
+    ) as device:
+        assert device._session.connector.limit == 3
+        assert device._session.connector.limit_per_host == 0
+
+
+@pytest.mark.asyncio
+async def test_warmup():
+    requests: list[web.Request] = []
+
+    async def _root(request: web.Request) -> web.Response:
+        requests.append(request)
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/", _root)
+
+    async with TestServer(app) as server:
+        async with GitHubAPI(
+            TOKEN,
+            **{
+                GitHubClientKwarg.BASE_URL: str(server.make_url("")).rstrip("/"),
+                GitHubClientKwarg.CONNECTION_LIMIT_PER_HOST: 2,
+            },
+        ) as github:
+            assert await github.warmup(3) == 3
+            assert len(requests) == 3
+            assert {request.method for request in requests} == {"HEAD"}
+            assert requests[0].headers["Authorization"] == f"token {TOKEN}"
+            # Limited by the connections per host, the idle connections are kept
+            (idle,) = github._session.connector._conns.values()
+            assert len(idle) == 2
+
+    async with GitHubAPI(**{GitHubClientKwarg.BASE_URL: "http://127.0.0.1:1"}) as github:
+        assert await github.warmup(2) == 0
@@ -0,0 +1,455 @@
+"""Test pagination of list endpoints."""
+# pylint: disable=protected-access,missing-function-docstring
+from __future__ import annotations
+
+import asyncio
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import pytest
+
+from aiogithubapi import (
+    GitHubAPI,
+    GitHubClientKwarg,
+    GitHubCommitModel,
+    GitHubException,
+    GitHubIssueModel,
+    GitHubRequestKwarg,
+)
+from aiogithubapi.fake_server import GitHubFakeServer
+from aiogithubapi.pagination import GitHubPageCache, GitHubPaginationCursor
+
+from tests.common import TEST_REPOSITORY_NAME, TOKEN
+
+
+@pytest.mark.asyncio
+async def test_paginate():
+    async with GitHubFakeServer() as server:
+        server.add_route(
+            f"/repos/{TEST_REPOSITORY_NAME}/issues",
+            [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(250)],
+        )
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            issues = [
+                issue
+                async for issue in github.paginate(github.repos.issues.list, TEST_REPOSITORY_NAME)
+            ]
+            assert len(issues) == 250
+            assert isinstance(issues[0], GitHubIssueModel)
+            assert [issue.number for issue in issues] == list(range(250))
+            # Three pages of 100
+            assert server.requests == 3
+
+            paginator = github.paginate(
+                github.repos.issues.list, TEST_REPOSITORY_NAME, per_page=50
+            )
+            pages = [response async for response in paginator.pages()]
+            assert [len(response.data) for response in pages] == [50] * 5
+            assert pages[-1].is_last_page
+
+
+@pytest.mark.asyncio
+async def test_paginate_max_items():
+    async with GitHubFakeServer() as server:
+        server.add_route("/generic", [{"id": idx} for idx in range(250)])
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            items = [item async for item in github.paginate(github.generic, "/generic", max_items=5)]
+            assert items == [{"id": idx} for idx in range(5)]
+            assert server.requests == 1
+
+            items = [
+                item
+                async for item in github.paginate(
+                    github.generic, "/generic", per_page=100, max_items=150
+                )
+            ]
+            assert len(items) == 150
+            assert server.requests == 3
+
+            async for item in github.paginate(github.generic, "/generic", per_page=10):
+                if item["id"] == 15:
+                    break
+            assert server.requests == 5
+
+            assert [item async for item in github.paginate(github.generic, "/generic", max_items=0)] == []
+            assert server.requests == 5
+
+
+@pytest.mark.asyncio
+async def test_paginate_page_arguments():
+    async with GitHubFakeServer(per_page=30) as server:
+        server.add_route(
+            f"/repos/{TEST_REPOSITORY_NAME}/commits",
+            [{"sha": str(idx), "commit": {"message": f"Commit {idx}"}} for idx in range(120)],
+        )
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            commits = [
+                commit
+                async for commit in github.paginate(
+                    github.repos.list_commits, TEST_REPOSITORY_NAME, per_page=50, sha="main"
+                )
+            ]
+            assert len(commits) == 120
+            assert isinstance(commits[0], GitHubCommitModel)
+            assert [commit.sha for commit in commits] == [str(idx) for idx in range(120)]
+            assert server.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_concurrency():
+    async with GitHubFakeServer() as server:
+        server.add_route("/generic", [{"id": idx} for idx in range(1000)])
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            in_flight = 0
+            max_in_flight = 0
+            delays = {"2": 0.05}
+
+            async def _generic(endpoint: str, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                try:
+                    await asyncio.sleep(delays.get(kwargs[GitHubRequestKwarg.PARAMS].get("page"), 0))
+                    return await github.generic(endpoint, **kwargs)
+                finally:
+                    in_flight -= 1
+
+            items = [
+                item async for item in github.paginate(_generic, "/generic", concurrency=4)
+            ]
+            assert items == [{"id": idx} for idx in range(1000)]
+            assert max_in_flight == 4
+            assert server.requests == 10
+
+            pages = [
+                response.page_number
+                async for response in github.paginate(
+                    _generic, "/generic", concurrency=4, ordered=False
+                ).pages()
+            ]
+            assert pages[0] == 1
+            assert pages.index(3) < pages.index(2)
+            assert sorted(pages) == list(range(1, 11))
+
+            # Only the pages needed for the items are requested
+            server.requests = 0
+            items = [
+                item
+                async for item in github.paginate(
+                    _generic, "/generic", concurrency=4, max_items=250
+                )
+            ]
+            assert len(items) == 250
+            assert server.requests == 3
+
+            # Pages that are no longer needed are cancelled
+            server.requests = 0
+            delays = {str(page): 0.05 for page in range(3, 11)}
+            async for item in github.paginate(_generic, "/generic", concurrency=4):
+                if item["id"] == 150:
+                    break
+            # The abandoned iterator is closed by the event loop
+            await asyncio.sleep(0.01)
+            assert in_flight == 0
+            assert server.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetch():
+    async with GitHubFakeServer() as server:
+        server.add_route("/generic", [{"id": idx} for idx in range(100)])
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            paginator = github.paginate(github.generic, "/generic", per_page=10, prefetch=2)
+            items = paginator.items()
+            assert await anext(items) == {"id": 0}
+            # Two pages are requested while the first page is consumed
+            await asyncio.sleep(0.05)
+            assert server.requests == 3
+
+            assert [await anext(items) for _ in range(10)][-1] == {"id": 10}
+            await asyncio.sleep(0.05)
+            assert server.requests == 4
+
+            # Nothing more is requested when the consumer stops
+            await items.aclose()
+            await asyncio.sleep(0.05)
+            assert server.requests == 4
+
+            assert [
+                item async for item in github.paginate(github.generic, "/generic", prefetch=3)
+            ] == [{"id": idx} for idx in range(100)]
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetch_exception():
+    async with GitHubFakeServer() as server:
+        server.add_route("/generic", [{"id": idx} for idx in range(20)])
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            items = []
+            with pytest.raises(GitHubException, match="Server Error"):
+                async for item in github.paginate(
+                    github.generic, "/generic", per_page=10, prefetch=1
+                ):
+                    items.append(item)
+                    server.error_rate = 1
+            assert len(items) == 10
+
+
+@pytest.mark.asyncio
+async def test_paginate_page_cache():
+    issues = [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(250)]
+    page_cache = GitHubPageCache()
+
+    async with GitHubFakeServer() as server:
+        server.add_route(f"/repos/{TEST_REPOSITORY_NAME}/issues", issues)
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+
+            async def _walk():
+                return [
+                    issue.title
+                    async for issue in github.paginate(
+                        github.repos.issues.list, TEST_REPOSITORY_NAME, page_cache=page_cache
+                    )
+                ]
+
+            titles = await _walk()
+            assert len(titles) == 250
+            assert page_cache.downloaded == 3
+            assert page_cache.not_modified == 0
+            assert len(page_cache) == 3
+            assert server.rate_limit().remaining == 4997
+
+            # Nothing changed, every page is answered with 304
+            assert await _walk() == titles
+            assert page_cache.downloaded == 3
+            assert page_cache.not_modified == 3
+            assert server.rate_limit().remaining == 4997
+
+            # Only the changed page is downloaded
+            issues[150] = {"id": 150, "number": 150, "title": "Changed"}
+            titles = await _walk()
+            assert titles[150] == "Changed"
+            assert page_cache.downloaded == 4
+            assert page_cache.not_modified == 5
+            assert server.rate_limit().remaining == 4996
+
+            # Other collections do not use the same pages
+            assert [
+                issue async for issue in github.paginate(
+                    github.generic, f"/repos/{TEST_REPOSITORY_NAME}/issues", page_cache=page_cache
+                )
+            ]
+            assert len(page_cache) == 6
+
+    page_cache.clear()
+    assert len(page_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_paginate_page_cache_collection_grows():
+    issues = [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(4)]
+    page_cache = GitHubPageCache()
+
+    async with GitHubFakeServer() as server:
+        server.add_route(f"/repos/{TEST_REPOSITORY_NAME}/issues", issues)
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+
+            async def _walk():
+                return [
+                    issue.number
+                    async for issue in github.paginate(
+                        github.repos.issues.list,
+                        TEST_REPOSITORY_NAME,
+                        per_page=2,
+                        page_cache=page_cache,
+                    )
+                ]
+
+            assert await _walk() == [0, 1, 2, 3]
+
+            # The last page is unchanged, but its Link header now has a next page
+            issues += [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in (4, 5)]
+            assert await _walk() == [0, 1, 2, 3, 4, 5]
+            assert page_cache.not_modified == 2
+            assert page_cache.downloaded == 3
+            assert server.rate_limit().remaining == 4997
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor():
+    issues = [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(250)]
+
+    async with GitHubFakeServer() as server:
+        server.add_route(f"/repos/{TEST_REPOSITORY_NAME}/issues", issues)
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            paginator = github.paginate(github.repos.issues.list, TEST_REPOSITORY_NAME)
+            assert paginator.cursor is None
+            seen = []
+            async for issue in paginator:
+                seen.append(issue.number)
+                if issue.number == 120:
+                    break
+            stored = json.dumps(paginator.cursor.as_dict())
+            assert paginator.cursor.offset == 21
+            assert paginator.cursor.last_id == 120
+
+            server.requests = 0
+            paginator = github.paginate(
+                github.repos.issues.list,
+                TEST_REPOSITORY_NAME,
+                cursor=GitHubPaginationCursor.from_dict(json.loads(stored)),
+            )
+            async for issue in paginator:
+                seen.append(issue.number)
+            assert seen == list(range(250))
+            # Resumed from the second page
+            assert server.requests == 2
+            assert paginator.cursor is None
+
+            # A new issue moves the items down a page before the crawl is resumed
+            paginator = github.paginate(
+                github.repos.issues.list, TEST_REPOSITORY_NAME, concurrency=2
+            )
+            seen = []
+            async for issue in paginator:
+                seen.append(issue.number)
+                if issue.number == 199:
+                    break
+            assert paginator.cursor.offset == 100
+            cursor = GitHubPaginationCursor.from_dict(paginator.cursor.as_dict())
+            issues.insert(0, {"id": 250, "number": 250, "title": "Issue 250"})
+
+            seen += [
+                issue.number
+                async for issue in github.paginate(
+                    github.repos.issues.list, TEST_REPOSITORY_NAME, cursor=cursor, prefetch=1
+                )
+            ]
+            assert seen == list(range(250))
+
+            # A removed issue moves the items up, the last yielded item is on the page before
+            del issues[:]
+            issues += [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(10)]
+            paginator = github.paginate(github.repos.issues.list, TEST_REPOSITORY_NAME, per_page=3)
+            seen = []
+            async for issue in paginator:
+                seen.append(issue.number)
+                if issue.number == 3:
+                    break
+            assert paginator.cursor.last_id == 3
+            cursor = GitHubPaginationCursor.from_dict(paginator.cursor.as_dict())
+            del issues[1]
+
+            seen += [
+                issue.number
+                async for issue in github.paginate(
+                    github.repos.issues.list, TEST_REPOSITORY_NAME, per_page=3, cursor=cursor
+                )
+            ]
+            assert seen == list(range(10))
+
+            # Removed issues move the last yielded item to the page before
+            del issues[:]
+            issues += [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(1, 10)]
+            paginator = github.paginate(github.repos.issues.list, TEST_REPOSITORY_NAME, per_page=3)
+            seen = []
+            async for issue in paginator:
+                seen.append(issue.number)
+                if issue.number == 4:
+                    break
+            cursor = GitHubPaginationCursor.from_dict(paginator.cursor.as_dict())
+            del issues[:2]
+
+            seen += [
+                issue.number
+                async for issue in github.paginate(
+                    github.repos.issues.list, TEST_REPOSITORY_NAME, per_page=3, cursor=cursor
+                )
+            ]
+            assert seen == list(range(1, 10))
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor_between_pages():
+    issues = [{"id": idx, "number": idx, "title": f"Issue {idx}"} for idx in range(9)]
+
+    async with GitHubFakeServer() as server:
+        server.add_route(f"/repos/{TEST_REPOSITORY_NAME}/issues", issues)
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            paginator = github.paginate(github.repos.issues.list, TEST_REPOSITORY_NAME, per_page=3)
+            seen = []
+            with pytest.raises(GitHubException, match="Server Error"):
+                async for issue in paginator:
+                    seen.append(issue.number)
+                    if issue.number == 2:
+                        # The request for the next page fails
+                        server.error_rate = 1
+            assert paginator.cursor.query == {"per_page": "3", "page": "2"}
+            assert paginator.cursor.last_id == 2
+
+            server.error_rate = 0
+            del issues[:2]
+            seen += [
+                issue.number
+                async for issue in github.paginate(
+                    github.repos.issues.list,
+                    TEST_REPOSITORY_NAME,
+                    per_page=3,
+                    cursor=paginator.cursor,
+                )
+            ]
+            assert seen == list(range(9))
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor_unordered():
+    async with GitHubAPI(TOKEN) as github:
+        with pytest.raises(GitHubException, match="not ordered"):
+            github.paginate(
+                github.generic,
+                "/generic",
+                concurrency=2,
+                ordered=False,
+                cursor=GitHubPaginationCursor(query={}),
+            )
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor_since():
+    async def _users(request: web.Request) -> web.Response:
+        since = int(request.query.get("since", 0))
+        users = [{"id": idx, "login": f"user{idx}"} for idx in range(since + 1, min(since + 11, 36))]
+        headers = {}
+        if users and users[-1]["id"] < 35:
+            headers["Link"] = f'<{request.url.with_query(since=users[-1]["id"])}>; rel="next"'
+        return web.json_response(users, headers=headers)
+
+    app = web.Application()
+    app.router.add_get("/users", _users)
+
+    async with TestServer(app) as server:
+        async with GitHubAPI(
+            TOKEN, **{GitHubClientKwarg.BASE_URL: str(server.make_url("")).rstrip("/")}
+        ) as github:
+            paginator = github.paginate(github.generic, "/users")
+            seen = [user["id"] async for user in paginator if user["id"] <= 10]
+            assert paginator.cursor is None
+            assert seen == list(range(1, 11))
+
+            paginator = github.paginate(github.generic, "/users", max_items=10)
+            seen = [user["id"] async for user in paginator]
+            assert paginator.cursor.query == {"per_page": "10"}
+            assert paginator.cursor.offset == 10
+
+            cursor = GitHubPaginationCursor.from_dict(paginator.cursor.as_dict())
+            paginator = github.paginate(github.generic, "/users", max_items=15, cursor=cursor)
+            seen += [user["id"] async for user in paginator]
+            assert seen == list(range(1, 26))
+            assert paginator.cursor.query == {"since": "20"}
+            assert paginator.cursor.offset == 5
+
+            paginator = github.paginate(github.generic, "/users", cursor=paginator.cursor)
+            seen += [user["id"] async for user in paginator]
+            assert seen == list(range(1, 36))
@@ -1,5 +1,7 @@
 """Test repos namespace."""
 # pylint: disable=missing-docstring
+from io import BytesIO
+
 import pytest
 
 from aiogithubapi import GitHubAPI, GitHubRepositoryModel
@@ -96,6 +98,55 @@ async def test_zipball(
     )
 
 
+@pytest.mark.asyncio
+async def test_stream_tarball(
+    github_api: GitHubAPI,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+):
+    mock_response.mock_headers = {**HEADERS, "content-type": HttpContentType.BASE_GZIP}
+    mock_response.mock_content = b"0123456789"
+    chunks = [
+        chunk
+        async for chunk in github_api.repos.stream_tarball("octocat/hello-world", chunk_size=4)
+    ]
+    assert chunks == [b"0123", b"4567", b"89"]
+    assert mock_requests.called == 1
+    assert (
+        mock_requests.last_request["url"]
+        == "https://api.github.com/repos/octocat/hello-world/tarball/"
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_zipball(
+    github_api: GitHubAPI,
+    mock_requests: MockedRequests,
+    mock_response: MockResponse,
+    tmp_path,
+):
+    mock_response.mock_headers = {**HEADERS, "content-type": HttpContentType.BASE_ZIP}
+    mock_response.mock_content = b"0123456789"
+
+    destination = tmp_path / "archive.zip"
+    assert await github_api.repos.download_zipball("octocat/hello-world", destination) == 10
+    assert destination.read_bytes() == b"0123456789"
+
+    file = BytesIO()
+    assert (
+        await github_api.repos.download_zipball(
+            "octocat/hello-world", file, ref="main", chunk_size=3
+        )
+        == 10
+    )
+    assert file.getvalue() == b"0123456789"
+    assert mock_requests.called == 2
+    assert (
+        mock_requests.last_request["url"]
+        == "https://api.github.com/repos/octocat/hello-world/zipball/main"
+    )
+
+
 @pytest.mark.asyncio
 async def test_readme(
     github_api: GitHubAPI,
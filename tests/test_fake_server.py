@@ -0,0 +1,105 @@
+"""Test the fake GitHub API server."""
+# pylint: disable=protected-access,missing-function-docstring
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiogithubapi import (
+    GitHubAPI,
+    GitHubClientKwarg,
+    GitHubException,
+    GitHubNotModifiedException,
+    GitHubRatelimitException,
+)
+from aiogithubapi.fake_server import GitHubFakeServer
+
+from tests.common import TEST_REPOSITORY_NAME, TOKEN
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.mark.asyncio
+async def test_fixtures():
+    async with GitHubFakeServer(FIXTURES) as server:
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            repository = await github.repos.get(TEST_REPOSITORY_NAME)
+            assert repository.data.full_name == "octocat/Hello-World"
+            assert repository.headers.x_ratelimit_remaining == "4999"
+            assert repository.headers.x_ratelimit_resource == "core"
+
+            zen = await github.zen()
+            assert zen.data == "Beautiful is better than ugly."
+
+            events = await github.generic(f"/repos/{TEST_REPOSITORY_NAME}/events")
+            assert events.headers.x_poll_interval == "60"
+
+            with pytest.raises(GitHubException, match="Not Found"):
+                await github.repos.get("octocat/missing")
+
+        assert server.requests == 4
+    with pytest.raises(GitHubException, match="not started"):
+        server.url
+
+
+@pytest.mark.asyncio
+async def test_pagination():
+    async with GitHubFakeServer(per_page=2) as server:
+        server.add_route("/repos/octocat/hello-world/issues", [{"id": idx} for idx in range(5)])
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            response = await github.generic("/repos/octocat/hello-world/issues")
+            assert response.data == [{"id": 0}, {"id": 1}]
+            assert response.pages == {"next": 2, "last": 3}
+
+            response = await github.generic(
+                "/repos/octocat/hello-world/issues", params={"page": 3}
+            )
+            assert response.data == [{"id": 4}]
+            assert response.pages == {"prev": 2, "first": 1}
+            assert response.is_last_page
+
+            response = await github.generic(
+                "/repos/octocat/hello-world/issues", params={"per_page": 100}
+            )
+            assert len(response.data) == 5
+            assert response.headers.link is None
+
+
+@pytest.mark.asyncio
+async def test_etag_and_rate_limit():
+    async with GitHubFakeServer(rate_limits={"core": 2}) as server:
+        server.add_route("/user", {"login": "octocat"})
+        async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+            response = await github.generic("/user")
+            assert response.etag.startswith('W/"')
+            assert server.rate_limit().remaining == 1
+
+            with pytest.raises(GitHubNotModifiedException):
+                await github.generic("/user", etag=response.etag)
+            assert server.rate_limit().remaining == 1
+
+            server.add_route("/user", {"login": "octocat", "name": "The Octocat"})
+            changed = await github.generic("/user", etag=response.etag)
+            assert changed.data["name"] == "The Octocat"
+            assert changed.etag != response.etag
+
+            with pytest.raises(GitHubRatelimitException):
+                await github.generic("/user")
+
+
+@pytest.mark.asyncio
+async def test_latency_and_errors():
+    async with GitHubFakeServer(latency=0.01, error_rate=0.5, seed=1) as server:
+        server.add_route("/user", {"login": "octocat"})
+        with patch("aiogithubapi.fake_server.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            async with GitHubAPI(TOKEN, **{GitHubClientKwarg.BASE_URL: server.url}) as github:
+                statuses = []
+                for _ in range(20):
+                    try:
+                        statuses.append((await github.generic("/user")).status)
+                    except GitHubException:
+                        statuses.append(502)
+        assert sleep.await_count == 20
+        sleep.assert_awaited_with(0.01)
+        assert 0 < statuses.count(502) < 20
+        assert server.rate_limit().remaining == 5000 - statuses.count(200)
@@ -0,0 +1,47 @@
+"""Test route templates."""
+from types import MappingProxyType
+
+import pytest
+
+from aiogithubapi.client import GitHubClient
+from aiogithubapi.namespaces.contents import CONTENTS_PATH_ROUTE, CONTENTS_ROUTE
+from aiogithubapi.namespaces.issues import ISSUE_ROUTE
+from aiogithubapi.routes import GitHubEndpoint, GitHubRoute, route_template
+
+from tests.common import TOKEN
+
+
+def test_route_format():
+    """Test formatting a route."""
+    route = GitHubRoute("/repos/{repository}/issues/{issue_number}")
+    endpoint = route.format(repository="octocat/hello-world", issue_number=1)
+    assert endpoint == "/repos/octocat/hello-world/issues/1"
+    assert isinstance(endpoint, GitHubEndpoint)
+    assert endpoint.template == "/repos/{repository}/issues/{issue_number}"
+    assert route(repository="octocat/hello-world", issue_number=1) == endpoint
+    assert repr(route) == "GitHubRoute('/repos/{repository}/issues/{issue_number}')"
+
+    assert GitHubRoute("/user").format() == "/user"
+    with pytest.raises(KeyError):
+        route.format(repository="octocat/hello-world")
+
+
+def test_route_template():
+    """Test getting the route template of an endpoint."""
+    assert route_template("/user") == "/user"
+    assert route_template(GitHubEndpoint("/user")) == "/user"
+    assert route_template(ISSUE_ROUTE(repository="octocat/hello-world", issue_number=1)) == (
+        "/repos/{repository}/issues/{issue_number}"
+    )
+    assert route_template(CONTENTS_ROUTE(repository="octocat/hello-world")) != route_template(
+        CONTENTS_PATH_ROUTE(repository="octocat/hello-world", path="README.md")
+    )
+
+
+@pytest.mark.asyncio
+async def test_base_headers_are_computed_once(client_session):
+    """Test that the base request headers are only computed once."""
+    client = GitHubClient(session=client_session, token=TOKEN)
+    headers = client._base_request_data.headers  # pylint: disable=protected-access
+    assert isinstance(headers, MappingProxyType)
+    assert client._base_request_data.headers is headers  # pylint: disable=protected-access